@@ -5,9 +5,12 @@ import logging
 import sys
 import os
 import psutil
+import mysql.connector
 from datetime import datetime
 from news_scraper import analyze_section
-from db import save_article, get_db_connection
+from crawl_scheduler import close_crawl_session
+from runtime_config import configure_event_loop
+from db import save_article, get_db_connection, load_known_urls, db_pool_stats
 from db_cleanup import update_missing_sentiment_scores, remove_duplicate_articles, check_data_integrity
 
 # 로깅 설정
@@ -21,10 +24,14 @@ logging.basicConfig(
 )
 
 class ArticleScraper:
-    def __init__(self):
+    def __init__(self, summary_profile="quality", summary_deadline=None):
         self.sections = ["정치", "경제", "사회", "생활", "세계", "IT"]
         self.max_retries = 3
         self.retry_delay = 300  # 5분
+        self.max_articles_per_run = 300  # 증분 크롤링 시 섹션별 한 번에 처리할 최대 기사 수
+        # 백그라운드 크롤링은 기본적으로 고품질 요약, summary_deadline(초)을 넘기면 더 가벼운 프로파일로 대체
+        self.summary_profile = summary_profile
+        self.summary_deadline = summary_deadline
         self.last_successful_run = None
         self.total_articles_processed = 0
         self.total_errors = 0
@@ -33,11 +40,13 @@ class ArticleScraper:
         """서비스 상태 확인"""
         try:
             # 데이터베이스 연결 확인
-            conn = get_db_connection()
-            cursor = conn.cursor()
-            cursor.execute("SELECT 1")
-            cursor.close()
-            conn.close()
+            with get_db_connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.execute("SELECT 1")
+                    cursor.fetchall()
+                finally:
+                    cursor.close()
 
             # 메모리 사용량 확인
             process = psutil.Process(os.getpid())
@@ -50,6 +59,7 @@ class ArticleScraper:
             logging.info(f"총 처리 기사 수: {self.total_articles_processed}")
             logging.info(f"총 오류 수: {self.total_errors}")
             logging.info(f"메모리 사용량: {memory_usage:.2f} MB")
+            logging.info(f"DB 커넥션 풀: {db_pool_stats()}")
             
             return True
         except Exception as e:
@@ -76,33 +86,48 @@ class ArticleScraper:
             logging.error(f"데이터베이스 정리 중 오류 발생: {str(e)}")
             return False
 
+    def persist_stage(self, section):
+        """분석 파이프라인의 마지막 단계로 기사를 바로 저장하는 함수를 만듭니다 (저장 실패 시 None)."""
+        async def persist(article):
+            try:
+                await asyncio.to_thread(
+                    save_article,
+                    section=section,
+                    title=article["제목"],
+                    content=article["본문"],
+                    url=article["URL"],
+                    summary=article["요약"],
+                    sentiment=article["감성 분석 결과"]["감정"],
+                    sentiment_score=article["감성 분석 결과"]["확률"]
+                )
+            except mysql.connector.IntegrityError:
+                # 다른 프로세스가 먼저 저장한 기사 (중복 URL)는 이미 저장된 것으로 본다
+                logging.info(f"이미 저장된 기사: {article['URL']}")
+                return article
+            except Exception as e:
+                # 저장하지 못한 기사는 파이프라인에서 빼서 증분 크롤링 커서가 넘어가지 않게 한다
+                self.total_errors += 1
+                logging.error(f"기사 저장 중 오류 발생: {str(e)}")
+                return None
+            self.total_articles_processed += 1
+            logging.info(f"기사 저장 성공: {article['제목'][:50]}... (감성 점수: {article['감성 분석 결과']['확률']:.2f})")
+            return article
+        return persist
+
     async def article_analysis(self, section):
         """특정 섹션의 기사를 크롤링하고, 요약 및 감성 분석 후 데이터베이스에 저장합니다."""
         for attempt in range(self.max_retries):
             try:
                 logging.info(f"{section} 섹션의 기사를 가져오는 중... (시도 {attempt + 1}/{self.max_retries})")
-                articles = await analyze_section(section)
+                # 기사는 분석이 끝나는 대로 파이프라인의 persist 단계에서 저장된다
+                articles = await analyze_section(
+                    section, count=self.max_articles_per_run, skip_known=True, incremental=True,
+                    persist=self.persist_stage(section), profile=self.summary_profile,
+                    deadline=self.summary_deadline
+                )
                 
                 if "error" not in articles:
-                    for article in articles:
-                        try:
-                            save_article(
-                                section=section,
-                                title=article["제목"],
-                                content=article["본문"],
-                                url=article["URL"],
-                                summary=article["요약"],
-                                sentiment=article["감성 분석 결과"]["감정"],
-                                sentiment_score=article["감성 분석 결과"]["확률"]
-                            )
-                            self.total_articles_processed += 1
-                            logging.info(f"기사 저장 성공: {article['제목'][:50]}... (감성 점수: {article['감성 분석 결과']['확률']:.2f})")
-                        except Exception as e:
-                            self.total_errors += 1
-                            logging.error(f"기사 저장 중 오류 발생: {str(e)}")
-                            continue
-                    
-                    logging.info(f"{section} 섹션에서 {len(articles)}개의 기사를 저장했습니다.")
+                    logging.info(f"{section} 섹션에서 {len(articles)}개의 기사를 처리했습니다.")
                     self.last_successful_run = datetime.now()
                     return True
                 else:
@@ -121,7 +146,13 @@ class ArticleScraper:
     async def run_scraping(self):
         """모든 섹션에 대해 크롤링 작업을 수행합니다."""
         tasks = [self.article_analysis(section) for section in self.sections]
-        results = await asyncio.gather(*tasks)
+        try:
+            results = await asyncio.gather(*tasks)
+        finally:
+            # 루프가 닫히기 전에 keep-alive 커넥션 풀과 스케줄러를 정리
+            crawl_stats = await close_crawl_session()
+            if crawl_stats:
+                logging.info(f"크롤링 스케줄러 지표: {crawl_stats}")
         success_rate = sum(results) / len(results)
         logging.info(f"크롤링 작업 완료. 성공률: {success_rate:.2%}")
 
@@ -135,6 +166,7 @@ class ArticleScraper:
 
             loop = asyncio.new_event_loop()
             asyncio.set_event_loop(loop)
+            configure_event_loop(loop)
             loop.run_until_complete(self.run_scraping())
             loop.close()
         except Exception as e:
@@ -142,6 +174,12 @@ class ArticleScraper:
 
 def main():
     scraper = ArticleScraper()
+
+    # 저장된 기사 URL로 Bloom 필터 적재 (이후 크롤링 때마다 새로 저장된 URL만 증분 갱신)
+    try:
+        logging.info(f"저장된 기사 URL {load_known_urls()}개를 필터에 적재했습니다.")
+    except Exception as e:
+        logging.error(f"기사 URL 필터 적재 중 오류 발생: {str(e)}")
     
     # 6시간마다 크롤링 작업을 스케줄링
     schedule.every(6).hours.do(scraper.job)
@@ -0,0 +1,85 @@
+### article_stats.py (/statistics 집계 테이블 재계산 / 검증)
+# 집계 테이블(article_section_stats, article_daily_stats)은 schema.sql의 트리거가 기사 저장/수정/삭제 시 갱신합니다.
+# 사용법 (트리거를 만든 뒤 실행):
+#   python article_stats.py --rebuild      # articles 전체에서 집계 테이블을 다시 계산 (기존 데이터 backfill)
+#   python article_stats.py --check        # 집계 테이블과 articles 직접 집계 결과 비교
+import argparse
+import logging
+import math
+from db import get_db_connection
+
+SECTION_AGGREGATE = """
+    SELECT section, COUNT(*) AS article_count, COUNT(sentiment_score) AS scored_count,
+           COALESCE(SUM(sentiment_score), 0) AS sentiment_sum
+    FROM articles GROUP BY section
+"""
+DAILY_AGGREGATE = """
+    SELECT DATE(created_at) AS stat_date, COUNT(*) AS article_count
+    FROM articles GROUP BY DATE(created_at)
+"""
+
+def rebuild_statistics():
+    """articles 전체를 한 번 집계하여 집계 테이블을 교체합니다 (한 트랜잭션)."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        # 집계 중 들어온 기사의 트리거는 이 트랜잭션이 끝날 때까지 집계 테이블 잠금을 기다린다
+        cursor.execute("DELETE FROM article_section_stats")
+        cursor.execute("DELETE FROM article_daily_stats")
+        cursor.execute("INSERT INTO article_section_stats (section, article_count, scored_count, sentiment_sum) "
+                       + SECTION_AGGREGATE)
+        sections = cursor.rowcount
+        cursor.execute("INSERT INTO article_daily_stats (stat_date, article_count) " + DAILY_AGGREGATE)
+        days = cursor.rowcount
+        conn.commit()
+        logging.info(f"집계 테이블 재계산 완료: 섹션 {sections}개, 날짜 {days}개")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        conn.close()
+
+def _same(expected, actual):
+    # sentiment_sum은 트리거가 더하고 빼며 누적한 값이라 부동소수점 오차를 허용
+    return (expected is not None and actual is not None and len(expected) == len(actual)
+            and all(math.isclose(e, a, abs_tol=1e-6) for e, a in zip(expected, actual)))
+
+def check_statistics():
+    """집계 테이블과 articles 직접 집계가 다른 섹션/날짜 목록을 반환합니다."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        mismatches = []
+        for aggregate, table, key in ((SECTION_AGGREGATE, "article_section_stats", "section"),
+                                      (DAILY_AGGREGATE, "article_daily_stats", "stat_date")):
+            cursor.execute(aggregate)
+            expected = {row[0]: tuple(float(v) for v in row[1:]) for row in cursor.fetchall()}
+            columns = "article_count, scored_count, sentiment_sum" if key == "section" else "article_count"
+            cursor.execute(f"SELECT {key}, {columns} FROM {table} WHERE article_count > 0")
+            actual = {row[0]: tuple(float(v) for v in row[1:]) for row in cursor.fetchall()}
+            for name in expected.keys() | actual.keys():
+                if not _same(expected.get(name), actual.get(name)):
+                    mismatches.append((table, name, expected.get(name), actual.get(name)))
+        return mismatches
+    finally:
+        cursor.close()
+        conn.close()
+
+def main():
+    parser = argparse.ArgumentParser(description="/statistics 집계 테이블 관리")
+    parser.add_argument("--rebuild", action="store_true", help="articles에서 집계 테이블을 다시 계산")
+    parser.add_argument("--check", action="store_true", help="집계 테이블과 articles 직접 집계 비교")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+    if args.rebuild:
+        rebuild_statistics()
+    if args.check or not args.rebuild:
+        mismatches = check_statistics()
+        for table, name, expected, actual in mismatches:
+            logging.warning(f"{table} [{name}] 직접 집계={expected}, 집계 테이블={actual}")
+        logging.info(f"집계 검증 완료: 불일치 {len(mismatches)}건")
+
+if __name__ == "__main__":
+    main()
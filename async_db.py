@@ -0,0 +1,96 @@
+### async_db.py (FastAPI 엔드포인트용 비동기 MySQL 커넥션 풀)
+# 조회/저장 API가 이벤트 루프별 aiomysql 풀을 사용한다 (크롤러와 db_cleanup.py는 db.py의 동기 풀).
+# 동시 요청 처리량과 지연 시간: python benchmarks/bench_api_load.py [--writes] [--with-analysis 경제]
+import asyncio
+import os
+import time
+import aiomysql
+from db import DB_CONFIG, DB_MAX_LIFETIME, DB_POOL_TIMEOUT, WAIT_BUCKETS_MS
+from metrics import Histogram
+
+# ✅ 비동기 커넥션 풀 설정
+ASYNC_DB_POOL_MIN = int(os.getenv("ASYNC_DB_POOL_MIN", 1))
+ASYNC_DB_POOL_MAX = int(os.getenv("ASYNC_DB_POOL_MAX", 10))
+
+# ✅ 이벤트 루프별 풀 (aiomysql 커넥션은 만든 루프에서만 사용할 수 있다)
+_pools = {}
+_pool_locks = {}
+wait_ms = Histogram(WAIT_BUCKETS_MS)
+counters = {"checkouts": 0, "timeouts": 0}
+
+async def get_async_pool():
+    """현재 이벤트 루프에서 공유되는 aiomysql 풀을 반환합니다 (없으면 생성)."""
+    loop = asyncio.get_running_loop()
+    pool = _pools.get(loop)
+    if pool is not None and not pool.closed:
+        return pool
+    # 첫 요청이 동시에 몰려도 풀은 하나만 만든다
+    lock = _pool_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        pool = _pools.get(loop)
+        if pool is None or pool.closed:
+            pool = await aiomysql.create_pool(
+                host=DB_CONFIG["host"], user=DB_CONFIG["user"], password=DB_CONFIG["password"],
+                db=DB_CONFIG["database"], minsize=ASYNC_DB_POOL_MIN, maxsize=ASYNC_DB_POOL_MAX,
+                pool_recycle=DB_MAX_LIFETIME, autocommit=True, charset="utf8mb4",
+            )
+            _pools[loop] = pool
+    return pool
+
+async def close_async_pool():
+    """현재 이벤트 루프의 풀을 닫습니다. 루프 종료 전에 호출합니다."""
+    loop = asyncio.get_running_loop()
+    _pool_locks.pop(loop, None)
+    pool = _pools.pop(loop, None)
+    if pool is not None:
+        pool.close()
+        await pool.wait_closed()
+
+class _Checkout:
+    """async with connection() as conn: 풀에서 커넥션을 꺼내고 대기 시간을 기록합니다."""
+
+    async def __aenter__(self):
+        pool = await get_async_pool()
+        started = time.monotonic()
+        try:
+            self.connection = await asyncio.wait_for(pool.acquire(), DB_POOL_TIMEOUT)
+        except asyncio.TimeoutError:
+            counters["timeouts"] += 1
+            raise
+        wait_ms.observe((time.monotonic() - started) * 1000)
+        counters["checkouts"] += 1
+        self.pool = pool
+        return self.connection
+
+    async def __aexit__(self, *exc_info):
+        self.pool.release(self.connection)
+
+def connection():
+    return _Checkout()
+
+async def fetch_all(query, params=()):
+    async with connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchall()
+
+async def fetch_one(query, params=()):
+    async with connection() as conn:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(query, params)
+            return await cursor.fetchone()
+
+async def execute(query, params=()):
+    """쓰기 쿼리를 실행하고 (영향받은 행 수, 마지막 INSERT id)를 반환합니다 (autocommit)."""
+    async with connection() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(query, params)
+            return cursor.rowcount, cursor.lastrowid
+
+def async_pool_stats():
+    pool = _pools.get(asyncio.get_running_loop())
+    stats = {"max_size": ASYNC_DB_POOL_MAX, **counters}
+    if pool is not None:
+        stats.update(open=pool.size, idle=pool.freesize, in_use=pool.size - pool.freesize)
+    stats["wait_ms"] = wait_ms.snapshot()
+    return stats
@@ -2,12 +2,14 @@ import asyncio
 import schedule
 import time
 from news_scraper import analyze_section
+from crawl_scheduler import close_crawl_session
+from runtime_config import configure_event_loop
 from db import save_article
 
 async def article_analysis(section):
     """특정 섹션의 기사를 크롤링하고, 요약 및 감성 분석 후 데이터베이스에 저장합니다."""
     print(f"{section} 섹션의 기사를 가져오는 중...")
-    articles = await analyze_section(section)
+    articles = await analyze_section(section, skip_known=True)
     if "error" not in articles:
         for article in articles:
             save_article(
@@ -28,8 +30,10 @@ def job():
     sections = ["정치", "경제", "사회", "생활", "세계", "IT"]
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
+    configure_event_loop(loop)
     tasks = [article_analysis(section) for section in sections]
     loop.run_until_complete(asyncio.gather(*tasks))
+    loop.run_until_complete(close_crawl_session())
     loop.close()
 
 # 6시간마다 작업을 스케줄링합니다.
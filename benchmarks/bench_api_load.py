@@ -0,0 +1,139 @@
+### benchmarks/bench_api_load.py (DB 조회/저장 API 동시 요청 처리량 부하 테스트)
+# 사용법 (서버를 먼저 실행: python server.py):
+#   python benchmarks/bench_api_load.py                                   # /statistics, /articles, /article/{id}
+#   python benchmarks/bench_api_load.py --concurrency 1 16 64 --duration 20 --writes
+#   python benchmarks/bench_api_load.py --with-analysis 경제              # 분석 실행 중 DB API 응답 측정
+#   python benchmarks/bench_api_load.py --compare http://localhost:9001  # 이전 버전 서버(git worktree 등에서 실행)와 비교
+import argparse
+import asyncio
+import itertools
+import os
+import statistics
+import sys
+import time
+import uuid
+
+import httpx
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def percentile(values, q):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * q))]
+
+async def _article_id(client):
+    response = await client.get("/articles")
+    response.raise_for_status()
+    articles = response.json()["articles"]
+    return articles[0]["id"] if articles else None
+
+def build_requests(endpoints, article_id, writes):
+    """(이름, 요청 함수) 목록. 쓰기 요청은 저장 후 바로 삭제하여 테이블을 원래대로 둡니다."""
+    requests = []
+    if "statistics" in endpoints:
+        requests.append(("statistics", lambda client: client.get("/statistics")))
+    if "articles" in endpoints:
+        requests.append(("articles", lambda client: client.get("/articles")))
+    if "article" in endpoints and article_id is not None:
+        requests.append(("article", lambda client: client.get(f"/article/{article_id}")))
+    if writes:
+        async def save_and_delete(client):
+            response = await client.post("/save_article", json={
+                "section": "벤치마크", "title": "부하 테스트", "url": f"https://bench.invalid/{uuid.uuid4().hex}",
+                "content": "부하 테스트 본문", "summary": "부하 테스트 요약", "sentiment": "중립",
+                "sentiment_score": 0.5,
+            })
+            response.raise_for_status()
+            return await client.delete(f"/delete_article/{response.json()['id']}")
+        requests.append(("save+delete", save_and_delete))
+    return requests
+
+async def run_load(base_url, requests, concurrency, duration):
+    """concurrency개의 클라이언트가 duration초 동안 요청을 돌아가며 보냅니다."""
+    latencies = {name: [] for name, _ in requests}
+    errors = 0
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60) as client:
+        deadline = time.perf_counter() + duration
+
+        async def user(offset):
+            nonlocal errors
+            for name, request in itertools.islice(itertools.cycle(requests), offset, None):
+                if time.perf_counter() >= deadline:
+                    return
+                start = time.perf_counter()
+                try:
+                    response = await request(client)
+                    response.raise_for_status()
+                    latencies[name].append((time.perf_counter() - start) * 1000)
+                except Exception:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(user(i % len(requests)) for i in range(concurrency)))
+        elapsed = time.perf_counter() - started
+    return latencies, errors, elapsed
+
+async def run_analysis(base_url, section, stop):
+    """--with-analysis: 부하 테스트 동안 기사 분석 스트림을 계속 실행합니다."""
+    async with httpx.AsyncClient(base_url=base_url, timeout=None) as client:
+        while not stop.is_set():
+            async with client.stream("GET", "/analyze_section/stream", params={"section": section, "count": 20}) as r:
+                async for _ in r.aiter_lines():
+                    if stop.is_set():
+                        return
+
+async def bench(base_url, args):
+    async with httpx.AsyncClient(base_url=base_url, timeout=60) as client:
+        article_id = await _article_id(client)
+    requests = build_requests(args.endpoints, article_id, args.writes)
+    if not requests:
+        print("측정할 엔드포인트가 없습니다.")
+        return {}
+
+    stop = asyncio.Event()
+    analysis = asyncio.create_task(run_analysis(base_url, args.with_analysis, stop)) if args.with_analysis else None
+    results = {}
+    try:
+        print(f"\n[{base_url}]" + (f" (분석 실행 중: {args.with_analysis})" if analysis else ""))
+        for concurrency in args.concurrency:
+            latencies, errors, elapsed = await run_load(base_url, requests, concurrency, args.duration)
+            total = sum(len(values) for values in latencies.values())
+            results[concurrency] = total / elapsed
+            print(f"동시 {concurrency:>3}: {total / elapsed:8.1f} req/s, 오류 {errors}")
+            for name, values in latencies.items():
+                if values:
+                    print(f"    {name:<12} p50 {statistics.median(values):7.1f}ms  p95 {percentile(values, 0.95):7.1f}ms"
+                          f"  p99 {percentile(values, 0.99):7.1f}ms  ({len(values)}건)")
+    finally:
+        if analysis:
+            stop.set()
+            analysis.cancel()
+            await asyncio.gather(analysis, return_exceptions=True)
+    return results
+
+async def main_async(args):
+    results = await bench(args.url, args)
+    if args.compare:
+        baseline = await bench(args.compare, args)
+        print("\n처리량 비교 (대상 / 비교 서버)")
+        for concurrency in args.concurrency:
+            if baseline.get(concurrency):
+                print(f"동시 {concurrency:>3}: {results[concurrency] / baseline[concurrency]:.2f}배")
+
+def main():
+    parser = argparse.ArgumentParser(description="DB API 동시 요청 부하 테스트")
+    parser.add_argument("--url", default="http://localhost:9000", help="측정할 서버 주소")
+    parser.add_argument("--compare", help="비교할 서버 주소 (예: 이전 버전 서버)")
+    parser.add_argument("--concurrency", type=int, nargs="*", default=[1, 8, 32, 64], help="동시 클라이언트 수")
+    parser.add_argument("--duration", type=float, default=10, help="동시 수별 측정 시간 (초)")
+    parser.add_argument("--endpoints", nargs="*", default=["statistics", "articles", "article"],
+                        choices=["statistics", "articles", "article"], help="조회 엔드포인트")
+    parser.add_argument("--writes", action="store_true", help="/save_article + /delete_article 요청 포함")
+    parser.add_argument("--with-analysis", metavar="SECTION", help="측정 중 /analyze_section/stream 실행")
+    asyncio.run(main_async(parser.parse_args()))
+
+if __name__ == "__main__":
+    main()
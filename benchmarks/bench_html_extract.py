@@ -0,0 +1,109 @@
+### benchmarks/bench_html_extract.py (HTML 추출 백엔드 벤치마크)
+# 사용법:
+#   python benchmarks/bench_html_extract.py                       # benchmarks/fixtures/*.html
+#   python benchmarks/bench_html_extract.py --fixtures saved_pages/
+#   python benchmarks/bench_html_extract.py --dump-from-cache http_cache.sqlite3  # 캐시에 저장된 기사 페이지를 픽스처로 저장
+import argparse
+import glob
+import hashlib
+import multiprocessing
+import os
+import resource
+import sqlite3
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from html_extractor import EXTRACTORS, available_extractors
+
+FIXTURE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+BASELINE = "bs4-full"  # 기존 fetch_news와 동일한 파싱 방식
+
+def load_fixtures(fixture_dir):
+    pages = []
+    for path in sorted(glob.glob(os.path.join(fixture_dir, "*.html"))):
+        with open(path, encoding="utf-8") as f:
+            pages.append((os.path.basename(path), f.read()))
+    return pages
+
+def dump_from_cache(cache_path, fixture_dir, limit):
+    """http_cache.py가 저장한 기사 페이지 본문을 픽스처 파일로 저장합니다."""
+    os.makedirs(fixture_dir, exist_ok=True)
+    conn = sqlite3.connect(cache_path)
+    rows = conn.execute(
+        "SELECT url, body FROM http_cache WHERE url LIKE '%/article/%' ORDER BY accessed_at DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+    conn.close()
+    for url, body in rows:
+        name = hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + ".html"
+        with open(os.path.join(fixture_dir, name), "wb") as f:
+            f.write(body)
+    print(f"{len(rows)}개 페이지를 {fixture_dir}에 저장했습니다.")
+
+def _run_backend(name, pages, repeat, queue):
+    # 백엔드마다 별도 프로세스에서 실행하여 최대 메모리(RSS)를 분리 측정
+    extractor = EXTRACTORS[name]
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    tracemalloc.start()
+    outputs = {}
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for page_name, html in pages:
+            outputs[page_name] = extractor(html)
+    elapsed = time.perf_counter() - start
+    _, py_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put({
+        "name": name,
+        "pages_per_sec": len(pages) * repeat / elapsed if elapsed > 0 else float("inf"),
+        "py_peak_kb": py_peak / 1024,
+        "rss_growth_kb": rss_after - rss_before,  # Linux 기준 KB
+        "outputs": outputs,
+    })
+
+def run_backend(name, pages, repeat):
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=_run_backend, args=(name, pages, repeat, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+def main():
+    parser = argparse.ArgumentParser(description="HTML 추출 백엔드 속도/메모리 비교")
+    parser.add_argument("--fixtures", default=FIXTURE_DIR, help="HTML 픽스처 디렉토리")
+    parser.add_argument("--repeat", type=int, default=20, help="픽스처 전체 반복 횟수")
+    parser.add_argument("--backends", nargs="*", help="비교할 백엔드 (기본: 설치된 전체)")
+    parser.add_argument("--dump-from-cache", metavar="CACHE_PATH", help="HTTP 캐시에서 픽스처 생성")
+    parser.add_argument("--limit", type=int, default=200, help="캐시에서 저장할 최대 페이지 수")
+    args = parser.parse_args()
+
+    if args.dump_from_cache:
+        dump_from_cache(args.dump_from_cache, args.fixtures, args.limit)
+        return
+
+    pages = load_fixtures(args.fixtures)
+    if not pages:
+        print(f"⛔ {args.fixtures}에 HTML 픽스처가 없습니다.")
+        return
+
+    backends = args.backends or available_extractors()
+    if BASELINE not in backends:
+        backends = [BASELINE] + backends
+    results = {name: run_backend(name, pages, args.repeat) for name in backends}
+    baseline = results[BASELINE]["outputs"]
+
+    print(f"📊 픽스처 {len(pages)}개 × {args.repeat}회")
+    print(f"{'backend':<12}{'pages/sec':>12}{'py peak KB':>14}{'RSS +KB':>10}{'mismatch':>10}")
+    for name, result in results.items():
+        mismatches = [p for p, out in result["outputs"].items() if out != baseline[p]]
+        print(f"{name:<12}{result['pages_per_sec']:>12.1f}{result['py_peak_kb']:>14.1f}"
+              f"{result['rss_growth_kb']:>10}{len(mismatches):>10}")
+        for page_name in mismatches[:5]:
+            print(f"  ⚠️ {page_name}: 기준과 다른 제목/본문")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+### benchmarks/bench_onnx.py (PyTorch FP32 vs ONNX Runtime int8 속도 / 결과 일치도 비교)
+# 사용법 (먼저 python onnx_models.py 로 모델 변환):
+#   python benchmarks/bench_onnx.py                              # summary_labeled.jsonl 앞 50건
+#   python benchmarks/bench_onnx.py --data summary_labeled.jsonl --limit 200 --skip-summary
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from onnx_models import load_onnx_pipeline
+from news_scraper import (SENTIMENT_MODEL, SUMMARY_MODEL, GENERATION_PROFILES, DEFAULT_PROFILE, SUMMARY_BATCH_SIZE,
+                          SENTIMENT_BATCH_SIZE, LABEL_MAP, _first)
+
+def load_texts(path, limit):
+    """summary_labeled.jsonl에서 (기사 본문, 정답 요약) 목록을 읽습니다."""
+    articles, summaries = [], []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            row = json.loads(line)
+            articles.append(" ".join(row["article_original"]))
+            summaries.append(row["abstractive"])
+            if len(articles) >= limit:
+                break
+    return articles, summaries
+
+def timed(model, inputs, batch_size, **kwargs):
+    start = time.perf_counter()
+    outputs = [_first(output) for output in model(inputs, batch_size=batch_size, truncation=True, **kwargs)]
+    return outputs, (time.perf_counter() - start) / len(inputs)
+
+def bench_summary(articles, profile):
+    from transformers import pipeline
+    from rouge import Rouge
+
+    torch_model = pipeline("summarization", model=SUMMARY_MODEL, device=-1)
+    onnx_model = load_onnx_pipeline("summarization")
+    generation_kwargs = GENERATION_PROFILES[profile]
+    torch_out, torch_sec = timed(torch_model, articles, SUMMARY_BATCH_SIZE, **generation_kwargs)
+    onnx_out, onnx_sec = timed(onnx_model, articles, SUMMARY_BATCH_SIZE, **generation_kwargs)
+    # PyTorch 요약을 정답으로 둔 ROUGE (양자화로 인한 결과 변화 정도)
+    parity = Rouge().get_scores([o["summary_text"] for o in onnx_out],
+                                [o["summary_text"] for o in torch_out], avg=True)
+    print(f"[요약:{profile}] torch {torch_sec:.3f}s/기사, onnx-int8 {onnx_sec:.3f}s/기사, "
+          f"속도 {torch_sec / onnx_sec:.2f}배, ROUGE-L F1(torch 대비) {parity['rouge-l']['f']:.3f}")
+
+def bench_sentiment(texts):
+    from transformers import pipeline
+
+    torch_model = pipeline("text-classification", model=SENTIMENT_MODEL, device=-1)
+    onnx_model = load_onnx_pipeline("text-classification")
+    torch_out, torch_sec = timed(torch_model, texts, SENTIMENT_BATCH_SIZE)
+    onnx_out, onnx_sec = timed(onnx_model, texts, SENTIMENT_BATCH_SIZE)
+    agree = sum(t["label"] == o["label"] for t, o in zip(torch_out, onnx_out))
+    max_diff = max(abs(t["score"] - o["score"]) for t, o in zip(torch_out, onnx_out))
+    print(f"[감성] torch {torch_sec * 1000:.1f}ms/건, onnx-int8 {onnx_sec * 1000:.1f}ms/건, "
+          f"속도 {torch_sec / onnx_sec:.2f}배, 라벨 일치 {agree}/{len(texts)} ({agree / len(texts):.1%}), "
+          f"최대 확률 차이 {max_diff:.3f}")
+    disagreements = [(LABEL_MAP.get(t["label"]), LABEL_MAP.get(o["label"]), text[:40])
+                     for t, o, text in zip(torch_out, onnx_out, texts) if t["label"] != o["label"]]
+    for torch_label, onnx_label, text in disagreements[:10]:
+        print(f"  torch={torch_label} onnx={onnx_label} | {text}")
+
+def main():
+    parser = argparse.ArgumentParser(description="PyTorch vs ONNX Runtime int8 비교")
+    parser.add_argument("--data", default="summary_labeled.jsonl", help="평가 데이터 (evaluate_summarize.py와 동일 형식)")
+    parser.add_argument("--limit", type=int, default=50, help="사용할 기사 수")
+    parser.add_argument("--profile", choices=list(GENERATION_PROFILES), default=DEFAULT_PROFILE, help="요약 생성 프로파일")
+    parser.add_argument("--skip-summary", action="store_true", help="요약 모델 비교 생략")
+    parser.add_argument("--skip-sentiment", action="store_true", help="감성 분석 모델 비교 생략")
+    args = parser.parse_args()
+
+    articles, summaries = load_texts(args.data, args.limit)
+    if not args.skip_summary:
+        bench_summary(articles, args.profile)
+    if not args.skip_sentiment:
+        # 실서비스와 같이 요약문을 분류
+        bench_sentiment(summaries)
+
+if __name__ == "__main__":
+    main()
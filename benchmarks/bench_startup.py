@@ -0,0 +1,104 @@
+### benchmarks/bench_startup.py (모듈 import / 서버 시작 / 모델 로드 시간 벤치마크)
+# 사용법:
+#   python benchmarks/bench_startup.py                 # 모듈별 import 시간
+#   python benchmarks/bench_startup.py --serve         # uvicorn 시작 후 / 가 응답할 때까지 걸린 시간
+#   python benchmarks/bench_startup.py --preload       # preload_models() (모델 로드 + 워밍업) 시간
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MODULES = ["news_scraper", "server", "db_cleanup", "article_scraper_service"]
+
+IMPORT_SNIPPET = """
+import time
+start = time.perf_counter()
+import {module}
+print(time.perf_counter() - start)
+"""
+
+PRELOAD_SNIPPET = """
+import time
+import news_scraper
+start = time.perf_counter()
+news_scraper.preload_models(warmup=False)
+loaded = time.perf_counter()
+news_scraper.preload_models(warmup=True)
+print(loaded - start, time.perf_counter() - loaded)
+"""
+
+def _run_python(code):
+    # 모듈 캐시가 없는 새 프로세스에서 측정
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1] if result.stderr else "실행 실패")
+    return [float(value) for value in result.stdout.split()]
+
+def bench_imports(modules, repeat):
+    print(f"{'module':<26}{'median(s)':>10}{'min(s)':>10}")
+    for module in modules:
+        try:
+            times = [_run_python(IMPORT_SNIPPET.format(module=module))[0] for _ in range(repeat)]
+        except RuntimeError as e:
+            print(f"{module:<26}{'실패':>10}  {e}")
+            continue
+        print(f"{module:<26}{statistics.median(times):>10.3f}{min(times):>10.3f}")
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+def bench_serve(repeat, timeout):
+    """uvicorn 프로세스를 띄운 시점부터 / 가 200을 반환할 때까지의 시간"""
+    times = []
+    for _ in range(repeat):
+        port = _free_port()
+        start = time.perf_counter()
+        process = subprocess.Popen(
+            [sys.executable, "-m", "uvicorn", "server:app", "--port", str(port), "--log-level", "warning"],
+            cwd=ROOT,
+        )
+        try:
+            while time.perf_counter() - start < timeout:
+                try:
+                    with urllib.request.urlopen(f"http://127.0.0.1:{port}/", timeout=1) as response:
+                        if response.status == 200:
+                            times.append(time.perf_counter() - start)
+                            break
+                except OSError:
+                    time.sleep(0.02)
+            else:
+                print(f"{timeout}초 안에 서버가 응답하지 않았습니다.")
+                return
+        finally:
+            process.terminate()
+            process.wait()
+    print(f"서버 준비 시간: median {statistics.median(times):.3f}s, min {min(times):.3f}s ({len(times)}회)")
+
+def bench_preload():
+    load, warmup = _run_python(PRELOAD_SNIPPET)
+    print(f"모델 로드: {load:.2f}s, 워밍업 추론: {warmup:.2f}s")
+
+def main():
+    parser = argparse.ArgumentParser(description="시작 시간 벤치마크")
+    parser.add_argument("--modules", nargs="*", default=MODULES, help="import 시간을 잴 모듈")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수")
+    parser.add_argument("--serve", action="store_true", help="uvicorn 서버 준비 시간 측정")
+    parser.add_argument("--timeout", type=float, default=120, help="서버 준비 대기 최대 시간 (초)")
+    parser.add_argument("--preload", action="store_true", help="preload_models() 시간 측정")
+    args = parser.parse_args()
+
+    bench_imports(args.modules, args.repeat)
+    if args.serve:
+        bench_serve(args.repeat, args.timeout)
+    if args.preload:
+        bench_preload()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+### benchmarks/bench_threads.py (워커 수 / 스레드 수 / 코어 고정 조합별 추론 처리량 스윕)
+# 사용법:
+#   python benchmarks/bench_threads.py                                   # 기본 조합 스윕
+#   python benchmarks/bench_threads.py --workers 0 1 2 4 --intra 1 2 4 --affinity "" auto --articles 64
+#   (--workers 0은 워커 프로세스 없이 API 프로세스 안에서 추론)
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+FIXTURE_DIR = os.path.join(ROOT, "benchmarks", "fixtures")
+
+def load_texts(data_path, articles):
+    """평가 데이터(jsonl) 또는 HTML 픽스처에서 기사 본문을 읽어 articles개를 채웁니다."""
+    texts = []
+    if data_path:
+        with open(data_path, encoding="utf-8") as f:
+            texts = [" ".join(json.loads(line)["article_original"]) for line in f]
+    else:
+        import glob
+        from html_extractor import extract_article
+        for path in sorted(glob.glob(os.path.join(FIXTURE_DIR, "*.html"))):
+            with open(path, encoding="utf-8") as f:
+                _, content = extract_article(f.read())
+            if content:
+                texts.append(" ".join(content.split()))
+    if not texts:
+        raise SystemExit("기사 본문을 찾을 수 없습니다.")
+    # 결과 캐시가 꺼져 있어도 같은 입력이 반복되지 않도록 번호를 붙인다
+    return [f"{texts[i % len(texts)]} ({i})" for i in range(articles)]
+
+async def _run_workload(texts, profile):
+    from news_scraper import analyze_sentiment_batch, summarize_news_batch
+    summaries = await summarize_news_batch(texts, profile)
+    await analyze_sentiment_batch(summaries)
+
+def run_child(args):
+    """설정된 환경 변수로 모델을 로드하고 워크로드 처리 시간을 측정합니다 (스윕의 한 조합)."""
+    import news_scraper
+    from runtime_config import configure_event_loop
+
+    texts = load_texts(args.data, args.articles)
+    started = time.perf_counter()
+    news_scraper.preload_models()
+    load_seconds = time.perf_counter() - started
+
+    async def main():
+        configure_event_loop(asyncio.get_running_loop())
+        await _run_workload(texts[:max(1, len(texts) // 8)], args.profile)  # 워밍업
+        start = time.perf_counter()
+        await _run_workload(texts, args.profile)
+        return time.perf_counter() - start
+
+    elapsed = asyncio.run(main())
+    print(json.dumps({"articles_per_second": len(texts) / elapsed, "seconds": elapsed, "load_seconds": load_seconds}))
+
+def sweep(args):
+    results = []
+    for workers, intra, inter, affinity in itertools.product(args.workers, args.intra, args.inter, args.affinity):
+        env = dict(os.environ, INFERENCE_CACHE="off", INFERENCE_INTRA_OP_THREADS=str(intra),
+                   INFERENCE_INTER_OP_THREADS=str(inter), INFERENCE_CPU_AFFINITY=affinity,
+                   EXECUTOR_MAX_WORKERS=str(args.executor_workers))
+        if workers:
+            env.update(INFERENCE_BACKEND="workers", INFERENCE_WORKERS=str(workers))
+        else:
+            env.update(INFERENCE_BACKEND="inprocess")
+        label = f"workers={workers} intra={intra} inter={inter} affinity={affinity or '-'}"
+        command = [sys.executable, os.path.abspath(__file__), "--run-child", "--articles", str(args.articles),
+                   "--profile", args.profile] + (["--data", args.data] if args.data else [])
+        completed = subprocess.run(command, cwd=ROOT, env=env, capture_output=True, text=True)
+        if completed.returncode != 0:
+            print(f"{label}: 실패 ({completed.stderr.strip().splitlines()[-1] if completed.stderr else ''})")
+            continue
+        result = json.loads(completed.stdout.strip().splitlines()[-1])
+        results.append((result["articles_per_second"], label, env))
+        print(f"{label}: {result['articles_per_second']:.2f} 기사/초 (모델 로드 {result['load_seconds']:.1f}s)")
+
+    if not results:
+        return
+    best_rate, best_label, best_env = max(results, key=lambda item: item[0])
+    print(f"\n최고 처리량: {best_rate:.2f} 기사/초 — {best_label}")
+    keys = ["INFERENCE_BACKEND", "INFERENCE_WORKERS", "INFERENCE_INTRA_OP_THREADS", "INFERENCE_INTER_OP_THREADS",
+            "INFERENCE_CPU_AFFINITY", "EXECUTOR_MAX_WORKERS"]
+    print(" ".join(f"{key}={best_env[key]}" for key in keys if best_env.get(key)))
+
+def main():
+    cpu_count = os.cpu_count() or 1
+    parser = argparse.ArgumentParser(description="CPU 추론 스레드/코어 설정 스윕")
+    parser.add_argument("--workers", type=int, nargs="*", default=[0, 1, 2], help="추론 워커 수 (0: 프로세스 내 추론)")
+    parser.add_argument("--intra", type=int, nargs="*", default=sorted({1, 2, max(1, cpu_count // 2), cpu_count}),
+                        help="intra-op 스레드 수")
+    parser.add_argument("--inter", type=int, nargs="*", default=[1], help="inter-op 스레드 수")
+    parser.add_argument("--affinity", nargs="*", default=["", "auto"], help='코어 고정 ("" / auto / "0-3")')
+    parser.add_argument("--executor-workers", type=int, default=4, help="to_thread 실행기 스레드 수")
+    parser.add_argument("--articles", type=int, default=32, help="측정에 사용할 기사 수")
+    parser.add_argument("--data", help="summary_labeled.jsonl 형식 데이터 (없으면 HTML 픽스처 사용)")
+    parser.add_argument("--profile", default="fast", help="요약 생성 프로파일")
+    parser.add_argument("--run-child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_child:
+        run_child(args)
+    else:
+        sweep(args)
+
+if __name__ == "__main__":
+    main()
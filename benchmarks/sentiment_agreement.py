@@ -0,0 +1,86 @@
+### benchmarks/sentiment_agreement.py (요약문 기반 vs 본문 앞부분 기반 감성 라벨 일치도 리포트)
+# 사용법:
+#   python benchmarks/sentiment_agreement.py                  # 최근 기사 500건, DB에 저장된 (요약문 기반) 라벨과 비교
+#   python benchmarks/sentiment_agreement.py --limit 2000 --section 경제 --recompute
+import argparse
+import os
+import sys
+import time
+from collections import Counter, defaultdict
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from db import get_db_connection
+from news_scraper import LABEL_MAP, SENTIMENT_LEAD_CHARS, classify_texts
+from text_chunking import lead_text
+
+LABELS = list(LABEL_MAP.values())
+
+def load_articles(limit, section=None):
+    connection = get_db_connection()
+    cursor = connection.cursor(dictionary=True)
+    try:
+        query = ("SELECT section, content, summary, sentiment FROM articles "
+                 "WHERE content IS NOT NULL AND summary IS NOT NULL")
+        params = []
+        if section:
+            query += " AND section = %s"
+            params.append(section)
+        query += " ORDER BY created_at DESC LIMIT %s"
+        params.append(limit)
+        cursor.execute(query, params)
+        return cursor.fetchall()
+    finally:
+        cursor.close()
+        connection.close()
+
+def classify(texts):
+    start = time.perf_counter()
+    results = classify_texts(texts)
+    return [result[0] if result else None for result in results], time.perf_counter() - start
+
+def main():
+    parser = argparse.ArgumentParser(description="요약문 기반 / 본문 앞부분 기반 감성 분석 라벨 비교")
+    parser.add_argument("--limit", type=int, default=500, help="비교할 최근 기사 수")
+    parser.add_argument("--section", help="특정 섹션만 비교")
+    parser.add_argument("--lead-chars", type=int, default=SENTIMENT_LEAD_CHARS, help="본문 앞부분 길이")
+    parser.add_argument("--recompute", action="store_true",
+                        help="저장된 라벨 대신 요약문을 현재 모델로 다시 분류하여 비교")
+    args = parser.parse_args()
+
+    articles = load_articles(args.limit, args.section)
+    if not articles:
+        print("비교할 기사가 없습니다.")
+        return
+
+    lead_labels, lead_seconds = classify([lead_text(" ".join(a["content"].split()), args.lead_chars)
+                                          for a in articles])
+    if args.recompute:
+        summary_labels, summary_seconds = classify([a["summary"] for a in articles])
+        print(f"분류 시간: 요약문 {summary_seconds:.1f}s, 본문 앞부분 {lead_seconds:.1f}s ({len(articles)}건)")
+    else:
+        summary_labels = [a["sentiment"] for a in articles]
+
+    confusion = Counter()
+    by_section = defaultdict(lambda: [0, 0])
+    for article, summary_label, lead_label in zip(articles, summary_labels, lead_labels):
+        if summary_label is None or lead_label is None:
+            continue
+        confusion[(summary_label, lead_label)] += 1
+        by_section[article["section"]][0] += summary_label == lead_label
+        by_section[article["section"]][1] += 1
+
+    total = sum(confusion.values())
+    agree = sum(count for (s, l), count in confusion.items() if s == l)
+    print(f"\n전체 일치율: {agree}/{total} ({agree / total:.1%})" if total else "\n비교 가능한 기사가 없습니다.")
+
+    print("\n혼동 행렬 (행: 요약문 기반, 열: 본문 앞부분 기반)")
+    print(" " * 8 + "".join(f"{label:>8}" for label in LABELS))
+    for summary_label in LABELS:
+        print(f"{summary_label:<8}" + "".join(f"{confusion[(summary_label, l)]:>8}" for l in LABELS))
+
+    print("\n섹션별 일치율")
+    for section, (matched, count) in sorted(by_section.items()):
+        print(f"  {section:<6} {matched}/{count} ({matched / count:.1%})")
+
+if __name__ == "__main__":
+    main()
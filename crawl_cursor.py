@@ -0,0 +1,87 @@
+### crawl_cursor.py (섹션별 증분 크롤링 커서)
+# 크롤러 서비스(ArticleScraper, 섹션당 최대 300개) 전용이며 /analyze_section API는 커서를 옮기지 않는다.
+# 커서는 처리(저장)된 기사까지만 옮겨 실패한 기사는 다음 실행에서 다시 모인다.
+import json
+import os
+import threading
+from datetime import datetime
+
+# ✅ 커서 설정
+CURSOR_PATH = os.getenv("CRAWL_CURSOR_PATH", "crawl_cursor.json")
+CURSOR_SIZE = 300  # 섹션별로 기억할 최신 기사 URL 수 (다음 실행의 정지 지점)
+CURSOR_MAX_ATTEMPTS = 3  # 이 횟수만큼 연속 실패한 기사(404, 본문 없음 등)는 처리된 것으로 보고 커서를 넘긴다
+
+def processed_tail(covered, done):
+    """커서로 넘길 URL (최신순 covered 중 가장 최근에 실패한 기사보다 오래된, 모두 처리된 구간).
+    collect_incremental_urls는 커서에 있는 기사가 나오는 페이지에서 멈추므로,
+    실패한 기사보다 새 기사를 커서에 넣으면 다음 실행에서 그 기사까지 내려가지 못한다."""
+    failed = [i for i, url in enumerate(covered) if url not in done]
+    return covered[failed[-1] + 1:] if failed else covered
+
+class CrawlCursor:
+    """섹션별로 마지막 실행에서 본 최신 기사 URL(high-water mark)을 파일에 저장합니다."""
+
+    def __init__(self, path=CURSOR_PATH, size=CURSOR_SIZE, max_attempts=CURSOR_MAX_ATTEMPTS):
+        self.path = path
+        self.size = size
+        self.max_attempts = max_attempts
+        self.lock = threading.Lock()
+        self.data = self._load()
+
+    def _load(self):
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(self.data, f, ensure_ascii=False, indent=4)
+        os.replace(tmp_path, self.path)
+
+    def seen_urls(self, section):
+        """이전 실행에서 처리한 최신 URL 집합 (비어 있으면 첫 실행)"""
+        return set(self.data.get(section, {}).get("urls", []))
+
+    def last_run_at(self, section):
+        return self.data.get(section, {}).get("updated_at")
+
+    def advance(self, section, covered, processed, count_failures=True):
+        """이번 실행에서 다룬 URL(covered, 최신순) 중 처리된 구간까지 커서를 옮기고 파일에 저장합니다.
+        처리되지 않은 URL은 실패 횟수를 늘리며(count_failures), max_attempts번 실패한 URL은 포기하고 넘깁니다.
+        포기한 URL 목록을 반환합니다."""
+        with self.lock:
+            # 다른 섹션의 커서를 오래된 사본으로 덮어쓰지 않도록 저장 직전에 파일을 다시 읽는다
+            self.data = self._load()
+            entry = self.data.get(section, {})
+            failures = dict(entry.get("failures", {}))
+            processed = set(processed)
+            for url in covered:
+                if url in processed:
+                    failures.pop(url, None)
+                elif count_failures:
+                    failures[url] = failures.get(url, 0) + 1
+            given_up = [url for url in covered if url not in processed
+                        and failures.get(url, 0) >= self.max_attempts]
+            newest_urls = processed_tail(covered, processed.union(given_up))
+            urls = list(dict.fromkeys(list(newest_urls) + entry.get("urls", [])))[:self.size]
+            # 커서를 넘긴 URL의 실패 기록은 더 필요 없다
+            passed = set(newest_urls)
+            failures = {url: n for url, n in failures.items() if url not in passed}
+            self.data[section] = {"urls": urls, "failures": failures,
+                                  "updated_at": datetime.now().isoformat(timespec="seconds")}
+            self._save()
+            return given_up
+
+_cursor = None
+
+def get_crawl_cursor():
+    """프로세스에서 공유되는 크롤링 커서를 반환합니다 (없으면 파일에서 적재)."""
+    global _cursor
+    if _cursor is None:
+        _cursor = CrawlCursor()
+    return _cursor
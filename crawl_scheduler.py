@@ -0,0 +1,149 @@
+### crawl_scheduler.py (호스트별 요청 속도 제한 및 동시성 제한 스케줄러)
+import asyncio
+import random
+import time
+from collections import deque
+from urllib.parse import urlsplit
+from http_client import fetch, close_http_client
+
+# ✅ 스케줄러 기본 설정
+MAX_CONCURRENCY = 8        # 전체 동시 요청 수 상한
+HOST_RATE = 5.0            # 호스트별 초당 요청 수 (토큰 보충 속도)
+HOST_BURST = 5             # 호스트별 버킷 크기 (순간 최대 요청 수)
+MAX_RETRIES = 4            # 429/5xx 응답 시 재시도 횟수
+BACKOFF_BASE = 1.0         # 지수 백오프 기본 대기 시간 (초)
+BACKOFF_MAX = 30.0         # 백오프 최대 대기 시간 (초)
+RATE_WINDOW = 60.0         # 초당 요청 수 계산 구간 (초)
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """초당 rate개의 토큰을 보충하고 최대 capacity개까지 쌓는 토큰 버킷"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+        self.updated_at = now
+
+    async def acquire(self):
+        async with self.lock:
+            self._refill()
+            while self.tokens < 1:
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+                self._refill()
+            self.tokens -= 1
+
+class CrawlScheduler:
+    """호스트별 토큰 버킷 + 전체 동시성 제한 + 429/5xx 지수 백오프를 적용해 요청을 보냅니다."""
+
+    def __init__(self, max_concurrency=MAX_CONCURRENCY, host_rate=HOST_RATE, host_burst=HOST_BURST,
+                 max_retries=MAX_RETRIES, backoff_base=BACKOFF_BASE, backoff_max=BACKOFF_MAX):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.max_concurrency = max_concurrency
+        self.host_rate = host_rate
+        self.host_burst = host_burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.buckets = {}
+        self.waiting = 0
+        self.in_flight = 0
+        self.total_requests = 0
+        self.total_retries = 0
+        self.request_times = deque()
+
+    def _bucket(self, url):
+        host = urlsplit(url).netloc
+        bucket = self.buckets.get(host)
+        if bucket is None:
+            bucket = TokenBucket(self.host_rate, self.host_burst)
+            self.buckets[host] = bucket
+        return bucket
+
+    def _backoff_delay(self, attempt, response=None):
+        # Retry-After 헤더가 있으면 우선 적용
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after and retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(0, delay)  # full jitter
+
+    def _record_request(self):
+        now = time.monotonic()
+        self.total_requests += 1
+        self.request_times.append(now)
+        while self.request_times and now - self.request_times[0] > RATE_WINDOW:
+            self.request_times.popleft()
+
+    async def fetch(self, url, **kwargs):
+        """스케줄링 규칙에 따라 GET 요청을 보내고 최종 응답을 반환합니다."""
+        bucket = self._bucket(url)
+        for attempt in range(self.max_retries + 1):
+            self.waiting += 1
+            try:
+                await bucket.acquire()
+                await self.semaphore.acquire()
+            finally:
+                self.waiting -= 1
+            self.in_flight += 1
+            try:
+                self._record_request()
+                response = await fetch(url, **kwargs)
+            finally:
+                self.in_flight -= 1
+                self.semaphore.release()
+
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                return response
+            self.total_retries += 1
+            await asyncio.sleep(self._backoff_delay(attempt, response))
+        return response
+
+    def stats(self):
+        """튜닝용 지표: 대기 중인 요청 수, 처리 중인 요청 수, 최근 초당 요청 수"""
+        now = time.monotonic()
+        recent = [t for t in self.request_times if now - t <= RATE_WINDOW]
+        window = max(1.0, now - recent[0]) if recent else 1.0
+        return {
+            "queue_depth": self.waiting,
+            "in_flight": self.in_flight,
+            "max_concurrency": self.max_concurrency,
+            "requests_per_second": round(len(recent) / window, 2),
+            "total_requests": self.total_requests,
+            "total_retries": self.total_retries,
+            "hosts": len(self.buckets),
+        }
+
+# ✅ 이벤트 루프별 스케줄러 (asyncio 동기화 객체는 루프에 묶인다)
+_schedulers = {}
+
+def get_scheduler():
+    """현재 이벤트 루프에서 공유되는 크롤링 스케줄러를 반환합니다 (없으면 생성)."""
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = CrawlScheduler()
+        _schedulers[loop] = scheduler
+    return scheduler
+
+def release_scheduler():
+    """현재 이벤트 루프의 스케줄러를 정리하고 마지막 지표를 반환합니다."""
+    scheduler = _schedulers.pop(asyncio.get_running_loop(), None)
+    return scheduler.stats() if scheduler else None
+
+async def close_crawl_session():
+    """루프 종료 전에 커넥션 풀과 스케줄러를 정리하고 마지막 스케줄러 지표를 반환합니다."""
+    await close_http_client()
+    return release_scheduler()
+
+async def crawl_fetch(url, **kwargs):
+    """공유 스케줄러를 거쳐 GET 요청을 보냅니다."""
+    return await get_scheduler().fetch(url, **kwargs)
@@ -1,29 +1,261 @@
-### db.py (MySQL 데이터베이스 연결)
+### db.py (MySQL 데이터베이스 연결 / 공유 커넥션 풀)
+import os
+import threading
+import time
+import weakref
+from collections import deque
 import mysql.connector
+from metrics import Histogram
+from url_filter import known_urls
+
+DB_CONFIG = {"host": "localhost", "user": "root", "password": "qwer1234", "database": "article_db"}
+
+# ✅ 커넥션 풀 설정
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", 8))                   # 프로세스당 최대 커넥션 수
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", 10))          # 커넥션을 기다리는 최대 시간 (초)
+DB_MAX_LIFETIME = float(os.getenv("DB_MAX_LIFETIME", 1800))        # 이 시간이 지난 커넥션은 닫고 새로 연결 (초)
+DB_PING_AFTER_IDLE = float(os.getenv("DB_PING_AFTER_IDLE", 30))    # 이 시간 이상 쉬었던 커넥션은 꺼낼 때 ping (초)
+WAIT_BUCKETS_MS = [1, 5, 10, 50, 100, 500, 1000, 5000]
+
+class PooledConnection:
+    """풀에서 꺼낸 커넥션. close()하면 실제로 닫지 않고 풀에 반환합니다 (나머지 메서드는 원래 커넥션과 동일).
+    close()하지 않고 버려진 커넥션은 가비지 컬렉션 시 닫고 풀 자리를 돌려받습니다."""
+
+    def __init__(self, pool, connection, created_at):
+        self._pool = pool
+        self._connection = connection
+        self._created_at = created_at
+        self._finalizer = weakref.finalize(self, pool.reclaim, connection)
+
+    def __getattr__(self, name):
+        if self._connection is None:
+            raise mysql.connector.errors.OperationalError("풀에 반환된 커넥션입니다.")
+        return getattr(self._connection, name)
+
+    def close(self):
+        if self._connection is not None:
+            self._finalizer.detach()
+            connection, self._connection = self._connection, None
+            self._pool.release(connection, self._created_at)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class ConnectionPool:
+    """스레드 간에 공유하는 MySQL 커넥션 풀.
+    최대 size개까지 연결하고, 모두 사용 중이면 timeout초까지 반환을 기다립니다.
+    오래 쉬었던 커넥션은 꺼낼 때 ping으로 확인하고, max_lifetime이 지난 커넥션은 새로 연결합니다."""
+
+    def __init__(self, size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT, max_lifetime=DB_MAX_LIFETIME,
+                 ping_after_idle=DB_PING_AFTER_IDLE, **config):
+        self.size = size
+        self.timeout = timeout
+        self.max_lifetime = max_lifetime
+        self.ping_after_idle = ping_after_idle
+        self.config = config or DB_CONFIG
+        self._idle = deque()  # (connection, created_at, released_at)
+        self._opened = 0
+        self._condition = threading.Condition()
+        self.wait_ms = Histogram(WAIT_BUCKETS_MS)
+        self.counters = {"checkouts": 0, "connects": 0, "recycled": 0, "failed_health_checks": 0, "timeouts": 0,
+                         "reclaimed": 0}
+
+    def _connect(self):
+        connection = mysql.connector.connect(**self.config)
+        with self._condition:
+            self.counters["connects"] += 1
+        return connection, time.monotonic()
+
+    def _discard(self, connection):
+        try:
+            connection.close()
+        except Exception:
+            pass
+        with self._condition:
+            self._opened -= 1
+            self._condition.notify()
+
+    def reclaim(self, connection):
+        """close()되지 않은 채 버려진 커넥션 정리 (상태를 알 수 없으므로 재사용하지 않고 닫는다)"""
+        with self._condition:
+            self.counters["reclaimed"] += 1
+        self._discard(connection)
+
+    def _healthy(self, connection, created_at, released_at):
+        now = time.monotonic()
+        if now - created_at > self.max_lifetime:
+            with self._condition:
+                self.counters["recycled"] += 1
+            return False
+        if now - released_at > self.ping_after_idle:
+            try:
+                connection.ping(reconnect=False)
+            except Exception:
+                with self._condition:
+                    self.counters["failed_health_checks"] += 1
+                return False
+        return True
+
+    def acquire(self):
+        started = time.monotonic()
+        deadline = started + self.timeout
+        while True:
+            with self._condition:
+                while not self._idle and self._opened >= self.size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0 or not self._condition.wait(remaining):
+                        if self._idle or self._opened < self.size:
+                            break
+                        self.counters["timeouts"] += 1
+                        raise mysql.connector.errors.PoolError(
+                            f"{self.timeout}초 동안 사용 가능한 DB 커넥션이 없습니다 (pool size={self.size}).")
+                if self._idle:
+                    entry = self._idle.pop()
+                else:
+                    entry = None
+                    self._opened += 1
+
+            if entry is None:
+                try:
+                    connection, created_at = self._connect()
+                except Exception:
+                    with self._condition:
+                        self._opened -= 1
+                        self._condition.notify()
+                    raise
+            else:
+                connection, created_at, released_at = entry
+                if not self._healthy(connection, created_at, released_at):
+                    self._discard(connection)
+                    continue
+
+            self.wait_ms.observe((time.monotonic() - started) * 1000)
+            with self._condition:
+                self.counters["checkouts"] += 1
+            return PooledConnection(self, connection, created_at)
+
+    def release(self, connection, created_at):
+        try:
+            # 커밋하지 않은 트랜잭션(SELECT만 한 경우의 읽기 스냅샷 포함)이 다음 사용자에게 넘어가지 않도록 정리
+            if connection.in_transaction:
+                connection.rollback()
+        except Exception:
+            self._discard(connection)
+            return
+        with self._condition:
+            self._idle.append((connection, created_at, time.monotonic()))
+            self._condition.notify()
+
+    def close(self):
+        with self._condition:
+            idle, self._idle = list(self._idle), deque()
+        for connection, _, _ in idle:
+            self._discard(connection)
+
+    def stats(self):
+        with self._condition:
+            stats = {
+                "size": self.size,
+                "open": self._opened,
+                "idle": len(self._idle),
+                "in_use": self._opened - len(self._idle),
+                **self.counters,
+            }
+        stats["wait_ms"] = self.wait_ms.snapshot()
+        return stats
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_connection_pool():
+    """프로세스에서 공유하는 커넥션 풀 (첫 사용 시 생성, 커넥션은 필요할 때 연결)"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ConnectionPool()
+    return _pool
 
 def get_db_connection():
-    return mysql.connector.connect(
-        host="localhost", user="root", password="qwer1234", database="article_db"
-    )
+    """공유 풀에서 커넥션을 꺼냅니다. 사용 후 close()하면 풀에 반환됩니다."""
+    return get_connection_pool().acquire()
+
+def db_pool_stats():
+    return get_connection_pool().stats()
 
 def save_article(section, title, content, url, summary, sentiment, sentiment_score):
-    conn = get_db_connection()
-    cursor = conn.cursor()
     query = """
         INSERT INTO articles (section, title, content, url, summary, sentiment, sentiment_score) 
         VALUES (%s, %s, %s, %s, %s, %s, %s)
     """
-    cursor.execute(query, (section, title, content, url, summary, sentiment, sentiment_score))
-    conn.commit()
-    cursor.close()
-    conn.close()
+    # 실패(중복 URL 등)해도 커넥션은 풀에 반환 (close 시 커밋되지 않은 트랜잭션은 롤백)
+    with get_db_connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query, (section, title, content, url, summary, sentiment, sentiment_score))
+            conn.commit()
+        finally:
+            cursor.close()
+    known_urls.add(url)
 
 def get_articles(section=None):
-    conn = get_db_connection()
-    cursor = conn.cursor(dictionary=True)
     query = "SELECT * FROM articles" if not section else "SELECT * FROM articles WHERE section = %s"
-    cursor.execute(query, (section,) if section else ())
-    articles = cursor.fetchall()
-    cursor.close()
-    conn.close()
-    return articles
+    with get_db_connection() as conn:
+        cursor = conn.cursor(dictionary=True)
+        try:
+            cursor.execute(query, (section,) if section else ())
+            return cursor.fetchall()
+        finally:
+            cursor.close()
+
+# 증분 갱신 시 마지막으로 읽은 id보다 이만큼 앞에서부터 다시 읽는다
+# (AUTO_INCREMENT id는 커밋 순서와 다를 수 있어, 늦게 커밋된 작은 id를 놓치지 않기 위함)
+KNOWN_URLS_REFRESH_OVERLAP = 1000
+_known_urls_lock = threading.Lock()
+
+def iter_article_urls(after_id=0, batch_size=10000):
+    """id가 after_id보다 큰 기사의 (id, url)을 id 순서로 batch_size 단위로 읽어 반환합니다."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    try:
+        cursor.execute("SELECT id, url FROM articles WHERE id > %s AND url IS NOT NULL ORDER BY id", (after_id,))
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cursor.close()
+        conn.close()
+
+def load_known_urls():
+    """Bloom 필터를 DB와 맞춥니다. 처음에는 전체를 적재하고, 이후에는 마지막으로 읽은 id 이후(증분)만 읽어
+    다른 프로세스가 저장한 URL도 반영합니다. 크롤링할 URL을 거르기 전마다 호출합니다."""
+    # 동시에 들어온 첫 호출(병렬 /analyze_section 요청)이 각자 전체 테이블을 읽지 않도록,
+    # loaded 확인과 적재를 한 잠금 안에서 한다 (뒤에 온 호출은 앞선 적재 이후의 증분만 읽는다)
+    with _known_urls_lock:
+        after_id = max(0, known_urls.last_id - KNOWN_URLS_REFRESH_OVERLAP) if known_urls.loaded else 0
+        known_urls.load(iter_article_urls(after_id))
+    return known_urls.count
+
+def get_existing_urls(urls, chunk_size=1000):
+    """주어진 URL 중 이미 저장된 URL 집합을 반환합니다 (IN 조회 한 번, 큰 목록은 chunk_size로 분할)."""
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return set()
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    existing = set()
+    try:
+        for i in range(0, len(urls), chunk_size):
+            chunk = urls[i:i + chunk_size]
+            placeholders = ", ".join(["%s"] * len(chunk))
+            cursor.execute(f"SELECT url FROM articles WHERE url IN ({placeholders})", chunk)
+            existing.update(url for (url,) in cursor.fetchall())
+    finally:
+        cursor.close()
+        conn.close()
+    return existing
@@ -1,7 +1,7 @@
-import mysql.connector
 from datetime import datetime
 import logging
-from news_scraper import analyze_sentiment, summarize_news
+from db import get_db_connection
+from news_scraper import classify_texts, summarize_texts
 
 # 로깅 설정
 logging.basicConfig(
@@ -10,10 +10,8 @@ logging.basicConfig(
     filename='db_cleanup.log'
 )
 
-def get_db_connection():
-    return mysql.connector.connect(
-        host="localhost", user="root", password="qwer1234", database="article_db"
-    )
+# 한 번에 요약/감성 분석할 기사 수
+CLEANUP_BATCH_SIZE = 64
 
 def update_missing_sentiment_scores():
     """감성 분석 점수가 없는 기사를 찾아 업데이트합니다."""
@@ -31,33 +29,40 @@ def update_missing_sentiment_scores():
         
         logging.info(f"감성 분석 점수가 없는 기사 {len(articles)}개 발견")
         
-        for article in articles:
-            try:
-                # 요약이 없는 경우 요약 생성
-                if not article['summary']:
-                    summary = summarize_news(article['content'])
+        for start in range(0, len(articles), CLEANUP_BATCH_SIZE):
+            batch = articles[start:start + CLEANUP_BATCH_SIZE]
+
+            # 요약이 없는 기사는 배치로 요약 생성
+            missing = [article for article in batch if not article['summary']]
+            if missing:
+                summaries = summarize_texts([article['content'] for article in missing])
+                for article, summary in zip(missing, summaries):
+                    article['summary'] = summary
                     cursor.execute(
                         "UPDATE articles SET summary = %s WHERE id = %s",
                         (summary, article['id'])
                     )
-                else:
-                    summary = article['summary']
-                
-                # 감성 분석 수행
-                sentiment_label, sentiment_score = analyze_sentiment(summary)
-                
-                # 데이터베이스 업데이트
-                cursor.execute("""
-                    UPDATE articles 
-                    SET sentiment = %s, sentiment_score = %s 
-                    WHERE id = %s
-                """, (sentiment_label, sentiment_score, article['id']))
-                
-                logging.info(f"기사 ID {article['id']} 업데이트 완료: 감성={sentiment_label}, 점수={sentiment_score}")
-                
-            except Exception as e:
-                logging.error(f"기사 ID {article['id']} 처리 중 오류 발생: {str(e)}")
-                continue
+
+            # 감성 분석을 배치로 수행 (실패한 항목만 건너뜀)
+            sentiments = classify_texts([article['summary'] for article in batch])
+            for article, sentiment in zip(batch, sentiments):
+                try:
+                    if sentiment is None:
+                        raise ValueError("감성 분석 실패")
+                    sentiment_label, sentiment_score = sentiment
+                    
+                    # 데이터베이스 업데이트
+                    cursor.execute("""
+                        UPDATE articles 
+                        SET sentiment = %s, sentiment_score = %s 
+                        WHERE id = %s
+                    """, (sentiment_label, sentiment_score, article['id']))
+                    
+                    logging.info(f"기사 ID {article['id']} 업데이트 완료: 감성={sentiment_label}, 점수={sentiment_score}")
+                    
+                except Exception as e:
+                    logging.error(f"기사 ID {article['id']} 처리 중 오류 발생: {str(e)}")
+                    continue
         
         conn.commit()
         logging.info("감성 분석 점수 업데이트 완료")
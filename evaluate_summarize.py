@@ -9,6 +9,9 @@ import nltk
 import numpy as np
 from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score
 import logging
+import time
+from length_batching import length_sorted_batches, restore_order, token_lengths
+from extractive import preselect
 
 # NLTK 데이터 다운로드
 def download_nltk_resources():
@@ -38,8 +41,15 @@ device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
 # ✅ 평가할 모델 경로들
 MODELS = {
     "Pretrained": "digit82/kobart-summarization",
-    "Fine-tuned": "kobart_summarization_model"
+    "Fine-tuned": "kobart_summarization_model",
+    "Pretrained-ONNX-int8": "onnx_models/summarizer-int8"
 }
+# 추출 요약 전처리(extractive.py)로 TextRank 상위 문장만 남긴 뒤 요약 (모델 이름 → 토큰 예산)
+EXTRACTIVE_MODELS = {"Pretrained-Extractive-512": 512}
+for extractive_name in EXTRACTIVE_MODELS:
+    MODELS[extractive_name] = MODELS["Pretrained"]
+# onnx_models.py로 변환/양자화한 모델은 ONNX Runtime(CPU)으로 실행하고, 같은 원본 모델과 요약 결과를 비교
+ONNX_MODELS = {"Pretrained-ONNX-int8": "Pretrained"}
 
 # ✅ 기사 데이터를 로딩
 df = pd.read_json("summary_labeled.jsonl", lines=True)
@@ -49,23 +59,53 @@ article_texts = df["text"].tolist()
 
 # ✅ 결과 저장용 딕셔너리
 all_results = {}
+all_summaries = {}
 
 # ✅ 요약 및 평가 함수
-def generate_summary(model, tokenizer, text):
-    inputs = tokenizer(text, return_tensors="pt", truncation=True, max_length=1024, padding="max_length")
-    inputs = {k: v.to(device) for k, v in inputs.items()}
+EVAL_BATCH_SIZE = 8
+GENERATION_KWARGS = {
+    "max_length": 128,
+    "min_length": 30,
+    "num_beams": 4,
+    "length_penalty": 2.0,
+    "early_stopping": True,
+    "no_repeat_ngram_size": 3,
+    "temperature": 0.7
+}
+
+def generate_batch(model, tokenizer, texts):
+    # 배치 안에서 가장 긴 입력에 맞춰서만 패딩 (max_length 고정 패딩 대신)
+    inputs = tokenizer(texts, return_tensors="pt", truncation=True, max_length=1024, padding="longest")
+    inputs = {k: v.to(model.device) for k, v in inputs.items()}
     with torch.no_grad():
         summary_ids = model.generate(
             inputs["input_ids"],
-            max_length=128,
-            min_length=30,
-            num_beams=4,
-            length_penalty=2.0,
-            early_stopping=True,
-            no_repeat_ngram_size=3,
-            temperature=0.7
+            attention_mask=inputs["attention_mask"],
+            **GENERATION_KWARGS
         )
-    return tokenizer.decode(summary_ids[0], skip_special_tokens=True)
+    return tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+
+def generate_summaries(model, tokenizer, texts, batch_size=EVAL_BATCH_SIZE, desc=None):
+    """토큰 길이가 비슷한 기사끼리 배치로 요약하고 원래 순서로 돌려줍니다.
+    배치가 실패하면 기사별로 다시 요약하여, 실패한 기사만 빈 요약이 됩니다."""
+    lengths = token_lengths(tokenizer, texts, max_length=1024)
+    batches = []
+    with tqdm(total=len(texts), desc=desc) as progress:
+        for indices, chunk in length_sorted_batches(texts, lengths, batch_size):
+            try:
+                summaries = generate_batch(model, tokenizer, chunk)
+            except Exception as e:
+                logging.error(f"Error generating batch summary, retrying per article: {str(e)}")
+                summaries = []
+                for text in chunk:
+                    try:
+                        summaries.extend(generate_batch(model, tokenizer, [text]))
+                    except Exception as e:
+                        logging.error(f"Error generating summary: {str(e)}")
+                        summaries.append("")  # 빈 요약으로 대체
+            batches.append((indices, summaries))
+            progress.update(len(chunk))
+    return restore_order(len(texts), batches)
 
 def calculate_bleu_score(candidate, reference):
     try:
@@ -89,16 +129,21 @@ for model_name, model_path in MODELS.items():
     logging.info(f"\n🚀 {model_name} 모델 요약 수행 중...")
     try:
         tokenizer = AutoTokenizer.from_pretrained(model_path)
-        model = AutoModelForSeq2SeqLM.from_pretrained(model_path).to(device)
-        model.eval()
-
-        summaries = []
-        for text in tqdm(article_texts, desc=f"{model_name} 요약 중"):
-            try:
-                summaries.append(generate_summary(model, tokenizer, text))
-            except Exception as e:
-                logging.error(f"Error generating summary: {str(e)}")
-                summaries.append("")  # 빈 요약으로 대체
+        if model_name in ONNX_MODELS:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+            model = ORTModelForSeq2SeqLM.from_pretrained(model_path, provider="CPUExecutionProvider")
+        else:
+            model = AutoModelForSeq2SeqLM.from_pretrained(model_path).to(device)
+            model.eval()
+
+        start_time = time.perf_counter()
+        inputs = article_texts
+        if model_name in EXTRACTIVE_MODELS:
+            count_tokens = lambda sentences: token_lengths(tokenizer, sentences)
+            inputs = [preselect(text, EXTRACTIVE_MODELS[model_name], count_tokens) for text in article_texts]
+        summaries = generate_summaries(model, tokenizer, inputs, desc=f"{model_name} 요약 중")
+        seconds_per_article = (time.perf_counter() - start_time) / max(len(article_texts), 1)
+        all_summaries[model_name] = summaries
 
         # ROUGE 점수 계산
         rouge = Rouge()
@@ -124,7 +169,8 @@ for model_name, model_path in MODELS.items():
         all_results[model_name] = {
             "rouge": rouge_scores,
             "bleu": avg_bleu,
-            "meteor": avg_meteor
+            "meteor": avg_meteor,
+            "seconds_per_article": seconds_per_article
         }
     except Exception as e:
         logging.error(f"Error processing model {model_name}: {str(e)}")
@@ -141,6 +187,19 @@ for model_name in MODELS:
             logging.info(f"  {metric.upper()}: P={score['p']:.3f}, R={score['r']:.3f}, F1={score['f']:.3f}")
         logging.info(f"BLEU 점수: {all_results[model_name]['bleu']:.3f}")
         logging.info(f"METEOR 점수: {all_results[model_name]['meteor']:.3f}")
+        logging.info(f"기사당 요약 시간: {all_results[model_name]['seconds_per_article']:.3f}초")
+
+# ✅ ONNX 모델과 원본 PyTorch 모델의 요약 일치도 (원본 요약을 정답으로 둔 ROUGE) 및 속도 비교
+for onnx_name, base_name in ONNX_MODELS.items():
+    if onnx_name in all_summaries and base_name in all_summaries:
+        try:
+            pairs = [(o, b) for o, b in zip(all_summaries[onnx_name], all_summaries[base_name]) if o and b]
+            parity = Rouge().get_scores([o for o, _ in pairs], [b for _, b in pairs], avg=True)
+            speedup = all_results[base_name]["seconds_per_article"] / all_results[onnx_name]["seconds_per_article"]
+            logging.info(f"\n▶ {onnx_name} vs {base_name}: ROUGE-L F1={parity['rouge-l']['f']:.3f}, "
+                         f"속도 {speedup:.2f}배")
+        except Exception as e:
+            logging.error(f"ONNX parity calculation error: {str(e)}")
 
 # ✅ 결과 시각화
 try:
@@ -0,0 +1,88 @@
+### extractive.py (TF-IDF + TextRank 추출 요약으로 요약 모델 입력 줄이기)
+# news_scraper.SUMMARY_EXTRACTIVE_TOKENS(예: 512)보다 긴 기사는 점수(앞부분 문장 가산점 포함)가 높은 문장만
+# 토큰 예산 안에서 골라 원래 순서대로 요약 모델에 넣는다.
+# 품질 비교: evaluate_summarize.py의 Pretrained-Extractive-512 항목 (ROUGE, 기사당 시간)
+import re
+import numpy as np
+from text_chunking import split_sentences
+
+TEXTRANK_DAMPING = 0.85
+TEXTRANK_MAX_ITER = 50
+TEXTRANK_TOL = 1e-6
+LEAD_WEIGHT = 0.1  # 기사 앞부분 문장 가산점 비율 (역피라미드 구조)
+
+_WORD = re.compile(r"[가-힣]+|[A-Za-z]+|[0-9]+")
+
+def _features(sentence):
+    # 한국어는 조사/어미가 붙어 단어가 잘 겹치지 않으므로 단어 안의 글자 bigram을 함께 사용
+    features = []
+    for word in _WORD.findall(sentence.lower()):
+        features.append(word)
+        features.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return features
+
+def tfidf_matrix(sentences):
+    """문장 × 특징 TF-IDF 행렬 (행 단위 L2 정규화)"""
+    vocab = {}
+    rows, cols, values = [], [], []
+    for row, sentence in enumerate(sentences):
+        counts = {}
+        for feature in _features(sentence):
+            col = vocab.setdefault(feature, len(vocab))
+            counts[col] = counts.get(col, 0) + 1
+        for col, count in counts.items():
+            rows.append(row)
+            cols.append(col)
+            values.append(count)
+    matrix = np.zeros((len(sentences), max(len(vocab), 1)), dtype=np.float32)
+    matrix[rows, cols] = values
+    df = np.count_nonzero(matrix, axis=0)
+    matrix *= np.log((1 + len(sentences)) / (1 + df)) + 1
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+def textrank_scores(sentences):
+    """문장 간 코사인 유사도 그래프에서 TextRank(PageRank) 점수를 계산합니다."""
+    n = len(sentences)
+    if n <= 2:
+        return np.ones(n, dtype=np.float32)
+    matrix = tfidf_matrix(sentences)
+    similarity = matrix @ matrix.T
+    np.fill_diagonal(similarity, 0)
+    out_weight = similarity.sum(axis=1, keepdims=True)
+    # 다른 문장과 겹치는 특징이 없는 문장은 모든 문장으로 균등하게 연결
+    transition = np.where(out_weight > 0, similarity / np.where(out_weight == 0, 1, out_weight), 1.0 / n)
+    scores = np.full(n, 1.0 / n, dtype=np.float32)
+    for _ in range(TEXTRANK_MAX_ITER):
+        updated = (1 - TEXTRANK_DAMPING) / n + TEXTRANK_DAMPING * (transition.T @ scores)
+        if np.abs(updated - scores).sum() < TEXTRANK_TOL:
+            scores = updated
+            break
+        scores = updated
+    lead = 1.0 / (1 + np.arange(n))
+    return (1 - LEAD_WEIGHT) * scores / scores.max() + LEAD_WEIGHT * lead
+
+def select_sentences(sentences, lengths, token_budget):
+    """점수가 높은 문장부터 토큰 예산 안에서 고르고, 원래 순서대로 반환합니다."""
+    scores = textrank_scores(sentences)
+    chosen, used = [], 0
+    for i in np.argsort(-scores, kind="stable"):
+        if used + lengths[i] > token_budget:
+            continue
+        chosen.append(i)
+        used += lengths[i]
+    if not chosen:
+        # 예산보다 긴 문장뿐이면 가장 중요한 문장 하나만 사용 (추론 시 잘림)
+        chosen = [int(np.argmax(scores))]
+    return [sentences[i] for i in sorted(chosen)]
+
+def preselect(text, token_budget, count_tokens):
+    """본문이 token_budget보다 길면 핵심 문장만 남긴 본문을 반환합니다.
+    count_tokens(list[str]) -> list[int] 는 요약 모델 토크나이저 기준 길이를 돌려주는 함수입니다."""
+    sentences = split_sentences(text)
+    if len(sentences) <= 1:
+        return text
+    lengths = count_tokens(sentences)
+    if sum(lengths) <= token_budget:
+        return text
+    return " ".join(select_sentences(sentences, lengths, token_budget))
@@ -0,0 +1,158 @@
+### html_extractor.py (기사 제목/본문 추출 백엔드)
+# HTML_EXTRACTOR: selectolax / lxml / bs4(대상 하위 트리만 파싱) / auto(설치된 가장 빠른 백엔드, 기본값)
+# 모든 백엔드는 기존 BeautifulSoup .text와 같은 제목/본문을 반환한다.
+# 백엔드 비교 (초당 페이지 수, 최대 메모리, 기준 결과와의 불일치 수): python benchmarks/bench_html_extract.py
+import os
+from bs4 import BeautifulSoup, SoupStrainer
+
+# ✅ 추출 대상 (news_scraper.fetch_news의 기존 선택자와 동일한 우선순위)
+TITLE_IDS = ["title_area"]
+TITLE_CLASS = "media_end_headline"
+CONTENT_IDS = ["dic_area", "newsct_article"]
+# BeautifulSoup .text와 동일하게 스크립트/스타일 내용은 본문에서 제외
+SKIP_TAGS = {"script", "style", "template"}
+PRESERVE_WHITESPACE_TAGS = {"pre", "textarea"}
+_ASCII_SPACES = str.maketrans("", "", "\x20\x0a\x09\x0c\x0d")
+
+# auto: selectolax → lxml → bs4 순으로 설치된 백엔드 사용
+HTML_EXTRACTOR = os.getenv("HTML_EXTRACTOR", "auto")
+
+def _strip(node_text):
+    return node_text.strip() if node_text is not None else None
+
+def _soup_string(text, preserve):
+    # BeautifulSoup은 공백만 있는 문자열을 줄바꿈 포함 시 "\n", 아니면 " " 하나로 줄인다
+    if preserve or text.translate(_ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+# ✅ BeautifulSoup (html.parser) - 대상 id를 가진 하위 트리만 파싱
+_target_strainer = SoupStrainer(id=TITLE_IDS + CONTENT_IDS)
+
+def _find_bs4(soup):
+    title_tag = soup.select_one("h2#title_area") or soup.select_one(f"h2.{TITLE_CLASS}")
+    content_tag = soup.select_one("div#dic_area") or soup.select_one("div#newsct_article")
+    return title_tag, content_tag
+
+def extract_bs4(html):
+    title_tag, content_tag = _find_bs4(BeautifulSoup(html, "html.parser", parse_only=_target_strainer))
+    if title_tag is None:
+        # 제목이 class로만 표시된 페이지는 전체 문서를 다시 파싱
+        title_tag, content_tag = _find_bs4(BeautifulSoup(html, "html.parser"))
+    title = _strip(title_tag.text) if title_tag else None
+    content = _strip(content_tag.text) if content_tag else None
+    return title, content
+
+def extract_bs4_full(html):
+    """기존 fetch_news와 동일한 전체 문서 파싱 (벤치마크 기준값)"""
+    title_tag, content_tag = _find_bs4(BeautifulSoup(html, "html.parser"))
+    title = _strip(title_tag.text) if title_tag else None
+    content = _strip(content_tag.text) if content_tag else None
+    return title, content
+
+# ✅ lxml (libxml2 C 파서)
+_LXML_TITLE_XPATHS = [
+    f"//h2[@id='{TITLE_IDS[0]}']",
+    f"//h2[contains(concat(' ', normalize-space(@class), ' '), ' {TITLE_CLASS} ')]",
+]
+_LXML_CONTENT_XPATHS = [f"//div[@id='{content_id}']" for content_id in CONTENT_IDS]
+
+def _lxml_strings(node, preserve=False):
+    preserve = preserve or node.tag in PRESERVE_WHITESPACE_TAGS
+    if node.text:
+        yield _soup_string(node.text, preserve)
+    for child in node:
+        # 주석(tag가 문자열이 아님)과 스크립트류는 내용을 건너뛰고 뒤따르는 텍스트만 사용
+        if isinstance(child.tag, str) and child.tag not in SKIP_TAGS:
+            yield from _lxml_strings(child, preserve)
+        if child.tail:
+            yield _soup_string(child.tail, preserve)
+
+def _lxml_text(node):
+    return "".join(_lxml_strings(node))
+
+def _lxml_first(tree, xpaths):
+    for xpath in xpaths:
+        nodes = tree.xpath(xpath)
+        if nodes:
+            return nodes[0]
+    return None
+
+def extract_lxml(html):
+    import lxml.html
+    if not html.strip():
+        return None, None
+    try:
+        tree = lxml.html.fromstring(html)
+    except ValueError:
+        # XML 인코딩 선언이 있는 문자열은 bytes로 넘겨야 한다
+        tree = lxml.html.fromstring(html.encode("utf-8"))
+    title_node = _lxml_first(tree, _LXML_TITLE_XPATHS)
+    content_node = _lxml_first(tree, _LXML_CONTENT_XPATHS)
+    title = _strip(_lxml_text(title_node)) if title_node is not None else None
+    content = _strip(_lxml_text(content_node)) if content_node is not None else None
+    return title, content
+
+# ✅ selectolax (lexbor C 파서)
+def _selectolax_strings(node, preserve=False):
+    preserve = preserve or node.tag in PRESERVE_WHITESPACE_TAGS
+    for child in node.iter(include_text=True):
+        if child.tag == "-text":
+            text = child.text(deep=False)
+            if text:
+                yield _soup_string(text, preserve)
+        elif not child.tag.startswith("-") and child.tag not in SKIP_TAGS:
+            yield from _selectolax_strings(child, preserve)
+
+def _selectolax_text(node):
+    if node is None:
+        return None
+    return _strip("".join(_selectolax_strings(node)))
+
+def extract_selectolax(html):
+    from selectolax.lexbor import LexborHTMLParser
+    tree = LexborHTMLParser(html)
+    title_node = tree.css_first("h2#title_area") or tree.css_first(f"h2.{TITLE_CLASS}")
+    content_node = tree.css_first("div#dic_area") or tree.css_first("div#newsct_article")
+    return _selectolax_text(title_node), _selectolax_text(content_node)
+
+EXTRACTORS = {
+    "bs4": extract_bs4,
+    "bs4-full": extract_bs4_full,
+    "lxml": extract_lxml,
+    "selectolax": extract_selectolax,
+}
+
+def available_extractors():
+    """현재 환경에 설치된 백엔드 이름 목록"""
+    names = ["bs4", "bs4-full"]
+    try:
+        import lxml.html  # noqa: F401
+        names.append("lxml")
+    except ImportError:
+        pass
+    try:
+        import selectolax.lexbor  # noqa: F401
+        names.append("selectolax")
+    except ImportError:
+        pass
+    return names
+
+def get_extractor(name=None):
+    """이름으로 추출 함수를 반환합니다. auto면 설치된 가장 빠른 백엔드를 고릅니다."""
+    name = name or HTML_EXTRACTOR
+    if name == "auto":
+        available = available_extractors()
+        name = next(n for n in ("selectolax", "lxml", "bs4") if n in available)
+    if name not in EXTRACTORS:
+        raise ValueError(f"지원하지 않는 HTML 추출 백엔드입니다: {name}")
+    return EXTRACTORS[name]
+
+_extractor = None
+
+def extract_article(html):
+    """기사 HTML에서 (제목, 본문)을 추출합니다. 찾지 못한 항목은 None입니다."""
+    global _extractor
+    if _extractor is None:
+        _extractor = get_extractor()
+    return _extractor(html)
@@ -0,0 +1,193 @@
+### http_cache.py (조건부 GET을 지원하는 디스크 HTTP 캐시)
+import asyncio
+import os
+import sqlite3
+import threading
+import time
+import httpx
+from crawl_scheduler import crawl_fetch
+
+# ✅ 캐시 설정
+CACHE_PATH = os.getenv("HTTP_CACHE_PATH", "http_cache.sqlite3")
+CACHE_MAX_BYTES = int(os.getenv("HTTP_CACHE_MAX_BYTES", 512 * 1024 * 1024))  # 기본 512MB
+# revalidate: ETag/Last-Modified로 재검증 / replay: 캐시에서만 응답 (오프라인) / off: 캐시 미사용
+CACHE_MODE = os.getenv("HTTP_CACHE_MODE", "revalidate")
+EVICT_TARGET_RATIO = 0.9    # 용량을 넘으면 이 비율까지 줄여, put마다 삭제가 일어나지 않게 한다
+EVICT_BATCH = 64            # 삭제 쿼리 한 번에 지우는 최대 항목 수
+ACCESS_FLUSH_ITEMS = 256    # 적중 시각(accessed_at)은 모아 두었다가 이만큼 쌓이거나
+ACCESS_FLUSH_SECONDS = 30   # 이 시간이 지나면(또는 put 때) 한 번에 기록한다
+
+class HttpCache:
+    """URL별 본문과 검증자(ETag, Last-Modified)를 SQLite에 저장하고 LRU 방식으로 용량을 관리합니다.
+    전체 크기는 트리거가 갱신하는 http_cache_meta 행으로 추적하여 put마다 전체 테이블을 합산하지 않습니다."""
+
+    def __init__(self, path=CACHE_PATH, max_bytes=CACHE_MAX_BYTES):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache (
+                url TEXT PRIMARY KEY,
+                body BLOB NOT NULL,
+                content_type TEXT,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_accessed ON http_cache (accessed_at)")
+        # 전체 크기 (같은 파일을 쓰는 다른 프로세스의 변경도 트리거로 반영)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS http_cache_meta (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total_size INTEGER NOT NULL
+            )
+        """)
+        self.conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS http_cache_size_insert AFTER INSERT ON http_cache BEGIN
+                UPDATE http_cache_meta SET total_size = total_size + NEW.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS http_cache_size_update AFTER UPDATE OF size ON http_cache BEGIN
+                UPDATE http_cache_meta SET total_size = total_size + NEW.size - OLD.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS http_cache_size_delete AFTER DELETE ON http_cache BEGIN
+                UPDATE http_cache_meta SET total_size = total_size - OLD.size WHERE id = 0;
+            END;
+        """)
+        # 기존 캐시 파일은 처음 한 번만 합산
+        self.conn.execute("INSERT OR IGNORE INTO http_cache_meta (id, total_size) "
+                          "SELECT 0, COALESCE(SUM(size), 0) FROM http_cache")
+        self.conn.commit()
+        self._accessed = {}  # url -> 아직 기록하지 않은 적중 시각
+        self._flushed_at = time.monotonic()
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    def get(self, url):
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT body, content_type, etag, last_modified FROM http_cache WHERE url = ?", (url,)
+            ).fetchone()
+            if row:
+                # 적중마다 디스크에 쓰지 않고 모아서 기록한다 (LRU 순서는 그만큼 늦게 반영)
+                self._accessed[url] = time.time()
+                if (len(self._accessed) >= ACCESS_FLUSH_ITEMS
+                        or time.monotonic() - self._flushed_at >= ACCESS_FLUSH_SECONDS):
+                    self._flush_accessed()
+                    self.conn.commit()
+        if row is None:
+            return None
+        body, content_type, etag, last_modified = row
+        return {"body": body, "content_type": content_type, "etag": etag, "last_modified": last_modified}
+
+    def put(self, url, body, content_type=None, etag=None, last_modified=None):
+        with self.lock:
+            # REPLACE는 기존 행을 지우고 다시 넣어 삭제 트리거가 돌지 않으므로 UPSERT를 사용
+            self.conn.execute(
+                "INSERT INTO http_cache (url, body, content_type, etag, last_modified, size, accessed_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?) ON CONFLICT (url) DO UPDATE SET body = excluded.body, "
+                "content_type = excluded.content_type, etag = excluded.etag, "
+                "last_modified = excluded.last_modified, size = excluded.size, accessed_at = excluded.accessed_at",
+                (url, body, content_type, etag, last_modified, len(body), time.time()),
+            )
+            self._accessed.pop(url, None)
+            self._flush_accessed()
+            self._evict()
+            self.conn.commit()
+
+    def _flush_accessed(self):
+        if self._accessed:
+            self.conn.executemany("UPDATE http_cache SET accessed_at = ? WHERE url = ?",
+                                  [(accessed_at, url) for url, accessed_at in self._accessed.items()])
+            self._accessed.clear()
+        self._flushed_at = time.monotonic()
+
+    def _total_size(self):
+        return self.conn.execute("SELECT total_size FROM http_cache_meta WHERE id = 0").fetchone()[0]
+
+    def _evict(self):
+        # 용량 초과 시 가장 오래 사용되지 않은 항목부터 EVICT_TARGET_RATIO까지 묶음으로 삭제 (LRU)
+        if self._total_size() <= self.max_bytes:
+            return
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        while self._total_size() > target:
+            deleted = self.conn.execute(
+                "DELETE FROM http_cache WHERE url IN "
+                "(SELECT url FROM http_cache ORDER BY accessed_at LIMIT ?)", (EVICT_BATCH,)
+            ).rowcount
+            if not deleted:
+                break
+
+    def stats(self):
+        with self.lock:
+            entries = self.conn.execute("SELECT COUNT(*) FROM http_cache").fetchone()[0]
+            total = self._total_size()
+        return {
+            "mode": CACHE_MODE,
+            "entries": entries,
+            "bytes": total,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "revalidated": self.revalidated,
+            "misses": self.misses,
+        }
+
+_cache = None
+
+def get_http_cache():
+    """프로세스에서 공유되는 HTTP 캐시를 반환합니다 (없으면 생성)."""
+    global _cache
+    if _cache is None:
+        _cache = HttpCache()
+    return _cache
+
+def _cached_response(url, entry, status_code=200):
+    headers = {"content-type": entry["content_type"]} if entry and entry["content_type"] else {}
+    return httpx.Response(
+        status_code,
+        content=entry["body"] if entry else b"",
+        headers=headers,
+        request=httpx.Request("GET", url),
+    )
+
+async def cached_fetch(url, mode=None):
+    """캐시를 거쳐 GET 요청을 보냅니다. 304 응답이면 저장된 본문으로 200 응답을 돌려줍니다."""
+    mode = mode or CACHE_MODE
+    if mode == "off":
+        return await crawl_fetch(url)
+
+    cache = get_http_cache()
+    entry = await asyncio.to_thread(cache.get, url)
+
+    if mode == "replay":
+        # 오프라인 재현 모드: 네트워크 요청 없이 캐시에 있는 항목만 반환
+        if entry is None:
+            cache.misses += 1
+            return _cached_response(url, None, status_code=504)
+        cache.hits += 1
+        return _cached_response(url, entry)
+
+    headers = {}
+    if entry:
+        if entry["etag"]:
+            headers["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            headers["If-Modified-Since"] = entry["last_modified"]
+
+    response = await crawl_fetch(url, headers=headers)
+    if response.status_code == 304 and entry:
+        cache.revalidated += 1
+        return _cached_response(url, entry)
+
+    cache.misses += 1
+    if response.status_code == 200:
+        await asyncio.to_thread(
+            cache.put, url, response.content,
+            response.headers.get("content-type"),
+            response.headers.get("etag"),
+            response.headers.get("last-modified"),
+        )
+    return response
@@ -0,0 +1,65 @@
+### http_client.py (공유 비동기 HTTP 클라이언트)
+import asyncio
+import httpx
+
+# ✅ 커넥션 풀 / 타임아웃 설정
+DEFAULT_HEADERS = {"User-Agent": "Mozilla/5.0"}
+MAX_CONNECTIONS = 20             # 전체 동시 커넥션 상한
+MAX_KEEPALIVE_CONNECTIONS = 10   # 유휴 상태로 유지할 keep-alive 커넥션 수
+KEEPALIVE_EXPIRY = 30.0          # 유휴 커넥션 유지 시간 (초)
+CONNECT_TIMEOUT = 5.0
+READ_TIMEOUT = 15.0
+POOL_TIMEOUT = 10.0
+
+try:
+    import h2  # noqa: F401  (HTTP/2 지원 여부 확인용)
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+# ✅ 이벤트 루프별 클라이언트 (ArticleScraper.job은 실행마다 새 루프를 만든다)
+_clients = {}
+
+def build_http_client(max_connections=MAX_CONNECTIONS,
+                      max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                      keepalive_expiry=KEEPALIVE_EXPIRY,
+                      connect_timeout=CONNECT_TIMEOUT,
+                      read_timeout=READ_TIMEOUT,
+                      pool_timeout=POOL_TIMEOUT,
+                      http2=None):
+    """설정값으로 커넥션 풀을 가진 httpx.AsyncClient를 생성합니다."""
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_keepalive_connections,
+        keepalive_expiry=keepalive_expiry,
+    )
+    timeout = httpx.Timeout(
+        connect=connect_timeout, read=read_timeout, write=read_timeout, pool=pool_timeout
+    )
+    return httpx.AsyncClient(
+        headers=DEFAULT_HEADERS,
+        limits=limits,
+        timeout=timeout,
+        http2=HTTP2_AVAILABLE if http2 is None else http2,
+        follow_redirects=True,
+    )
+
+def get_http_client():
+    """현재 이벤트 루프에서 공유되는 HTTP 클라이언트를 반환합니다 (없으면 생성)."""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = build_http_client()
+        _clients[loop] = client
+    return client
+
+async def close_http_client():
+    """현재 이벤트 루프의 공유 클라이언트를 닫습니다. 루프 종료 전에 호출합니다."""
+    loop = asyncio.get_running_loop()
+    client = _clients.pop(loop, None)
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+async def fetch(url, **kwargs):
+    """공유 클라이언트로 GET 요청을 보냅니다."""
+    return await get_http_client().get(url, **kwargs)
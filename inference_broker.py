@@ -0,0 +1,110 @@
+### inference_broker.py (동시 요청을 마이크로 배치로 묶는 추론 브로커)
+import asyncio
+import time
+from metrics import Histogram
+
+# ✅ 히스토그램 구간
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64]
+LATENCY_BUCKETS_MS = [5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+
+class _LoopState:
+    def __init__(self):
+        self.pending = []      # (item, future, enqueued_at)
+        self.running = 0
+        self.timer = None
+
+class InferenceBroker:
+    """여러 호출자가 보낸 단건 추론 요청을 모아 batch_fn(items) 한 번으로 처리합니다.
+    첫 요청 후 max_wait초가 지나거나 max_batch_size개가 모이면 배치를 실행하며,
+    배치가 실행 중인 동안 들어온 요청은 다음 배치로 모입니다.
+    배치는 executor(없으면 이벤트 루프의 기본 실행기)에서 실행되고,
+    배치로 보내기 전에 취소된 요청(예: 마감 시간 초과)은 대기열에서 빠져 실행되지 않습니다."""
+
+    def __init__(self, name, batch_fn, max_batch_size=8, max_wait=0.02, max_concurrent_batches=1, executor=None):
+        self.name = name
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.max_concurrent_batches = max_concurrent_batches
+        self.executor = executor
+        self.batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self.queue_latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self.batch_latency_ms = Histogram(LATENCY_BUCKETS_MS)
+        self._states = {}
+
+    def _state(self):
+        # 이벤트 루프마다 대기열을 따로 둔다 (닫힌 루프의 상태는 정리)
+        loop = asyncio.get_running_loop()
+        for closed in [l for l in self._states if l.is_closed()]:
+            del self._states[closed]
+        state = self._states.get(loop)
+        if state is None:
+            state = self._states[loop] = _LoopState()
+        return loop, state
+
+    async def submit(self, item):
+        """항목 하나를 추론 대기열에 넣고 결과를 기다립니다."""
+        loop, state = self._state()
+        future = loop.create_future()
+        entry = (item, future, time.perf_counter())
+        state.pending.append(entry)
+        if len(state.pending) >= self.max_batch_size:
+            self._dispatch(loop, state)
+        elif state.timer is None:
+            state.timer = loop.call_later(self.max_wait, self._dispatch, loop, state)
+        try:
+            return await future
+        except asyncio.CancelledError:
+            # 아직 배치로 보내지 않은 요청은 대기열에서 빼서 다음 배치 자리를 차지하지 않게 한다
+            if entry in state.pending:
+                state.pending.remove(entry)
+            raise
+
+    async def submit_many(self, items):
+        return list(await asyncio.gather(*(self.submit(item) for item in items)))
+
+    def _dispatch(self, loop, state):
+        if state.timer is not None:
+            state.timer.cancel()
+            state.timer = None
+        while state.pending and state.running < self.max_concurrent_batches:
+            batch = state.pending[:self.max_batch_size]
+            del state.pending[:self.max_batch_size]
+            state.running += 1
+            loop.create_task(self._run_batch(loop, state, batch))
+
+    async def _run_batch(self, loop, state, batch):
+        batch = [entry for entry in batch if not entry[1].cancelled()]
+        try:
+            if not batch:
+                return
+            started = time.perf_counter()
+            for _, _, enqueued_at in batch:
+                self.queue_latency_ms.observe((started - enqueued_at) * 1000)
+            self.batch_sizes.observe(len(batch))
+            try:
+                results = await loop.run_in_executor(self.executor, self.batch_fn, [item for item, _, _ in batch])
+            except Exception as e:
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                return
+            finally:
+                self.batch_latency_ms.observe((time.perf_counter() - started) * 1000)
+            for (_, future, _), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+        finally:
+            state.running -= 1
+            # 실행 중에 쌓인 요청은 이미 기다렸으므로 바로 다음 배치로 보낸다
+            if state.pending:
+                self._dispatch(loop, state)
+
+    def stats(self):
+        return {
+            "max_batch_size": self.max_batch_size,
+            "max_wait_ms": self.max_wait * 1000,
+            "batch_size": self.batch_sizes.snapshot(),
+            "queue_latency_ms": self.queue_latency_ms.snapshot(),
+            "batch_latency_ms": self.batch_latency_ms.snapshot(),
+        }
@@ -0,0 +1,228 @@
+### inference_cache.py (본문 해시 기반 요약/감성 분석 결과 캐시)
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+
+# ✅ 캐시 설정
+INFERENCE_CACHE_PATH = os.getenv("INFERENCE_CACHE_PATH", "inference_cache.sqlite3")
+INFERENCE_CACHE_MAX_BYTES = int(os.getenv("INFERENCE_CACHE_MAX_BYTES", 128 * 1024 * 1024))  # 디스크 계층, 기본 128MB
+INFERENCE_CACHE_MEMORY_ITEMS = int(os.getenv("INFERENCE_CACHE_MEMORY_ITEMS", 4096))  # 메모리 LRU 계층 항목 수
+INFERENCE_CACHE_ENABLED = os.getenv("INFERENCE_CACHE", "on") != "off"
+EVICT_TARGET_RATIO = 0.9    # 디스크 용량을 넘으면 이 비율까지 줄여, put마다 삭제가 일어나지 않게 한다
+EVICT_BATCH = 256           # 삭제 쿼리 한 번에 지우는 최대 항목 수
+ACCESS_FLUSH_ITEMS = 256    # 디스크 적중 시각은 모아 두었다가 이만큼 쌓이거나
+ACCESS_FLUSH_SECONDS = 30   # 이 시간이 지나면(또는 put 때) 한 번에 기록한다
+
+def normalize_text(text):
+    """공백/유니코드 표현 차이만 있는 본문이 같은 키를 갖도록 정규화합니다."""
+    return re.sub(r"\s+", " ", unicodedata.normalize("NFC", text)).strip()
+
+def cache_key(text, model, config):
+    """정규화된 본문 + 모델 이름 + 생성 설정의 SHA-256"""
+    digest = hashlib.sha256()
+    digest.update(model.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(json.dumps(config, sort_keys=True, ensure_ascii=False).encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(normalize_text(text).encode("utf-8"))
+    return digest.hexdigest()
+
+class InferenceCache:
+    """메모리 LRU와 SQLite 디스크 계층으로 추론 결과를 저장합니다.
+    값은 JSON으로 저장하며, 항목마다 계산에 걸린 시간을 함께 기록하여 적중 시 절약한 시간을 집계합니다.
+    디스크 전체 크기는 트리거가 갱신하는 inference_cache_meta 행으로 추적합니다."""
+
+    def __init__(self, name, path=INFERENCE_CACHE_PATH, max_bytes=INFERENCE_CACHE_MAX_BYTES,
+                 memory_items=INFERENCE_CACHE_MEMORY_ITEMS):
+        self.name = name
+        self.path = path
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self.memory = OrderedDict()  # key -> (value, cost)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS inference_cache (
+                key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                value TEXT NOT NULL,
+                cost REAL NOT NULL,
+                size INTEGER NOT NULL,
+                accessed_at REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS idx_inference_cache_accessed ON inference_cache (accessed_at)")
+        # 전체 크기 (같은 파일을 쓰는 다른 모델 캐시 / 프로세스의 변경도 트리거로 반영)
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS inference_cache_meta (
+                id INTEGER PRIMARY KEY CHECK (id = 0),
+                total_size INTEGER NOT NULL
+            )
+        """)
+        self.conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS inference_cache_size_insert AFTER INSERT ON inference_cache BEGIN
+                UPDATE inference_cache_meta SET total_size = total_size + NEW.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS inference_cache_size_update AFTER UPDATE OF size ON inference_cache BEGIN
+                UPDATE inference_cache_meta SET total_size = total_size + NEW.size - OLD.size WHERE id = 0;
+            END;
+            CREATE TRIGGER IF NOT EXISTS inference_cache_size_delete AFTER DELETE ON inference_cache BEGIN
+                UPDATE inference_cache_meta SET total_size = total_size - OLD.size WHERE id = 0;
+            END;
+        """)
+        # 기존 캐시 파일은 처음 한 번만 합산
+        self.conn.execute("INSERT OR IGNORE INTO inference_cache_meta (id, total_size) "
+                          "SELECT 0, COALESCE(SUM(size), 0) FROM inference_cache")
+        self.conn.commit()
+        self._accessed = {}  # key -> 아직 기록하지 않은 디스크 적중 시각
+        self._flushed_at = time.monotonic()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.saved_seconds = 0.0
+
+    def _remember(self, key, value, cost):
+        self.memory[key] = (value, cost)
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_items:
+            self.memory.popitem(last=False)
+
+    def get_many(self, keys):
+        """키 목록에 대해 {key: value}를 반환합니다 (없는 키는 제외)."""
+        found = {}
+        with self.lock:
+            missing = []
+            for key in keys:
+                if key in self.memory:
+                    value, cost = self.memory[key]
+                    self.memory.move_to_end(key)
+                    found[key] = value
+                    self.memory_hits += 1
+                    self.saved_seconds += cost
+                else:
+                    missing.append(key)
+            if missing:
+                placeholders = ",".join("?" * len(missing))
+                rows = self.conn.execute(
+                    f"SELECT key, value, cost FROM inference_cache WHERE key IN ({placeholders})", missing
+                ).fetchall()
+                # 적중마다 디스크에 쓰지 않고 모아서 기록한다 (LRU 순서는 그만큼 늦게 반영)
+                now = time.time()
+                for key, _, _ in rows:
+                    self._accessed[key] = now
+                if self._accessed and (len(self._accessed) >= ACCESS_FLUSH_ITEMS
+                                       or time.monotonic() - self._flushed_at >= ACCESS_FLUSH_SECONDS):
+                    self._flush_accessed()
+                    self.conn.commit()
+                for key, value, cost in rows:
+                    found[key] = json.loads(value)
+                    self._remember(key, found[key], cost)
+                    self.disk_hits += 1
+                    self.saved_seconds += cost
+                self.misses += len(missing) - len(rows)
+        return found
+
+    def put_many(self, entries):
+        """(key, value, cost) 목록을 두 계층에 저장합니다."""
+        if not entries:
+            return
+        now = time.time()
+        rows = []
+        with self.lock:
+            for key, value, cost in entries:
+                self._remember(key, value, cost)
+                data = json.dumps(value, ensure_ascii=False)
+                rows.append((key, self.name, data, cost, len(data.encode("utf-8")), now))
+                self._accessed.pop(key, None)
+            # REPLACE는 기존 행을 지우고 다시 넣어 삭제 트리거가 돌지 않으므로 UPSERT를 사용
+            self.conn.executemany(
+                "INSERT INTO inference_cache (key, name, value, cost, size, accessed_at) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET name = excluded.name, value = excluded.value, "
+                "cost = excluded.cost, size = excluded.size, accessed_at = excluded.accessed_at",
+                rows,
+            )
+            self._flush_accessed()
+            self._evict()
+            self.conn.commit()
+
+    def _flush_accessed(self):
+        if self._accessed:
+            self.conn.executemany("UPDATE inference_cache SET accessed_at = ? WHERE key = ?",
+                                  [(accessed_at, key) for key, accessed_at in self._accessed.items()])
+            self._accessed.clear()
+        self._flushed_at = time.monotonic()
+
+    def _total_size(self):
+        return self.conn.execute("SELECT total_size FROM inference_cache_meta WHERE id = 0").fetchone()[0]
+
+    def _evict(self):
+        # 디스크 용량 초과 시 가장 오래 사용되지 않은 항목부터 EVICT_TARGET_RATIO까지 묶음으로 삭제 (LRU)
+        if self._total_size() <= self.max_bytes:
+            return
+        target = self.max_bytes * EVICT_TARGET_RATIO
+        while self._total_size() > target:
+            deleted = self.conn.execute(
+                "DELETE FROM inference_cache WHERE key IN "
+                "(SELECT key FROM inference_cache ORDER BY accessed_at LIMIT ?)", (EVICT_BATCH,)
+            ).rowcount
+            if not deleted:
+                break
+
+    def cached_batch(self, texts, model, config, compute, cacheable=lambda value: True):
+        """texts 중 캐시에 없는 항목만 compute(missing_texts)로 계산하고 입력 순서대로 결과를 반환합니다.
+        같은 본문이 여러 번 들어오면 한 번만 계산하며, cacheable이 거짓인 결과(실패 등)는 저장하지 않습니다."""
+        if not INFERENCE_CACHE_ENABLED or not texts:
+            return compute(list(texts))
+        keys = [cache_key(text, model, config) for text in texts]
+        found = self.get_many(list(dict.fromkeys(keys)))
+
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key not in found and key not in pending:
+                pending[key] = text
+        if pending:
+            started = time.perf_counter()
+            computed = compute(list(pending.values()))
+            cost = (time.perf_counter() - started) / len(pending)
+            entries = []
+            for key, value in zip(pending, computed):
+                found[key] = value
+                if value is not None and cacheable(value):
+                    entries.append((key, value, cost))
+            self.put_many(entries)
+        return [found[key] for key in keys]
+
+    def stats(self):
+        with self.lock:
+            entries, total = self.conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM inference_cache WHERE name = ?", (self.name,)
+            ).fetchone()
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            return {
+                "enabled": INFERENCE_CACHE_ENABLED,
+                "memory_entries": len(self.memory),
+                "disk_entries": entries,
+                "disk_bytes": total,
+                "max_bytes": self.max_bytes,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.memory_hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "saved_seconds": round(self.saved_seconds, 2),
+            }
+
+_caches = {}
+_caches_lock = threading.Lock()
+
+def get_inference_cache(name):
+    """모델별로 프로세스에서 공유되는 추론 캐시를 반환합니다 (없으면 생성)."""
+    with _caches_lock:
+        if name not in _caches:
+            _caches[name] = InferenceCache(name)
+        return _caches[name]
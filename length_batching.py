@@ -0,0 +1,34 @@
+### length_batching.py (길이순 배치 구성으로 패딩 낭비 줄이기)
+# 배치 안에서는 가장 긴 입력 길이에 맞춰 패딩되므로, 길이가 비슷한 입력끼리 묶어 낭비되는 연산을 줄인다.
+
+def token_lengths(tokenizer, texts, max_length=None):
+    """토크나이저 기준 입력 길이 (max_length로 잘리는 길이까지만 계산)"""
+    if not texts:
+        return []
+    encoded = tokenizer(list(texts), truncation=max_length is not None, max_length=max_length)
+    return [len(ids) for ids in encoded["input_ids"]]
+
+def length_sorted_batches(items, lengths, batch_size, max_tokens=None):
+    """길이순으로 정렬한 뒤 (원래 인덱스 목록, 항목 목록) 배치를 만듭니다.
+    max_tokens가 주어지면 배치의 (최대 길이 × 항목 수)가 이를 넘지 않도록 짧은 입력은 더 많이, 긴 입력은 더 적게 묶습니다."""
+    order = sorted(range(len(items)), key=lambda i: lengths[i])
+    batch = []
+    for i in order:
+        if batch:
+            # 정렬되어 있으므로 현재 항목이 배치의 최대 길이
+            too_many = len(batch) >= batch_size
+            too_long = max_tokens is not None and lengths[i] * (len(batch) + 1) > max_tokens
+            if too_many or too_long:
+                yield batch, [items[j] for j in batch]
+                batch = []
+        batch.append(i)
+    if batch:
+        yield batch, [items[j] for j in batch]
+
+def restore_order(size, batches):
+    """(원래 인덱스 목록, 결과 목록) 배치들을 원래 입력 순서의 결과 리스트로 되돌립니다."""
+    results = [None] * size
+    for indices, outputs in batches:
+        for i, output in zip(indices, outputs):
+            results[i] = output
+    return results
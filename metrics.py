@@ -0,0 +1,28 @@
+### metrics.py (지표 수집용 공용 히스토그램)
+import bisect
+import threading
+
+class Histogram:
+    """구간별 누적 없는 단순 히스토그램 (마지막 구간은 +Inf)"""
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0
+        self.sum = 0.0
+        self.lock = threading.Lock()
+
+    def observe(self, value):
+        with self.lock:
+            self.counts[bisect.bisect_left(self.buckets, value)] += 1
+            self.total += 1
+            self.sum += value
+
+    def snapshot(self):
+        with self.lock:
+            labels = [f"<={b}" for b in self.buckets] + [f">{self.buckets[-1]}"]
+            return {
+                "count": self.total,
+                "mean": round(self.sum / self.total, 2) if self.total else 0.0,
+                "buckets": dict(zip(labels, self.counts)),
+            }
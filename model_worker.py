@@ -0,0 +1,235 @@
+### model_worker.py (별도 프로세스에서 모델 추론을 수행하는 워커 풀)
+import atexit
+import os
+import queue
+import struct
+import subprocess
+import sys
+import threading
+from runtime_config import configure_worker_process
+
+# ✅ 워커 설정
+# inprocess: FastAPI/크롤러 프로세스 안에서 추론 / workers: 별도 추론 워커 프로세스 사용
+INFERENCE_BACKEND = os.getenv("INFERENCE_BACKEND", "inprocess")
+INFERENCE_WORKERS = int(os.getenv("INFERENCE_WORKERS", 2))
+# 마감 시간을 넘겨 더 가벼운 프로파일로 다시 요약하는 요청 전용 예비 워커 수 (0이면 일반 워커와 공유)
+INFERENCE_FALLBACK_WORKERS = int(os.getenv("INFERENCE_FALLBACK_WORKERS", 1))
+# 워커별 스레드 수와 코어 고정은 runtime_config.py 설정을 따른다
+
+# ✅ IPC 바이너리 프로토콜 (워커의 stdin/stdout 위에서 [len:u32] 프레임으로 주고받음)
+# 요청: [op:u8][request_id:u32][count:u16][option_len:u8][option utf-8] + count × ([len:u32][utf-8 텍스트])
+#       (option은 요약 생성 프로파일 이름, 감성 분석은 빈 문자열)
+# 응답: [status:u8][request_id:u32][count:u16] + 요약은 count × ([len:u32][utf-8]),
+#       감성 분석은 count × ([label:i8][score:f32]) (label -1은 실패), 오류는 [len:u32][utf-8 메시지]
+OP_SUMMARIZE = 1
+OP_CLASSIFY = 2
+STATUS_OK = 0
+STATUS_ERROR = 1
+SENTIMENT_LABELS = ["부정", "중립", "긍정", "알 수 없음"]
+
+_HEADER = struct.Struct("!BIH")
+_OPTION_LENGTH = struct.Struct("!B")
+_LENGTH = struct.Struct("!I")
+_SENTIMENT = struct.Struct("!bf")
+
+def _pack_texts(texts):
+    parts = []
+    for text in texts:
+        data = text.encode("utf-8")
+        parts.append(_LENGTH.pack(len(data)))
+        parts.append(data)
+    return parts
+
+def _unpack_texts(data, offset, count):
+    texts = []
+    for _ in range(count):
+        (length,) = _LENGTH.unpack_from(data, offset)
+        offset += _LENGTH.size
+        texts.append(bytes(data[offset:offset + length]).decode("utf-8"))
+        offset += length
+    return texts, offset
+
+def encode_request(op, request_id, texts, option=""):
+    option = option.encode("utf-8")
+    return b"".join([_HEADER.pack(op, request_id, len(texts)), _OPTION_LENGTH.pack(len(option)), option]
+                    + _pack_texts(texts))
+
+def decode_request(data):
+    op, request_id, count = _HEADER.unpack_from(data, 0)
+    offset = _HEADER.size
+    (option_length,) = _OPTION_LENGTH.unpack_from(data, offset)
+    offset += _OPTION_LENGTH.size
+    option = bytes(data[offset:offset + option_length]).decode("utf-8")
+    texts, _ = _unpack_texts(data, offset + option_length, count)
+    return op, request_id, option, texts
+
+def encode_response(op, request_id, results):
+    if op == OP_SUMMARIZE:
+        body = _pack_texts(results)
+    else:
+        body = []
+        for result in results:
+            if result is None:
+                body.append(_SENTIMENT.pack(-1, 0.0))
+            else:
+                label, score = result
+                body.append(_SENTIMENT.pack(SENTIMENT_LABELS.index(label), score))
+    return b"".join([_HEADER.pack(STATUS_OK, request_id, len(results))] + body)
+
+def encode_error(request_id, message):
+    return b"".join([_HEADER.pack(STATUS_ERROR, request_id, 1)] + _pack_texts([message]))
+
+def decode_response(op, data):
+    status, request_id, count = _HEADER.unpack_from(data, 0)
+    offset = _HEADER.size
+    if status == STATUS_ERROR:
+        (message,), _ = _unpack_texts(data, offset, 1)
+        raise RuntimeError(f"추론 워커 오류: {message}")
+    if op == OP_SUMMARIZE:
+        results, _ = _unpack_texts(data, offset, count)
+        return request_id, results
+    results = []
+    for _ in range(count):
+        label, score = _SENTIMENT.unpack_from(data, offset)
+        offset += _SENTIMENT.size
+        results.append(None if label < 0 else (SENTIMENT_LABELS[label], score))
+    return request_id, results
+
+# ✅ 프레임 입출력 ([len:u32] + 메시지)
+def _write_frame(stream, payload):
+    stream.write(_LENGTH.pack(len(payload)))
+    stream.write(payload)
+    stream.flush()
+
+def _read_exact(stream, size):
+    data = stream.read(size)
+    if len(data) < size:
+        raise EOFError("추론 워커 연결이 끊어졌습니다.")
+    return data
+
+def _read_frame(stream):
+    (length,) = _LENGTH.unpack(_read_exact(stream, _LENGTH.size))
+    return _read_exact(stream, length)
+
+# ✅ 워커 프로세스 (python model_worker.py <워커 번호> <워커 수> 로 실행)
+def _worker_main(index, workers):
+    # stdin/stdout은 프로토콜 전용으로 쓰고, 라이브러리 출력은 stderr로 보낸다
+    requests, responses = sys.stdin.buffer, sys.stdout.buffer
+    sys.stdout = sys.stderr
+    # 코어 고정과 스레드 수 설정은 torch를 처음 import하기 전에 한다
+    settings = configure_worker_process(index, workers)
+    print(f"추론 워커 {index}: {settings}", file=sys.stderr)
+    import news_scraper
+    news_scraper.preload_models()  # 모델은 워커마다 한 번만 로드하고, 준비가 끝난 뒤 ready를 보낸다
+
+    # 캐시는 요청을 보내는 쪽에서 확인하므로 워커는 모델로 바로 계산한다
+    handlers = {
+        OP_SUMMARIZE: lambda texts, profile: news_scraper._summarize_local(texts, profile=profile),
+        OP_CLASSIFY: lambda texts, _: news_scraper._classify_local(texts),
+    }
+    _write_frame(responses, b"ready")
+    while True:
+        try:
+            data = _read_frame(requests)
+        except EOFError:
+            break
+        request_id = 0
+        try:
+            op, request_id, option, texts = decode_request(data)
+            _write_frame(responses, encode_response(op, request_id, handlers[op](texts, option)))
+        except Exception as e:
+            _write_frame(responses, encode_error(request_id, str(e)))
+
+class _Worker:
+    def __init__(self, index, workers):
+        # 워커 안에서는 항상 직접 추론한다
+        self.index = index
+        env = dict(os.environ, INFERENCE_BACKEND="inprocess", TOKENIZERS_PARALLELISM="false")
+        self.process = subprocess.Popen([sys.executable, os.path.abspath(__file__), str(index), str(workers)],
+                                        stdin=subprocess.PIPE, stdout=subprocess.PIPE, env=env,
+                                        cwd=os.path.dirname(os.path.abspath(__file__)))
+        _read_frame(self.process.stdout)  # 모델 로드 완료 대기
+
+    def request(self, payload):
+        _write_frame(self.process.stdin, payload)
+        return _read_frame(self.process.stdout)
+
+    def close(self):
+        try:
+            self.process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self.process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self.process.terminate()
+
+class ModelWorkerPool:
+    """모델을 한 번씩 로드한 워커 프로세스들에 요약/감성 분석 배치를 나눠 보냅니다 (스레드 안전).
+    fallback=True 요청은 예비 워커에서 실행되어, 일반 워커에서 진행 중인 긴 배치 뒤에 줄서지 않습니다."""
+
+    def __init__(self, workers=INFERENCE_WORKERS, fallback_workers=INFERENCE_FALLBACK_WORKERS):
+        self.size = workers + fallback_workers  # 코어는 예비 워커까지 포함해 나눠 고정
+        self.idle = queue.Queue()
+        self.fallback_idle = queue.Queue() if fallback_workers else self.idle
+        self.lock = threading.Lock()
+        self.request_id = 0
+        self.workers = []
+        for index in range(self.size):
+            worker = _Worker(index, self.size)
+            self.workers.append(worker)
+            (self.idle if index < workers else self.fallback_idle).put(worker)
+
+    def _next_request_id(self):
+        with self.lock:
+            self.request_id = (self.request_id + 1) % (2 ** 32)
+            return self.request_id
+
+    def _call(self, op, texts, option="", fallback=False):
+        idle = self.fallback_idle if fallback else self.idle
+        worker = idle.get()
+        try:
+            request_id = self._next_request_id()
+            request = encode_request(op, request_id, list(texts), option)
+            response_id, results = decode_response(op, worker.request(request))
+            if response_id != request_id:
+                raise RuntimeError("추론 워커 응답 순서가 맞지 않습니다.")
+            return results
+        except (EOFError, OSError):
+            # 워커가 죽었으면 새로 띄우고 이번 요청은 실패 처리
+            worker.close()
+            self.workers.remove(worker)
+            worker = _Worker(worker.index, self.size)
+            self.workers.append(worker)
+            raise RuntimeError("추론 워커가 종료되어 다시 시작했습니다.")
+        finally:
+            idle.put(worker)
+
+    def summarize(self, texts, profile, fallback=False):
+        return self._call(OP_SUMMARIZE, texts, profile, fallback)
+
+    def classify(self, texts):
+        return self._call(OP_CLASSIFY, texts)
+
+    def close(self):
+        for worker in self.workers:
+            worker.close()
+        self.workers = []
+
+_pool = None
+_pool_lock = threading.Lock()
+
+def get_worker_pool():
+    """프로세스에서 공유되는 추론 워커 풀을 반환합니다 (처음 호출 시 워커 시작)."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ModelWorkerPool()
+            atexit.register(_pool.close)
+    return _pool
+
+def use_workers():
+    return INFERENCE_BACKEND == "workers"
+
+if __name__ == "__main__":
+    _worker_main(int(sys.argv[1]), int(sys.argv[2]))
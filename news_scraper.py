@@ -1,7 +1,24 @@
-import requests
 from bs4 import BeautifulSoup
-from transformers import pipeline
 import asyncio
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http_cache import cached_fetch
+from html_extractor import extract_article
+from url_filter import known_urls
+from crawl_cursor import get_crawl_cursor
+from staged_pipeline import Stage, run_pipeline
+from inference_broker import InferenceBroker
+from model_worker import INFERENCE_WORKERS, get_worker_pool, use_workers
+from runtime_config import configure_inprocess_inference, runtime_settings
+from inference_cache import get_inference_cache
+from onnx_models import load_onnx_pipeline
+from length_batching import length_sorted_batches, restore_order, token_lengths
+from text_chunking import chunk_sentences, lead_text, split_sentences
+from extractive import preselect
+from db import load_known_urls, get_existing_urls
 
 # ✅ 네이버 뉴스 섹션 URL 매핑
 SECTION_URLS = {
@@ -15,74 +32,470 @@ SECTION_URLS = {
 
 # ✅ 기사 크롤링 (비동기)
 async def fetch_news(url):
-    headers = {"User-Agent": "Mozilla/5.0"}
-    response = await asyncio.to_thread(requests.get, url, headers=headers)
+    response = await cached_fetch(url)
     if response.status_code == 200:
-        soup = BeautifulSoup(response.text, "html.parser")
-        title_tag = soup.select_one("h2#title_area") or soup.select_one("h2.media_end_headline")
-        title = title_tag.text.strip() if title_tag else "제목 없음"
-        content_tag = soup.select_one("div#dic_area") or soup.select_one("div#newsct_article")
-        content = content_tag.text.strip() if content_tag else "본문 없음"
-        return title, content
+        title, content = extract_article(response.text)
+        return (title if title is not None else "제목 없음",
+                content if content is not None else "본문 없음")
     return "페이지 요청 실패", "본문 없음"
 
-# ✅ 기사 요약 모델 로드
-summarizer = pipeline("summarization", model="digit82/kobart-summarization", device=-1)
+# ✅ 배치 추론 설정
+SUMMARY_BATCH_SIZE = 8
+SUMMARY_MAX_BATCH_TOKENS = 4096  # 긴 기사(최대 1024토큰)는 4개, 짧은 기사는 최대 8개씩 묶는다
+SENTIMENT_BATCH_SIZE = 16
+# ✅ 요약 생성 프로파일 (속도 ↔ 품질): 요청/작업마다 선택
+GENERATION_PROFILES = {
+    "fast": {"max_length": 64, "min_length": 16, "num_beams": 1, "do_sample": False},
+    "balanced": {"max_length": 100, "min_length": 30, "num_beams": 2, "no_repeat_ngram_size": 3, "do_sample": False},
+    "quality": {"max_length": 128, "min_length": 30, "num_beams": 4, "length_penalty": 2.0,
+                "no_repeat_ngram_size": 3, "early_stopping": True, "do_sample": False},
+}
+CHEAPER_PROFILE = {"quality": "balanced", "balanced": "fast"}  # 기사별 마감 시간 초과 시 대체 프로파일
+DEFAULT_PROFILE = os.getenv("SUMMARY_PROFILE", "balanced")
+# 긴 기사 map-reduce 요약: 인코더 한도(KoBART 1026토큰)를 넘는 기사는 문장 경계 청크로 나눠 요약한 뒤 한 번 더 요약
+SUMMARY_MAX_INPUT_TOKENS = 1000
+SUMMARY_CHUNK_TOKENS = 768
+SUMMARY_MAX_CHUNKS = 4  # 기사당 최대 청크 수 (최악의 경우 청크 요약 4개 + 병합 요약 1회)
+# 추출 요약 전처리 (extractive.py): 0보다 크면 이 토큰 수를 넘는 기사는 TextRank 상위 문장만 요약 모델에 넣는다
+SUMMARY_EXTRACTIVE_TOKENS = int(os.getenv("SUMMARY_EXTRACTIVE_TOKENS", 0))
+SUMMARY_CACHE_CONFIG = {"max_input_tokens": SUMMARY_MAX_INPUT_TOKENS, "chunk_tokens": SUMMARY_CHUNK_TOKENS,
+                        "max_chunks": SUMMARY_MAX_CHUNKS, "extractive_tokens": SUMMARY_EXTRACTIVE_TOKENS}
+LABEL_MAP = {"LABEL_0": "부정", "LABEL_1": "중립", "LABEL_2": "긍정"}
+# 감성 분석 입력 — summary: 생성된 요약문을 분류 (요약이 끝난 뒤) / lead: 본문 앞부분을 요약과 동시에 분류
+# 두 방식의 라벨 일치율: python benchmarks/sentiment_agreement.py [--recompute]
+SENTIMENT_SOURCE = os.getenv("SENTIMENT_SOURCE", "summary")
+SENTIMENT_LEAD_CHARS = 400  # KR-FinBERT 입력 한도(512토큰) 안에 들어가는 본문 앞부분 길이
+EMPTY_SUMMARY = "요약할 본문을 찾을 수 없습니다."
+SUMMARY_ERROR = "요약 중 오류 발생: 배치 및 단건 요약 모두 실패"
+# 요청 간 마이크로 배치 (inference_broker.py)
+BROKER_SUMMARY_MAX_BATCH = 8
+BROKER_SENTIMENT_MAX_BATCH = 32
+BROKER_MAX_WAIT = 0.02  # 첫 요청 후 배치를 채우기 위해 기다리는 최대 시간 (초)
+
+def _first(output):
+    # 파이프라인은 입력이 리스트일 때 항목별로 dict 또는 [dict]를 반환한다
+    return output[0] if isinstance(output, list) else output
+
+def _input_lengths(model, inputs, truncate=True):
+    # 파이프라인의 토크나이저로 토큰 길이를 재고, 토크나이저가 없으면 글자 수로 대신한다
+    tokenizer = getattr(model, "tokenizer", None)
+    if tokenizer is not None:
+        max_length = tokenizer.model_max_length if truncate and tokenizer.model_max_length < 100000 else None
+        try:
+            return token_lengths(tokenizer, inputs, max_length=max_length)
+        except Exception:
+            pass
+    return [len(text) for text in inputs]
+
+def _run_batched(model, inputs, batch_size, parse, max_tokens=None, **kwargs):
+    """inputs를 토큰 길이가 비슷한 것끼리 batch_size(및 max_tokens)로 묶어 추론하고 원래 순서로 돌려줍니다.
+    배치가 실패하면 항목별로 다시 시도합니다 (오류 항목은 None)."""
+    batches = []
+    for indices, chunk in length_sorted_batches(inputs, _input_lengths(model, inputs), batch_size, max_tokens):
+        try:
+            outputs = model(chunk, batch_size=len(chunk), **kwargs)
+            results = [parse(_first(output)) for output in outputs]
+        except Exception:
+            results = []
+            for text in chunk:
+                try:
+                    results.append(parse(_first(model(text, **kwargs))))
+                except Exception:
+                    results.append(None)
+        batches.append((indices, results))
+    return restore_order(len(inputs), batches)
+
+# ✅ 모델 지연 로드 (처음 사용할 때 로드하여 import와 서버 시작을 가볍게 유지)
+# 워커 프로세스 모드에서는 각 워커가 로드한다
+SUMMARY_MODEL = "digit82/kobart-summarization"
+SENTIMENT_MODEL = "snunlp/KR-FinBERT"
+# torch: PyTorch FP32 / onnx: onnx_models.py로 변환한 int8 양자화 모델을 ONNX Runtime으로 실행
+INFERENCE_RUNTIME = os.getenv("INFERENCE_RUNTIME", "torch")
+# 모델 위치 임베딩 한도. KoBART 토크나이저 설정의 model_max_length는 사실상 무한대(1e30)라
+# truncation=True만으로는 잘리지 않아, 로드할 때 이 값으로 맞춘다
+MODEL_MAX_TOKENS = {"summarization": 1024, "text-classification": 512}
+_models = {}
+_model_lock = threading.Lock()
+
+def _load_model(task, model):
+    with _model_lock:
+        if task not in _models:
+            configure_inprocess_inference()
+            if INFERENCE_RUNTIME == "onnx":
+                _models[task] = load_onnx_pipeline(task)
+            else:
+                from transformers import pipeline  # transformers/torch import 자체가 수 초 걸린다
+                _models[task] = pipeline(task, model=model, device=-1)
+            tokenizer = getattr(_models[task], "tokenizer", None)
+            if tokenizer is not None and tokenizer.model_max_length > MODEL_MAX_TOKENS[task]:
+                tokenizer.model_max_length = MODEL_MAX_TOKENS[task]
+        return _models[task]
+
+def get_summarizer():
+    return _load_model("summarization", SUMMARY_MODEL)
+
+def get_sentiment_analyzer():
+    return _load_model("text-classification", SENTIMENT_MODEL)
+
+def preload_models(warmup=True):
+    """모델을 미리 로드하고, warmup이면 짧은 입력으로 한 번씩 추론하여 첫 요청의 지연을 없앱니다.
+    워커 프로세스 모드에서는 워커 풀을 시작합니다 (각 워커가 준비 전에 스스로 워밍업)."""
+    if use_workers():
+        get_worker_pool()
+        return
+    get_summarizer()
+    get_sentiment_analyzer()
+    if warmup:
+        # 결과 캐시를 거치지 않고 모델을 직접 실행
+        _summarize_local(["모델 워밍업을 위한 짧은 문장입니다. " * 8])
+        _classify_local(["모델 워밍업"])
+
+def _split_long_text(model, text):
+    sentences = split_sentences(text)
+    return chunk_sentences(sentences, _input_lengths(model, sentences, truncate=False),
+                           SUMMARY_CHUNK_TOKENS, SUMMARY_MAX_CHUNKS) or [text]
+
+def _summarize_local(texts, batch_size=SUMMARY_BATCH_SIZE, profile=DEFAULT_PROFILE):
+    """이 프로세스에 로드한 모델로 요약합니다 (워커 프로세스도 이 함수를 사용).
+    SUMMARY_EXTRACTIVE_TOKENS가 설정되면 핵심 문장만 남기고, 그래도 SUMMARY_MAX_INPUT_TOKENS보다 긴 기사는 청크별 요약(map)을 이어 붙여 다시 요약(reduce)합니다."""
+    results = [EMPTY_SUMMARY] * len(texts)
+    targets = [i for i, text in enumerate(texts) if text and text != "본문 없음"]
+    if not targets:
+        return results
+    model = get_summarizer()
+    generation_kwargs = GENERATION_PROFILES[profile]
+    if SUMMARY_EXTRACTIVE_TOKENS:
+        texts = list(texts)
+        for i in targets:
+            texts[i] = preselect(texts[i], SUMMARY_EXTRACTIVE_TOKENS,
+                                 lambda sentences: _input_lengths(model, sentences, truncate=False))
+
+    def run(inputs):
+        return _run_batched(model, inputs, batch_size, lambda output: output['summary_text'],
+                            max_tokens=SUMMARY_MAX_BATCH_TOKENS, truncation=True, **generation_kwargs)
+
+    # map: 짧은 기사는 그대로, 긴 기사는 청크로 나눠 모든 입력을 한 번에 배치 요약
+    inputs, pieces = [], {}
+    for i, length in zip(targets, _input_lengths(model, [texts[i] for i in targets], truncate=False)):
+        parts = [texts[i]] if length <= SUMMARY_MAX_INPUT_TOKENS else _split_long_text(model, texts[i])
+        pieces[i] = range(len(inputs), len(inputs) + len(parts))
+        inputs.extend(parts)
+    outputs = run(inputs)
 
-async def summarize_news(text):
+    # reduce: 청크 요약을 이어 붙여 한 번 더 요약 (긴 기사들을 한 배치로)
+    merged = {}
+    for i in targets:
+        summaries = [outputs[j] for j in pieces[i] if outputs[j] is not None]
+        if len(pieces[i]) == 1 or not summaries:
+            results[i] = summaries[0] if summaries else SUMMARY_ERROR
+        else:
+            merged[i] = " ".join(summaries)
+    if merged:
+        for (i, joined), summary in zip(merged.items(), run(list(merged.values()))):
+            # 병합 요약이 실패하면 청크 요약을 이어 붙인 결과를 그대로 사용
+            results[i] = summary if summary is not None else joined
+    return results
+
+def summarize_texts(texts, batch_size=SUMMARY_BATCH_SIZE, profile=DEFAULT_PROFILE, fallback=False):
+    """여러 본문을 profile 설정으로 배치 요약합니다. 본문이 없거나 실패한 항목은 안내 문구를 반환합니다.
+    같은 본문/모델/생성 설정의 결과는 inference_cache.py에서 재사용합니다.
+    fallback=True이면 워커 모드에서 마감 시간 대체 요약 전용 예비 워커를 사용합니다."""
+    if profile not in GENERATION_PROFILES:
+        raise ValueError(f"알 수 없는 요약 프로파일입니다: {profile}")
+
+    def compute(missing):
+        if use_workers():
+            return get_worker_pool().summarize(missing, profile, fallback)
+        return _summarize_local(missing, batch_size, profile)
+
+    return get_inference_cache("summarizer").cached_batch(
+        texts, f"{SUMMARY_MODEL}@{INFERENCE_RUNTIME}", {**GENERATION_PROFILES[profile], **SUMMARY_CACHE_CONFIG},
+        compute, cacheable=lambda summary: summary not in (EMPTY_SUMMARY, SUMMARY_ERROR),
+    )
+
+# 워커 프로세스 모드(model_worker.py)에서는 워커 수만큼 배치를 동시에 실행
+BROKER_CONCURRENT_BATCHES = INFERENCE_WORKERS if use_workers() else 1
+
+# 동시에 들어온 요약 요청(검색 API, 크롤러)을 프로파일별 브로커가 마이크로 배치로 묶어 처리
+summary_brokers = {
+    profile: InferenceBroker(f"summarizer:{profile}", functools.partial(summarize_texts, profile=profile),
+                             max_batch_size=BROKER_SUMMARY_MAX_BATCH, max_wait=BROKER_MAX_WAIT,
+                             max_concurrent_batches=BROKER_CONCURRENT_BATCHES)
+    for profile in GENERATION_PROFILES
+}
+# 마감 시간을 넘긴 요청의 대체 요약은 전용 실행 슬롯(인프로세스: 전용 스레드, 워커 모드: 예비 워커)에서
+# 실행하여, 진행 중인 원래 프로파일 배치 뒤에 줄서지 않게 한다
+fallback_brokers = {
+    profile: InferenceBroker(f"summarizer:{profile}:fallback",
+                             functools.partial(summarize_texts, profile=profile, fallback=True),
+                             max_batch_size=BROKER_SUMMARY_MAX_BATCH, max_wait=BROKER_MAX_WAIT,
+                             executor=ThreadPoolExecutor(max_workers=1, thread_name_prefix="summary_fallback"))
+    for profile in set(CHEAPER_PROFILE.values())
+}
+deadline_fallbacks = {profile: 0 for profile in CHEAPER_PROFILE}
+
+async def summarize_news(text, profile=DEFAULT_PROFILE, deadline=None):
+    """deadline(초)이 주어지면 그 안에 끝나지 않을 때 더 가벼운 프로파일로 다시 요약합니다.
+    아직 배치로 보내지 않은 요청은 대기열에서 빠지고, 이미 실행 중인 배치는 끝까지 실행되어
+    결과가 캐시에 남습니다 (인프로세스 모드에서는 대체 요약과 CPU를 나눠 쓴다)."""
     if not text or text == "본문 없음":
-        return "요약할 본문을 찾을 수 없습니다."
+        return EMPTY_SUMMARY
+    if profile not in GENERATION_PROFILES:
+        raise ValueError(f"알 수 없는 요약 프로파일입니다: {profile}")
+    broker = summary_brokers[profile]
+    if deadline is None or profile not in CHEAPER_PROFILE:
+        return await broker.submit(text)
     try:
-        result = await asyncio.to_thread(summarizer, text, max_length=100, min_length=30, do_sample=False)
-        return result[0]['summary_text']
-    except Exception as e:
-        return f"요약 중 오류 발생: {str(e)}"
+        return await asyncio.wait_for(broker.submit(text), deadline)
+    except asyncio.TimeoutError:
+        deadline_fallbacks[profile] += 1
+        return await fallback_brokers[CHEAPER_PROFILE[profile]].submit(text)
+
+async def summarize_news_batch(texts, profile=DEFAULT_PROFILE, deadline=None):
+    return list(await asyncio.gather(*(summarize_news(text, profile, deadline) for text in texts)))
+
+# ✅ 감성 분석
+def _parse_sentiment(output):
+    return LABEL_MAP.get(output['label'], "알 수 없음"), output['score']
+
+def _classify_local(texts, batch_size=SENTIMENT_BATCH_SIZE):
+    """이 프로세스에 로드한 모델로 감성을 분석합니다 (워커 프로세스도 이 함수를 사용)."""
+    # 요약 병합 실패 시의 긴 청크 요약 등 512토큰을 넘는 입력은 잘라서 분류 (안 자르면 배치와 단건 재시도 모두 실패)
+    return _run_batched(get_sentiment_analyzer(), list(texts), batch_size, _parse_sentiment,
+                        truncation=True, max_length=MODEL_MAX_TOKENS["text-classification"])
+
+def classify_texts(texts, batch_size=SENTIMENT_BATCH_SIZE):
+    """여러 텍스트의 감성을 배치로 분석하여 (감정, 확률) 목록을 반환합니다. 실패한 항목은 None입니다."""
+    def compute(missing):
+        return get_worker_pool().classify(missing) if use_workers() else _classify_local(missing, batch_size)
+
+    results = get_inference_cache("sentiment").cached_batch(
+        texts, f"{SENTIMENT_MODEL}@{INFERENCE_RUNTIME}", {}, compute,
+    )
+    return [tuple(result) if result is not None else None for result in results]
 
-# ✅ 감성 분석 모델 로드
-sentiment_analyzer = pipeline("text-classification", model="snunlp/KR-FinBERT", device=-1)
+sentiment_broker = InferenceBroker("sentiment", classify_texts,
+                                   max_batch_size=BROKER_SENTIMENT_MAX_BATCH, max_wait=BROKER_MAX_WAIT,
+                                   max_concurrent_batches=BROKER_CONCURRENT_BATCHES)
+
+async def analyze_sentiment_batch(texts):
+    return await sentiment_broker.submit_many(texts)
 
 async def analyze_sentiment(text):
-    sentiment = await asyncio.to_thread(sentiment_analyzer, text)
-    label_map = {"LABEL_0": "부정", "LABEL_1": "중립", "LABEL_2": "긍정"}
-    return label_map.get(sentiment[0]['label'], "알 수 없음"), sentiment[0]['score']
+    sentiment = await sentiment_broker.submit(text)
+    if sentiment is None:
+        raise ValueError("감성 분석 중 오류 발생")
+    return sentiment
 
-# ✅ 섹션별 뉴스 기사 크롤링 및 분석 (비동기)
-async def analyze_section(section: str, count: int = 10):
-    if section not in SECTION_URLS:
-        return {"error": "지원하지 않는 섹션입니다."}
-    
-    url = SECTION_URLS[section]
-    response = await asyncio.to_thread(requests.get, url, headers={"User-Agent": "Mozilla/5.0"})
-    if response.status_code != 200:
-        return {"error": "네이버 뉴스 섹션 페이지를 불러오지 못했습니다."}
-    
-    soup = BeautifulSoup(response.text, "html.parser")
-    articles = set()
+def inference_stats():
+    """모델별 배치 크기 / 대기 시간 히스토그램과 결과 캐시 적중률"""
+    return {
+        "runtime": runtime_settings(),
+        "summarizer": {
+            "profiles": {profile: broker.stats() for profile, broker in summary_brokers.items()},
+            "fallback_profiles": {profile: broker.stats() for profile, broker in fallback_brokers.items()},
+            "deadline_fallbacks": dict(deadline_fallbacks),
+            "cache": get_inference_cache("summarizer").stats(),
+        },
+        "sentiment": {**sentiment_broker.stats(), "cache": get_inference_cache("sentiment").stats()},
+    }
+
+# ✅ 이미 저장된 기사 URL 제외 (Bloom 필터 증분 갱신 → 필터에 있는 후보만 DB 일괄 조회)
+async def filter_new_urls(urls):
+    # 다른 프로세스(API 서버 / 크롤러 서비스)가 저장한 URL까지 반영해야 필터의 '없음'을 믿을 수 있다
+    await asyncio.to_thread(load_known_urls)
+    candidates = [url for url in urls if known_urls.maybe_known(url)]
+    existing = await asyncio.to_thread(get_existing_urls, candidates) if candidates else set()
+    return [url for url in urls if url not in existing]
+
+# ✅ 섹션 목록 페이지 (1페이지는 섹션 홈, 2페이지부터는 '기사 더보기' 템플릿)
+SECTION_MORE_URL = "https://news.naver.com/section/template/SECTION_ARTICLE_LIST?sid={sid}&pageNo={page}"
+MAX_SECTION_PAGES = 20  # 증분 크롤링 시 한 번에 넘길 최대 목록 페이지 수
+
+def parse_section_links(html):
+    soup = BeautifulSoup(html, "html.parser")
+    links = []
     for a in soup.select("div.sa_text a"):
         if "href" in a.attrs:
             href = a["href"].replace("/comment/", "/")
-            if "/cluster/" not in href and href not in articles:
-                articles.add(href)
-        if len(articles) >= count:
+            if "/cluster/" not in href and href not in links:
+                links.append(href)
+    return links
+
+async def fetch_section_links(section, page=1):
+    """섹션 목록의 page번째 페이지에서 기사 URL을 최신순으로 반환합니다. 실패하면 None."""
+    if page == 1:
+        url = SECTION_URLS[section]
+    else:
+        sid = SECTION_URLS[section].rsplit("/", 1)[-1]
+        url = SECTION_MORE_URL.format(sid=sid, page=page)
+    response = await cached_fetch(url)
+    if response.status_code != 200:
+        return None
+    html = response.text
+    if "json" in response.headers.get("content-type", ""):
+        # '기사 더보기' 응답은 렌더링된 HTML 조각을 JSON으로 감싸서 준다
+        rendered = response.json().get("renderedComponent", {})
+        html = "".join(value for value in rendered.values() if isinstance(value, str))
+    return parse_section_links(html)
+
+async def collect_incremental_urls(section, max_articles, max_pages=MAX_SECTION_PAGES):
+    """지난 실행에서 본 기사가 나올 때까지 섹션 목록을 넘기며 새 기사 URL을 모읍니다."""
+    seen = get_crawl_cursor().seen_urls(section)
+    urls = []
+    for page in range(1, max_pages + 1):
+        links = await fetch_section_links(section, page)
+        if links is None:
+            return None if page == 1 else urls
+        new_links = [link for link in links if link not in urls]
+        if not new_links:
             break
+        # 섹션 홈 상단의 헤드라인은 시간순이 아니므로 한 페이지는 끝까지 보고 멈춘다
+        urls.extend(link for link in new_links if link not in seen)
+        if not seen or any(link in seen for link in new_links) or len(urls) >= max_articles:
+            break
+    return urls
+
+# ✅ 단계별 동시 처리 수 (fetch → clean → summarize → classify → persist)
+FETCH_WORKERS = 8
+CLEAN_WORKERS = 1
+SUMMARIZE_WORKERS = 1
+CLASSIFY_WORKERS = 1
+PERSIST_WORKERS = 2
+
+async def _fetch_stage(article_url):
+    title, content = await fetch_news(article_url)
+    return {"URL": article_url, "제목": title, "본문": content}
 
+async def _clean_stage(article):
+    if article["본문"] == "본문 없음":
+        return None
+    # 모델 입력용 텍스트: 연속 공백/줄바꿈을 하나로 정리 (저장되는 본문은 그대로 둔다)
+    article["text"] = " ".join(article["본문"].split())
+    return article if article["text"] else None
+
+def _summarize_stage(profile, deadline):
+    async def summarize(articles):
+        summaries = await summarize_news_batch([article.pop("text") for article in articles], profile, deadline)
+        for article, summary in zip(articles, summaries):
+            article["요약"] = summary
+        return articles
+    return summarize
+
+def _set_sentiment(article, sentiment):
+    if sentiment is None:
+        return None
+    sentiment_label, sentiment_score = sentiment
+    article["감성 분석 결과"] = {"감정": sentiment_label, "확률": sentiment_score}
+    return article
+
+async def _classify_stage(articles):
+    sentiments = await analyze_sentiment_batch([article["요약"] for article in articles])
+    return [_set_sentiment(article, sentiment) for article, sentiment in zip(articles, sentiments)]
+
+def _summarize_and_classify_stage(profile, deadline):
+    # lead 모드: 요약과 본문 앞부분 감성 분석을 동시에 실행 (기사당 지연 = 둘 중 긴 쪽)
+    async def analyze(articles):
+        texts = [article.pop("text") for article in articles]
+        summaries, sentiments = await asyncio.gather(
+            summarize_news_batch(texts, profile, deadline),
+            analyze_sentiment_batch([lead_text(text, SENTIMENT_LEAD_CHARS) for text in texts]),
+        )
+        results = []
+        for article, summary, sentiment in zip(articles, summaries, sentiments):
+            article["요약"] = summary
+            results.append(_set_sentiment(article, sentiment))
+        return results
+    return analyze
+
+def build_article_stages(persist=None, profile=DEFAULT_PROFILE, deadline=None, sentiment_source=None):
+    """기사 분석 파이프라인 단계를 만듭니다. persist(article)가 있으면 마지막에 저장 단계를 붙입니다.
+    profile/deadline은 요약 생성 프로파일과 기사별 요약 마감 시간(초)이며,
+    sentiment_source가 "lead"이면 감성 분석을 요약문 대신 본문 앞부분으로 요약과 동시에 수행합니다."""
+    stages = [
+        Stage("fetch", _fetch_stage, FETCH_WORKERS),
+        Stage("clean", _clean_stage, CLEAN_WORKERS),
+    ]
+    if (sentiment_source or SENTIMENT_SOURCE) == "lead":
+        stages.append(Stage("summarize+classify", _summarize_and_classify_stage(profile, deadline),
+                            SUMMARIZE_WORKERS, batch_size=SUMMARY_BATCH_SIZE))
+    else:
+        stages += [
+            Stage("summarize", _summarize_stage(profile, deadline), SUMMARIZE_WORKERS,
+                  batch_size=SUMMARY_BATCH_SIZE),
+            Stage("classify", _classify_stage, CLASSIFY_WORKERS, batch_size=SENTIMENT_BATCH_SIZE),
+        ]
+    if persist is not None:
+        stages.append(Stage("persist", persist, PERSIST_WORKERS))
+    return stages
+
+# ✅ 섹션별 뉴스 기사 크롤링 및 분석 (비동기 스트리밍)
+async def iter_analyze_section(section: str, count: int = 10, skip_known: bool = False, incremental: bool = False,
+                               persist=None, profile: str = DEFAULT_PROFILE, deadline: float = None,
+                               sentiment_source: str = None):
+    """기사별 요약과 감성 분석이 끝나는 즉시 결과를 하나씩 내보냅니다. 오류는 {"error": ...}로 내보냅니다.
+    persist는 분석된 기사를 받아 저장하고 그대로 반환하는 async 함수입니다 (파이프라인 마지막 단계,
+    저장에 실패하면 None을 반환하여 증분 크롤링 커서가 그 기사를 넘지 않게 합니다)."""
+    if section not in SECTION_URLS:
+        yield {"error": "지원하지 않는 섹션입니다."}
+        return
+    if profile not in GENERATION_PROFILES:
+        yield {"error": f"지원하지 않는 요약 프로파일입니다. ({', '.join(GENERATION_PROFILES)})"}
+        return
+    if count < 1:
+        yield {"error": "count는 1 이상이어야 합니다."}
+        return
+
+    if incremental:
+        listed = await collect_incremental_urls(section, count)
+    else:
+        listed = await fetch_section_links(section)
+    if listed is None:
+        yield {"error": "네이버 뉴스 섹션 페이지를 불러오지 못했습니다."}
+        return
+
+    candidates = await filter_new_urls(listed) if skip_known else listed
+    articles = candidates[:count]
+    if incremental:
+        # 커서에는 이번에 실제로 처리한 범위까지만 기록 (count는 한 번에 처리할 안전 상한)
+        covered = listed if len(candidates) <= count else listed[:listed.index(articles[-1]) + 1]
+    # 이미 저장된 기사(필터에서 제외)는 처리된 것으로 본다
+    done = set(listed) - set(candidates)
+    if not articles and (skip_known or incremental):
+        # 새 기사가 없는 것은 오류가 아니다
+        if incremental:
+            get_crawl_cursor().advance(section, covered, done)
+        return
+
+    # 단계별로 겹쳐서 처리하며 마지막 단계(persist가 있으면 저장)를 통과한 기사부터 바로 내보낸다
+    stages = build_article_stages(persist, profile, deadline, sentiment_source)
+    produced = 0
+    completed = False
+    try:
+        async for article in run_pipeline(articles, stages):
+            produced += 1
+            done.add(article["URL"])
+            yield article
+        completed = True
+    finally:
+        # 실패(요청 실패, 본문 없음, 분석/저장 오류)한 기사는 다음 실행에서 다시 모이도록 커서를 넘기지 않는다
+        # (중간에 끊긴 실행의 미처리 기사는 실패 횟수에 넣지 않는다)
+        if incremental:
+            given_up = get_crawl_cursor().advance(section, covered, done, count_failures=completed)
+            if given_up:
+                logging.warning(f"{section} 섹션: 반복해서 실패한 기사 {len(given_up)}개를 건너뜁니다. {given_up[:5]}")
+    if not produced:
+        yield {"error": "요약 및 분석 가능한 기사가 없습니다."}
+
+# ✅ 섹션별 뉴스 기사 크롤링 및 분석 (비동기)
+async def analyze_section(section: str, count: int = 10, skip_known: bool = False, incremental: bool = False,
+                          persist=None, profile: str = DEFAULT_PROFILE, deadline: float = None,
+                          sentiment_source: str = None):
     results = []
-    tasks = [fetch_news(article_url) for article_url in list(articles)[:count]]
-    fetched_news = await asyncio.gather(*tasks)
-
-    for article_url, (title, content) in zip(articles, fetched_news):
-        if content == "본문 없음":
-            continue  
-        
-        summary = await summarize_news(content)
-        sentiment_label, sentiment_score = await analyze_sentiment(summary)
-
-        results.append({
-            "URL": article_url,
-            "제목": title,
-            "본문": content,
-            "요약": summary,
-            "감성 분석 결과": {"감정": sentiment_label, "확률": sentiment_score}
-        })
-
-    return results if results else {"error": "요약 및 분석 가능한 기사가 없습니다."}
+    async for item in iter_analyze_section(section, count, skip_known=skip_known, incremental=incremental,
+                                           persist=persist, profile=profile, deadline=deadline,
+                                           sentiment_source=sentiment_source):
+        if "error" in item:
+            return item
+        results.append(item)
+    return results
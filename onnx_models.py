@@ -0,0 +1,78 @@
+### onnx_models.py (요약/감성 분석 모델의 ONNX 변환 + int8 동적 양자화, ONNX Runtime 로드)
+# 사용법:
+#   python onnx_models.py                    # onnx_models/ 아래에 fp32 변환 후 int8 양자화
+#   python onnx_models.py --arch avx512_vnni  # 서버 CPU에 맞는 양자화 설정 선택
+#   INFERENCE_RUNTIME=onnx 로 실행하면 news_scraper가 양자화된 모델을 사용 (optimum[onnxruntime] 필요)
+#   python benchmarks/bench_onnx.py          # 속도와 감성 분석 라벨 일치율 비교
+#   (요약 품질은 evaluate_summarize.py의 Pretrained-ONNX-int8 항목에서 ROUGE로 비교)
+import argparse
+import os
+import shutil
+
+ONNX_MODEL_DIR = os.getenv("ONNX_MODEL_DIR", "onnx_models")
+QUANTIZATION_ARCHS = ["avx2", "avx512", "avx512_vnni", "arm64"]
+
+# news_scraper의 파이프라인 task → (optimum 모델 클래스 이름, 저장 디렉토리 이름)
+ORT_MODEL_CLASSES = {
+    "summarization": ("ORTModelForSeq2SeqLM", "summarizer"),
+    "text-classification": ("ORTModelForSequenceClassification", "sentiment"),
+}
+
+def _model_class(task):
+    import optimum.onnxruntime
+    return getattr(optimum.onnxruntime, ORT_MODEL_CLASSES[task][0])
+
+def model_dir(task, quantized=True, base_dir=ONNX_MODEL_DIR):
+    name = ORT_MODEL_CLASSES[task][1]
+    return os.path.join(base_dir, f"{name}-int8" if quantized else name)
+
+def export_model(task, model_name, arch="avx2", base_dir=ONNX_MODEL_DIR):
+    """허깅페이스 모델을 ONNX로 변환하고, ONNX 파일마다 int8 동적 양자화를 적용합니다."""
+    from optimum.onnxruntime import ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+    from transformers import AutoTokenizer
+
+    fp32_dir = model_dir(task, quantized=False, base_dir=base_dir)
+    int8_dir = model_dir(task, quantized=True, base_dir=base_dir)
+    model = _model_class(task).from_pretrained(model_name, export=True)
+    model.save_pretrained(fp32_dir)
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(fp32_dir)
+
+    # 동적 양자화: 가중치는 int8로 저장하고 활성값은 실행 중에 양자화 (보정 데이터 불필요)
+    quantization_config = getattr(AutoQuantizationConfig, arch)(is_static=False, per_channel=False)
+    os.makedirs(int8_dir, exist_ok=True)
+    for file_name in sorted(os.listdir(fp32_dir)):
+        if file_name.endswith(".onnx"):
+            quantizer = ORTQuantizer.from_pretrained(fp32_dir, file_name=file_name)
+            quantizer.quantize(save_dir=int8_dir, quantization_config=quantization_config, file_suffix="")
+        elif not os.path.exists(os.path.join(int8_dir, file_name)):
+            # 토크나이저 / config / generation_config는 그대로 복사
+            src = os.path.join(fp32_dir, file_name)
+            if os.path.isfile(src):
+                shutil.copy(src, int8_dir)
+    return int8_dir
+
+def load_onnx_pipeline(task, quantized=True, base_dir=ONNX_MODEL_DIR):
+    """변환해 둔 ONNX 모델을 ONNX Runtime(CPU)으로 실행하는 transformers 파이프라인을 만듭니다."""
+    from transformers import AutoTokenizer, pipeline
+
+    path = model_dir(task, quantized=quantized, base_dir=base_dir)
+    if not os.path.isdir(path):
+        raise FileNotFoundError(f"ONNX 모델이 없습니다: {path} (python onnx_models.py로 먼저 변환하세요)")
+    model = _model_class(task).from_pretrained(path, provider="CPUExecutionProvider")
+    return pipeline(task, model=model, tokenizer=AutoTokenizer.from_pretrained(path))
+
+def main():
+    from news_scraper import SENTIMENT_MODEL, SUMMARY_MODEL
+
+    parser = argparse.ArgumentParser(description="요약/감성 분석 모델 ONNX 변환 + int8 동적 양자화")
+    parser.add_argument("--arch", choices=QUANTIZATION_ARCHS, default="avx2", help="양자화 대상 CPU 명령어 집합")
+    parser.add_argument("--output", default=ONNX_MODEL_DIR, help="저장 디렉토리")
+    args = parser.parse_args()
+
+    for task, model_name in [("summarization", SUMMARY_MODEL), ("text-classification", SENTIMENT_MODEL)]:
+        print(f"{model_name} 변환 중...")
+        print(f"  → {export_model(task, model_name, arch=args.arch, base_dir=args.output)}")
+
+if __name__ == "__main__":
+    main()
@@ -6,73 +6,96 @@ FASTAPI_URL = "http://127.0.0.1:9000"
 
 st.title("📂 저장된 기사 목록 (섹션별 필터링)")
 
-# FastAPI에서 저장된 기사 목록 불러오기
-response = requests.get(f"{FASTAPI_URL}/articles")
+PAGE_SIZE = 20
+
+# 섹션 / 감성 필터는 서버에서 적용 (필터가 바뀌면 첫 페이지부터)
+filter_col1, filter_col2 = st.columns(2)
+with filter_col1:
+    selected_section = st.selectbox("🔍 섹션 선택", ["전체", "정치", "경제", "사회", "생활", "세계", "IT"])
+with filter_col2:
+    selected_sentiment = st.selectbox("😊 감성 선택", ["전체", "긍정", "중립", "부정"])
+
+filters = (selected_section, selected_sentiment)
+if st.session_state.get("article_filters") != filters:
+    st.session_state["article_filters"] = filters
+    st.session_state["article_cursors"] = [None]  # 페이지별 시작 커서 (첫 페이지는 None)
+cursors = st.session_state["article_cursors"]
+
+# FastAPI에서 현재 페이지의 기사만 불러오기
+params = {"limit": PAGE_SIZE, "fields": "summary"}
+if cursors[-1]:
+    params["cursor"] = cursors[-1]
+if selected_section != "전체":
+    params["section"] = selected_section
+if selected_sentiment != "전체":
+    params["sentiment"] = selected_sentiment
+response = requests.get(f"{FASTAPI_URL}/articles", params=params)
 if response.status_code == 200:
     data = response.json()
-    articles = data.get("articles", [])
+    filtered_articles = data.get("articles", [])
+    next_cursor = data.get("next_cursor")
 
-    if not articles:
-        st.write("⛔ 저장된 기사가 없습니다.")
+    if not filtered_articles:
+        st.write(f"⛔ 선택한 섹션({selected_section})에 저장된 기사가 없습니다.")
     else:
-        # 섹션별 필터링을 위한 드롭다운 추가
-        sections = list(set(article["section"] for article in articles))
-        sections.sort()
-        selected_section = st.selectbox("🔍 섹션 선택", ["전체"] + sections)
-
-        # 선택된 섹션에 맞게 기사 필터링
-        filtered_articles = [article for article in articles if selected_section == "전체" or article["section"] == selected_section]
-
-        if not filtered_articles:
-            st.write(f"⛔ 선택한 섹션({selected_section})에 저장된 기사가 없습니다.")
-        else:
-            st.write(f"📌 **{selected_section}** 섹션의 기사 목록: **{len(filtered_articles)}건**")
-            
-            selected_article_ids = []  # 선택된 기사 ID 저장 리스트
-            # 전체 선택 체크박스와 버튼을 한 줄 상단에 배치
-            left_col, middle_col, right_col = st.columns([2, 1, 2])  # 비율 조절 가능
-
-            with left_col:
-                select_all = st.checkbox("✅ 모든 기사 선택/해제", key="select_all_articles")
-
-            for article in filtered_articles:
-                # 기사 URL 추가
-                article_url = article.get("url", "#")
-                st.markdown(f"🔗 [기사 링크]({article_url})", unsafe_allow_html=True)
-
-                # 전체 선택 상태에 따라 체크 상태 조절
-                checked = select_all or st.checkbox(
-                    f"{article['title']} (요약: {article['summary']})", 
-                    key=f"article_{article['id']}"
-                )
-
-                if checked:
-                    selected_article_ids.append(article["id"])
-
-                st.write("---")
-            
-            with right_col:
-                btn_col1, btn_col2 = st.columns([1, 1])
-                with btn_col1:
-                    # "상세 내용" 버튼 추가 (기사 선택 시만 활성화)
-                    if selected_article_ids:
-                        if st.button("📖 상세 내용 보기"):
-                            st.session_state["selected_article_ids"] = selected_article_ids  # 세션에 저장
-                            st.query_params.update({"page": "detail"})  # st.experimental_set_query_params는 2024-04-11 이후 제거 변경
-                            st.rerun()
-                with btn_col2:
-                    # "선택한 기사 삭제" 버튼 추가
-                    if selected_article_ids:
-                        if st.button("🗑️ 선택한 기사 삭제"):
-                            for article_id in selected_article_ids:
-                                delete_response = requests.delete(f"{FASTAPI_URL}/delete_article/{article_id}")
-                                if delete_response.status_code == 200:
-                                    st.success(f"✅ 기사 삭제 완료: ID {article_id}")
-                                else:
-                                    st.error(f"❌ 삭제 실패: {delete_response.json().get('detail', '알 수 없는 오류')}")
-
-                            # 삭제 후 페이지 새로고침
-                            st.rerun()
+        st.write(f"📌 **{selected_section}** 섹션의 기사 목록: **{len(cursors)}페이지** ({len(filtered_articles)}건)")
+        
+        selected_article_ids = []  # 선택된 기사 ID 저장 리스트
+        # 전체 선택 체크박스와 버튼을 한 줄 상단에 배치
+        left_col, middle_col, right_col = st.columns([2, 1, 2])  # 비율 조절 가능
+
+        with left_col:
+            select_all = st.checkbox("✅ 모든 기사 선택/해제", key="select_all_articles")
+
+        for article in filtered_articles:
+            # 기사 URL 추가
+            article_url = article.get("url", "#")
+            st.markdown(f"🔗 [기사 링크]({article_url})", unsafe_allow_html=True)
+
+            # 전체 선택 상태에 따라 체크 상태 조절
+            checked = select_all or st.checkbox(
+                f"{article['title']} (요약: {article['summary']})", 
+                key=f"article_{article['id']}"
+            )
+
+            if checked:
+                selected_article_ids.append(article["id"])
+
+            st.write("---")
+        
+        with right_col:
+            btn_col1, btn_col2 = st.columns([1, 1])
+            with btn_col1:
+                # "상세 내용" 버튼 추가 (기사 선택 시만 활성화)
+                if selected_article_ids:
+                    if st.button("📖 상세 내용 보기"):
+                        st.session_state["selected_article_ids"] = selected_article_ids  # 세션에 저장
+                        st.query_params.update({"page": "detail"})  # st.experimental_set_query_params는 2024-04-11 이후 제거 변경
+                        st.rerun()
+            with btn_col2:
+                # "선택한 기사 삭제" 버튼 추가
+                if selected_article_ids:
+                    if st.button("🗑️ 선택한 기사 삭제"):
+                        for article_id in selected_article_ids:
+                            delete_response = requests.delete(f"{FASTAPI_URL}/delete_article/{article_id}")
+                            if delete_response.status_code == 200:
+                                st.success(f"✅ 기사 삭제 완료: ID {article_id}")
+                            else:
+                                st.error(f"❌ 삭제 실패: {delete_response.json().get('detail', '알 수 없는 오류')}")
+
+                        # 삭제 후 페이지 새로고침
+                        st.rerun()
+
+    # 페이지 이동 (이전 페이지 커서는 세션에 쌓아 둔다)
+    prev_col, _, next_col = st.columns([1, 3, 1])
+    with prev_col:
+        if len(cursors) > 1 and st.button("⬅️ 이전 페이지"):
+            cursors.pop()
+            st.rerun()
+    with next_col:
+        if next_cursor and st.button("다음 페이지 ➡️"):
+            cursors.append(next_cursor)
+            st.rerun()
 
 else:
     st.error("❌ 기사 목록을 불러올 수 없습니다.")
@@ -1,6 +1,7 @@
 ### pages/search.py (기사 검색 페이지)
 import streamlit as st
 import requests
+import json
 
 FASTAPI_URL = "http://127.0.0.1:9000"
 
@@ -9,28 +10,81 @@ st.title("🔎 뉴스 검색")
 # ✅ 섹션 및 검색 개수 입력
 section = st.selectbox("검색할 뉴스 섹션을 선택하세요", ["정치", "경제", "사회", "생활", "세계", "IT"])
 n_articles = st.number_input("검색할 기사 개수", min_value=1, max_value=200, value=10)
+streaming = st.checkbox("분석이 끝난 기사부터 바로 표시", value=True)
+# 요약 생성 프로파일: 검색 화면은 기본적으로 빠른 요약 사용
+PROFILES = {"빠르게": "fast", "균형": "balanced", "고품질": "quality"}
+profile = PROFILES[st.radio("요약 품질", list(PROFILES), horizontal=True)]
 
-if st.button("검색 실행"):
+def search_blocking():
+    """모든 기사의 분석이 끝난 뒤 결과를 한 번에 받습니다."""
     api_url = f"{FASTAPI_URL}/analyze_section/"
-    try:
-        response = requests.get(api_url, params={"section": section, "count": n_articles}, timeout=800)
-        if response.status_code == 200:
-            search_results = response.json()
-            
-            if not search_results or "error" in search_results:
-                st.warning("⛔ 검색된 기사가 없습니다.")
-            else:
-                # ✅ 검색 결과를 세션 상태에 저장하여 result.py에서 사용 가능하도록 함
-                st.session_state["search_results"] = search_results
-                st.session_state["search_section"] = section
-                
-                # ✅ result 페이지로 이동할 수 있도록 링크 제공
-                st.success("✅ 검색이 완료되었습니다! 아래에서 기사를 선택한 후 저장하세요.")
-                st.markdown("[🔍 결과 페이지로 이동](http://localhost:8501/result)")
+    params = {"section": section, "count": n_articles, "profile": profile}
+    response = requests.get(api_url, params=params, timeout=800)
+    if response.status_code == 200:
+        search_results = response.json()
+
+        if not search_results or "error" in search_results:
+            st.warning("⛔ 검색된 기사가 없습니다.")
         else:
+            # ✅ 검색 결과를 세션 상태에 저장하여 result.py에서 사용 가능하도록 함
+            st.session_state["search_results"] = search_results
+            st.session_state["search_section"] = section
+
+            # ✅ result 페이지로 이동할 수 있도록 링크 제공
+            st.success("✅ 검색이 완료되었습니다! 아래에서 기사를 선택한 후 저장하세요.")
+            st.markdown("[🔍 결과 페이지로 이동](http://localhost:8501/result)")
+    else:
+        st.error(f"🚨 FastAPI 서버 응답 오류: {response.status_code}")
+        st.text(response.text)
+
+def search_streaming():
+    """스트리밍 API에서 기사별 분석 결과를 받는 대로 화면에 표시합니다."""
+    api_url = f"{FASTAPI_URL}/analyze_section/stream"
+    params = {"section": section, "count": n_articles, "format": "ndjson", "profile": profile}
+    search_results = []
+
+    # (연결 타임아웃, 다음 기사 결과까지의 읽기 타임아웃)
+    with requests.get(api_url, params=params, stream=True, timeout=(10, 300)) as response:
+        if response.status_code != 200:
             st.error(f"🚨 FastAPI 서버 응답 오류: {response.status_code}")
             st.text(response.text)
-    
+            return
+
+        progress = st.progress(0.0, text="기사를 분석하는 중...")
+        for line in response.iter_lines(decode_unicode=True):
+            if not line:
+                continue
+            result = json.loads(line)
+            if "error" in result:
+                continue
+
+            search_results.append(result)
+            # ✅ 받을 때마다 세션에 저장하여 중간에 결과 페이지로 이동해도 볼 수 있도록 함
+            st.session_state["search_results"] = search_results
+            st.session_state["search_section"] = section
+
+            progress.progress(min(len(search_results) / n_articles, 1.0),
+                              text=f"{len(search_results)}/{n_articles}개 기사 분석 완료")
+            st.markdown(f"**{len(search_results)}. [{result['제목']}]({result['URL']})**")
+            st.write(f"📃 **요약:** {result['요약']}")
+            st.write(f"🧐 **감성 분석:** {result['감성 분석 결과']['감정']} "
+                     f"(점수: {result['감성 분석 결과']['확률']:.2f})")
+            st.write("---")
+        progress.empty()
+
+    if search_results:
+        st.success("✅ 검색이 완료되었습니다! 아래에서 기사를 선택한 후 저장하세요.")
+        st.markdown("[🔍 결과 페이지로 이동](http://localhost:8501/result)")
+    else:
+        st.warning("⛔ 검색된 기사가 없습니다.")
+
+if st.button("검색 실행"):
+    try:
+        if streaming:
+            search_streaming()
+        else:
+            search_blocking()
+
     except requests.exceptions.ConnectionError:
         st.error("🚨 FastAPI 서버에 연결할 수 없습니다. FastAPI가 실행 중인지 확인하세요.")
 
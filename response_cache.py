@@ -0,0 +1,136 @@
+### response_cache.py (조회 API 응답 캐시: 엔드포인트별 TTL, ETag, 쓰기 시 무효화)
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from fastapi.encoders import jsonable_encoder
+
+# ✅ 응답 캐시 설정 (RESPONSE_CACHE=off로 끄기)
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE", "on") != "off"
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 1024))
+# 엔드포인트별 TTL(초). API를 거치지 않는 쓰기(크롤러 서비스, db_cleanup.py)는 TTL이 지나야 반영된다
+RESPONSE_CACHE_TTLS = {
+    "statistics": float(os.getenv("RESPONSE_CACHE_TTL_STATISTICS", 10)),
+    "articles": float(os.getenv("RESPONSE_CACHE_TTL_ARTICLES", 10)),
+    "article": float(os.getenv("RESPONSE_CACHE_TTL_ARTICLE", 300)),
+}
+
+def render_json(data):
+    """FastAPI 기본 JSONResponse와 같은 형식의 응답 본문 bytes"""
+    return json.dumps(jsonable_encoder(data), ensure_ascii=False, allow_nan=False,
+                      separators=(",", ":")).encode("utf-8")
+
+def make_etag(body):
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+def etag_matches(if_none_match, etag):
+    """If-None-Match 헤더(여러 값, W/ 약한 비교 포함)에 etag가 있는지 확인합니다."""
+    if not if_none_match:
+        return False
+    for value in if_none_match.split(","):
+        value = value.strip()
+        if value == "*" or value.removeprefix("W/") == etag:
+            return True
+    return False
+
+class ResponseCache:
+    """(엔드포인트 이름, 키)별로 렌더링된 응답 본문과 ETag를 TTL 동안 보관합니다.
+    같은 키의 동시 요청은 한 번만 계산하며, 계산 중에 그 키(또는 엔드포인트 전체)가 invalidate()되면
+    그 결과는 저장하지 않습니다. 다른 키의 무효화는 계산 중인 결과에 영향을 주지 않습니다."""
+
+    def __init__(self, ttls=RESPONSE_CACHE_TTLS, max_entries=RESPONSE_CACHE_MAX_ENTRIES,
+                 enabled=RESPONSE_CACHE_ENABLED):
+        self.ttls = ttls
+        self.max_entries = max_entries
+        self.enabled = enabled
+        self._entries = OrderedDict()  # (name, key) -> (expires_at, body, etag)
+        self._inflight = {}            # (name, key) -> 계산 중인 Task
+        self._generations = {}         # name -> 엔드포인트 전체 무효화 횟수
+        self._stale = set()            # 계산 중에 자기 키가 무효화된 Task
+        self.counters = {name: {"hits": 0, "coalesced": 0, "misses": 0, "not_modified": 0, "invalidations": 0}
+                         for name in ttls}
+
+    async def get(self, name, key, compute):
+        """캐시된 (body, etag)를 반환하고, 없거나 만료되었으면 await compute()의 결과로 채웁니다."""
+        counters = self.counters[name]
+        if not self.enabled:
+            counters["misses"] += 1
+            body = render_json(await compute())
+            return body, make_etag(body)
+
+        cache_key = (name, key)
+        entry = self._entries.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(cache_key)
+            counters["hits"] += 1
+            return entry[1], entry[2]
+
+        # 같은 키를 계산 중이면 그 결과를 함께 기다린다 (먼저 온 요청이 끊겨도 계산은 계속)
+        inflight = self._inflight.get(cache_key)
+        if inflight is None:
+            counters["misses"] += 1
+            # 세대는 Task가 처음 실행될 때가 아니라 지금 읽는다 (그 사이의 무효화도 반영)
+            generation = self._generations.get(name, 0)
+            inflight = asyncio.ensure_future(self._fill(cache_key, compute, generation))
+            # 기다리던 요청이 모두 끊겨도 예외 미확인 경고가 남지 않도록
+            inflight.add_done_callback(lambda task: task.cancelled() or task.exception())
+            self._inflight[cache_key] = inflight
+        else:
+            counters["coalesced"] += 1
+        return await asyncio.shield(inflight)
+
+    async def _fill(self, cache_key, compute, generation):
+        task = asyncio.current_task()
+        try:
+            body = render_json(await compute())
+            result = (body, make_etag(body))
+            if self._generations.get(cache_key[0], 0) == generation and task not in self._stale:
+                self._store(cache_key, result)
+            return result
+        finally:
+            self._stale.discard(task)
+            if self._inflight.get(cache_key) is task:
+                self._inflight.pop(cache_key)
+
+    def _store(self, cache_key, result):
+        self._entries[cache_key] = (time.monotonic() + self.ttls[cache_key[0]], *result)
+        self._entries.move_to_end(cache_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def record_not_modified(self, name):
+        self.counters[name]["not_modified"] += 1
+
+    def invalidate(self, name, key=None, match=None):
+        """name 엔드포인트의 캐시를 비웁니다 (key를 주면 그 항목만, match를 주면 match(key)가 참인 항목만)."""
+        self.counters[name]["invalidations"] += 1
+        if key is None and match is None:
+            self._generations[name] = self._generations.get(name, 0) + 1
+            for table in (self._entries, self._inflight):
+                for cache_key in [k for k in table if k[0] == name]:
+                    del table[cache_key]
+            return
+        selected = match if match is not None else (lambda k: k == key)
+        for cache_key in [k for k in self._entries if k[0] == name and selected(k[1])]:
+            del self._entries[cache_key]
+        # 무효화 전에 시작된 계산은 결과를 저장하지 않고, 새 요청도 합류하지 않게 한다
+        for cache_key in [k for k in self._inflight if k[0] == name and selected(k[1])]:
+            self._stale.add(self._inflight.pop(cache_key))
+
+    def stats(self):
+        endpoints = {}
+        for name, counters in self.counters.items():
+            # 계산 중인 결과를 함께 기다린 요청(coalesced)도 DB를 조회하지 않았으므로 적중으로 센다
+            served = counters["hits"] + counters["coalesced"]
+            lookups = served + counters["misses"]
+            endpoints[name] = {
+                "ttl_seconds": self.ttls[name],
+                **counters,
+                "hit_rate": round(served / lookups, 3) if lookups else 0.0,
+            }
+        return {"enabled": self.enabled, "entries": len(self._entries), "max_entries": self.max_entries,
+                "endpoints": endpoints}
+
+response_cache = ResponseCache()
@@ -0,0 +1,117 @@
+### runtime_config.py (CPU 추론 스레드 수 / 코어 고정 / 실행기 크기 설정)
+# 적용된 값은 /inference_stats의 runtime 항목에 표시된다. 하드웨어에 맞는 조합은 기사/초로 비교해 고른다:
+#   python benchmarks/bench_threads.py --workers 0 1 2 --intra 1 2 4 --affinity "" auto
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+def _int_env(name):
+    value = os.getenv(name)
+    return int(value) if value else None
+
+# ✅ 런타임 설정 (환경 변수, 비워 두면 라이브러리 기본값)
+INTRA_OP_THREADS = _int_env("INFERENCE_INTRA_OP_THREADS")  # 연산 하나를 나눠 실행하는 PyTorch 스레드 수
+INTER_OP_THREADS = _int_env("INFERENCE_INTER_OP_THREADS")  # 독립 연산을 동시에 실행하는 PyTorch 스레드 수
+# 추론 워커 코어 고정: "" (고정 안 함) / "auto" (예약 코어를 뺀 나머지를 워커별로 나눔) / "2-7,10" (사용할 코어 목록)
+CPU_AFFINITY = os.getenv("INFERENCE_CPU_AFFINITY", "")
+RESERVED_CORES = int(os.getenv("INFERENCE_RESERVED_CORES", 1))  # API/크롤러용으로 남겨 둘 코어 수
+EXECUTOR_MAX_WORKERS = _int_env("EXECUTOR_MAX_WORKERS")  # asyncio.to_thread 기본 실행기 스레드 수
+
+# HF 토크나이저의 자체 스레드 풀이 PyTorch 스레드와 코어를 다투지 않도록 기본으로 끈다
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "false")
+
+def parse_cpu_list(spec):
+    """ "0-3,8" 형식의 코어 목록을 [0, 1, 2, 3, 8]로 변환합니다."""
+    cores = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-")
+            cores.extend(range(int(start), int(end) + 1))
+        else:
+            cores.append(int(part))
+    return sorted(set(cores))
+
+def available_cores():
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+def inference_cores():
+    """추론에 쓸 코어 목록 (코어 고정을 하지 않으면 None)"""
+    if not CPU_AFFINITY:
+        return None
+    cores = available_cores()
+    if CPU_AFFINITY == "auto":
+        return cores[RESERVED_CORES:] if len(cores) > RESERVED_CORES else cores
+    return [core for core in parse_cpu_list(CPU_AFFINITY) if core in cores] or cores
+
+def worker_cores(index, workers):
+    """index번째 워커에 줄 연속된 코어 묶음 (코어 고정을 하지 않으면 None)"""
+    cores = inference_cores()
+    if cores is None:
+        return None
+    size, extra = divmod(len(cores), workers)
+    if size == 0:
+        # 워커가 코어보다 많으면 돌아가며 하나씩 공유
+        return [cores[index % len(cores)]]
+    start = index * size + min(index, extra)
+    return cores[start:start + size + (1 if index < extra else 0)]
+
+def default_intra_op_threads(workers, cores=None):
+    """지정값이 없으면 고정된 코어 수, 그것도 없으면 예약 코어를 뺀 코어를 워커 수로 나눈 값"""
+    if INTRA_OP_THREADS:
+        return INTRA_OP_THREADS
+    if cores:
+        return len(cores)
+    return max(1, ((os.cpu_count() or 2) - RESERVED_CORES) // workers)
+
+def configure_torch_threads(intra_op_threads=None, inter_op_threads=None):
+    """PyTorch/OpenMP 스레드 수를 설정합니다 (torch import 전에 호출해야 OpenMP 설정까지 적용)."""
+    if intra_op_threads:
+        os.environ["OMP_NUM_THREADS"] = str(intra_op_threads)
+        os.environ["MKL_NUM_THREADS"] = str(intra_op_threads)
+    import torch
+    if intra_op_threads:
+        torch.set_num_threads(intra_op_threads)
+    if inter_op_threads:
+        try:
+            torch.set_num_interop_threads(inter_op_threads)
+        except RuntimeError:
+            # 병렬 작업이 한 번이라도 실행된 뒤에는 바꿀 수 없다
+            pass
+
+def pin_current_process(cores):
+    if cores and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, cores)
+
+def configure_worker_process(index, workers):
+    """추론 워커 프로세스 시작 시: 코어 고정 후 그 코어 수에 맞춰 스레드 수를 설정합니다."""
+    cores = worker_cores(index, workers)
+    pin_current_process(cores)
+    intra_op_threads = default_intra_op_threads(workers, cores)
+    configure_torch_threads(intra_op_threads, INTER_OP_THREADS or 1)
+    return {"cores": cores, "intra_op_threads": intra_op_threads, "inter_op_threads": INTER_OP_THREADS or 1}
+
+def configure_inprocess_inference():
+    """API/크롤러 프로세스 안에서 모델을 로드하기 전에 호출 (설정된 값만 적용, 프로세스 전체 코어 고정은 하지 않음)."""
+    if INTRA_OP_THREADS or INTER_OP_THREADS:
+        configure_torch_threads(INTRA_OP_THREADS, INTER_OP_THREADS)
+
+def configure_event_loop(loop):
+    """asyncio.to_thread가 쓰는 기본 실행기의 스레드 수를 제한합니다."""
+    if EXECUTOR_MAX_WORKERS:
+        loop.set_default_executor(ThreadPoolExecutor(max_workers=EXECUTOR_MAX_WORKERS,
+                                                     thread_name_prefix="to_thread"))
+
+def runtime_settings():
+    return {
+        "intra_op_threads": INTRA_OP_THREADS,
+        "inter_op_threads": INTER_OP_THREADS,
+        "cpu_affinity": CPU_AFFINITY or None,
+        "inference_cores": inference_cores(),
+        "reserved_cores": RESERVED_CORES,
+        "executor_max_workers": EXECUTOR_MAX_WORKERS,
+        "tokenizers_parallelism": os.environ.get("TOKENIZERS_PARALLELISM"),
+    }
@@ -10,5 +10,79 @@ CREATE TABLE IF NOT EXISTS articles (
     summary TEXT,
     sentiment VARCHAR(50),
     sentiment_score FLOAT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    -- /articles 커서 페이지네이션 (최신순 + 섹션 / 감성 필터)
+    INDEX idx_articles_created (created_at, id),
+    INDEX idx_articles_section_created (section, created_at, id),
+    INDEX idx_articles_sentiment_created (sentiment, created_at, id)
 );
+
+-- 기존 테이블에는 한 번 실행:
+-- ALTER TABLE articles
+--     ADD INDEX idx_articles_created (created_at, id),
+--     ADD INDEX idx_articles_section_created (section, created_at, id),
+--     ADD INDEX idx_articles_sentiment_created (sentiment, created_at, id);
+
+-- /statistics 집계 테이블 (articles 변경 시 아래 트리거가 갱신, 기존 데이터는 python article_stats.py --rebuild)
+CREATE TABLE IF NOT EXISTS article_section_stats (
+    section VARCHAR(50) PRIMARY KEY,
+    article_count INT NOT NULL DEFAULT 0,
+    scored_count INT NOT NULL DEFAULT 0,  -- sentiment_score가 있는 기사 수 (평균 계산용)
+    sentiment_sum DOUBLE NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS article_daily_stats (
+    stat_date DATE PRIMARY KEY,
+    article_count INT NOT NULL DEFAULT 0
+);
+
+DROP TRIGGER IF EXISTS articles_stats_insert;
+DROP TRIGGER IF EXISTS articles_stats_update;
+DROP TRIGGER IF EXISTS articles_stats_delete;
+
+DELIMITER //
+
+CREATE TRIGGER articles_stats_insert AFTER INSERT ON articles FOR EACH ROW
+BEGIN
+    INSERT INTO article_section_stats (section, article_count, scored_count, sentiment_sum)
+    VALUES (NEW.section, 1, NEW.sentiment_score IS NOT NULL, COALESCE(NEW.sentiment_score, 0))
+    ON DUPLICATE KEY UPDATE article_count = article_count + 1,
+                            scored_count = scored_count + (NEW.sentiment_score IS NOT NULL),
+                            sentiment_sum = sentiment_sum + COALESCE(NEW.sentiment_score, 0);
+    INSERT INTO article_daily_stats (stat_date, article_count) VALUES (DATE(NEW.created_at), 1)
+    ON DUPLICATE KEY UPDATE article_count = article_count + 1;
+END//
+
+-- db_cleanup.py의 감성 점수 보정 등 (섹션 / 날짜 / 점수가 바뀌면 이전 값을 빼고 새 값을 더한다)
+CREATE TRIGGER articles_stats_update AFTER UPDATE ON articles FOR EACH ROW
+BEGIN
+    IF NOT (OLD.section <=> NEW.section) OR NOT (OLD.sentiment_score <=> NEW.sentiment_score) THEN
+        UPDATE article_section_stats
+        SET article_count = article_count - 1,
+            scored_count = scored_count - (OLD.sentiment_score IS NOT NULL),
+            sentiment_sum = sentiment_sum - COALESCE(OLD.sentiment_score, 0)
+        WHERE section = OLD.section;
+        INSERT INTO article_section_stats (section, article_count, scored_count, sentiment_sum)
+        VALUES (NEW.section, 1, NEW.sentiment_score IS NOT NULL, COALESCE(NEW.sentiment_score, 0))
+        ON DUPLICATE KEY UPDATE article_count = article_count + 1,
+                                scored_count = scored_count + (NEW.sentiment_score IS NOT NULL),
+                                sentiment_sum = sentiment_sum + COALESCE(NEW.sentiment_score, 0);
+    END IF;
+    IF NOT (DATE(OLD.created_at) <=> DATE(NEW.created_at)) THEN
+        UPDATE article_daily_stats SET article_count = article_count - 1 WHERE stat_date = DATE(OLD.created_at);
+        INSERT INTO article_daily_stats (stat_date, article_count) VALUES (DATE(NEW.created_at), 1)
+        ON DUPLICATE KEY UPDATE article_count = article_count + 1;
+    END IF;
+END//
+
+CREATE TRIGGER articles_stats_delete AFTER DELETE ON articles FOR EACH ROW
+BEGIN
+    UPDATE article_section_stats
+    SET article_count = article_count - 1,
+        scored_count = scored_count - (OLD.sentiment_score IS NOT NULL),
+        sentiment_sum = sentiment_sum - COALESCE(OLD.sentiment_score, 0)
+    WHERE section = OLD.section;
+    UPDATE article_daily_stats SET article_count = article_count - 1 WHERE stat_date = DATE(OLD.created_at);
+END//
+
+DELIMITER ;
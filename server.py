@@ -1,11 +1,24 @@
 ### server.py (FastAPI 백엔드 서버)
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query, Header
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
+from typing import Optional
 import uvicorn
-from db import get_db_connection
-from news_scraper import analyze_section
+from db import get_connection_pool, db_pool_stats
+import async_db
+from response_cache import response_cache, etag_matches
+from url_filter import known_urls
+from news_scraper import analyze_section, iter_analyze_section, inference_stats, preload_models, DEFAULT_PROFILE
+from crawl_scheduler import get_scheduler, close_crawl_session
+from http_cache import get_http_cache
+from runtime_config import configure_event_loop
 from datetime import datetime, timedelta
+import asyncio
+import base64
+import json
+import logging
+import os
 
 # ✅ FastAPI 인스턴스 생성 (중복 방지)
 app = FastAPI()
@@ -19,44 +32,81 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# ✅ to_thread 실행기 크기 제한 (runtime_config.py)
+@app.on_event("startup")
+async def configure_executor():
+    configure_event_loop(asyncio.get_running_loop())
+
+# ✅ 모델 워밍업 (PRELOAD_MODELS=1이면 서버 시작을 막지 않고 백그라운드에서 모델 로드)
+# 시작 시간 측정: python benchmarks/bench_startup.py --serve --preload
+PRELOAD_MODELS = os.getenv("PRELOAD_MODELS", "0") == "1"
+
+async def _preload_models():
+    try:
+        await asyncio.to_thread(preload_models)
+        logging.info("요약/감성 분석 모델 워밍업 완료")
+    except Exception as e:
+        logging.error(f"모델 워밍업 중 오류 발생: {str(e)}")
+
+@app.on_event("startup")
+async def warmup_models():
+    if PRELOAD_MODELS:
+        app.state.preload_task = asyncio.create_task(_preload_models())
+
+# ✅ 서버 종료 시 공유 HTTP 커넥션 풀 정리
+@app.on_event("shutdown")
+async def shutdown_http_client():
+    await close_crawl_session()
+
+# ✅ 서버 종료 시 DB 커넥션 풀 정리
+@app.on_event("shutdown")
+async def shutdown_db_pool():
+    get_connection_pool().close()
+    await async_db.close_async_pool()
+
 @app.get("/")
 def read_root():
     return {"message": "FastAPI 서버가 실행 중입니다."}
 
-# ✅ 통계 데이터 API
-@app.get("/statistics")
-def get_statistics():
-    connection = get_db_connection()
-    cursor = connection.cursor(dictionary=True)
-
+# ✅ 조회 API 응답 캐시 (response_cache.py)
+# 캐시된 본문의 ETag가 If-None-Match와 같으면 본문 없이 304를 반환한다
+async def cached_json(name, key, if_none_match, compute):
+    body, etag = await response_cache.get(name, key, compute)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(if_none_match, etag):
+        response_cache.record_not_modified(name)
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+# ✅ 통계 데이터 API (트리거가 갱신하는 집계 테이블에서 조회, schema.sql / article_stats.py 참고)
+async def load_statistics():
     try:
+        # 섹션별 기사 수 / 감성 점수 합계 (섹션 수만큼의 행)
+        rows = await async_db.fetch_all(
+            "SELECT section, article_count, scored_count, sentiment_sum FROM article_section_stats "
+            "WHERE article_count > 0")
+        section_counts = {row["section"]: row["article_count"] for row in rows}
+
         # 전체 기사 수
-        cursor.execute("SELECT COUNT(*) as count FROM articles")
-        total_articles = cursor.fetchone()["count"]
+        total_articles = sum(section_counts.values())
+
+        # 평균 감성 점수 (점수가 있는 기사 기준, AVG(sentiment_score)와 동일)
+        scored = sum(row["scored_count"] for row in rows)
+        avg_sentiment = sum(row["sentiment_sum"] for row in rows) / scored if scored else 0
+
+        # 일별 기사 수 추이 (최근 7일, 오늘 포함)
+        today = datetime.now().date()
+        seven_days_ago = today - timedelta(days=7)
+        rows = await async_db.fetch_all("""
+            SELECT stat_date, article_count 
+            FROM article_daily_stats 
+            WHERE stat_date >= %s AND article_count > 0
+            ORDER BY stat_date
+        """, (seven_days_ago,))
+        daily_counts = {row["stat_date"].strftime("%Y-%m-%d"): row["article_count"] for row in rows}
 
         # 오늘 수집된 기사 수
-        today = datetime.now().strftime("%Y-%m-%d")
-        cursor.execute("SELECT COUNT(*) as count FROM articles WHERE DATE(created_at) = %s", (today,))
-        today_articles = cursor.fetchone()["count"]
-
-        # 평균 감성 점수
-        cursor.execute("SELECT AVG(sentiment_score) as avg_score FROM articles")
-        avg_sentiment = cursor.fetchone()["avg_score"] or 0
-
-        # 섹션별 기사 수
-        cursor.execute("SELECT section, COUNT(*) as count FROM articles GROUP BY section")
-        section_counts = {row["section"]: row["count"] for row in cursor.fetchall()}
-
-        # 일별 기사 수 추이 (최근 7일)
-        seven_days_ago = (datetime.now() - timedelta(days=7)).strftime("%Y-%m-%d")
-        cursor.execute("""
-            SELECT DATE(created_at) as date, COUNT(*) as count 
-            FROM articles 
-            WHERE DATE(created_at) >= %s 
-            GROUP BY DATE(created_at)
-            ORDER BY date
-        """, (seven_days_ago,))
-        daily_counts = {row["date"].strftime("%Y-%m-%d"): row["count"] for row in cursor.fetchall()}
+        today_articles = daily_counts.get(today.strftime("%Y-%m-%d"), 0)
 
         return {
             "total_articles": total_articles,
@@ -69,14 +119,65 @@ def get_statistics():
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        cursor.close()
-        connection.close()
+@app.get("/statistics")
+async def get_statistics(if_none_match: Optional[str] = Header(None)):
+    return await cached_json("statistics", None, if_none_match, load_statistics)
 
 # ✅ 뉴스 크롤링 API
+# profile: 요약 생성 프로파일 (fast / balanced / quality)
+# deadline: 기사별 요약 마감 시간(초), 초과하면 더 가벼운 프로파일로 요약
+# 증분 크롤링(crawl_cursor.json)은 크롤러 서비스 전용이라 API에서는 사용하지 않는다
 @app.get("/analyze_section/")
-async def analyze_news_section(section: str, count: int = 10):
-    return await analyze_section(section, count)
+async def analyze_news_section(section: str, count: int = Query(10, ge=1), skip_known: bool = False,
+                               profile: str = DEFAULT_PROFILE, deadline: Optional[float] = None):
+    return await analyze_section(section, count, skip_known=skip_known, profile=profile, deadline=deadline)
+
+# ✅ 뉴스 크롤링 스트리밍 API (기사별 분석이 끝나는 즉시 한 줄씩 전송)
+@app.get("/analyze_section/stream")
+async def analyze_news_section_stream(section: str, count: int = Query(10, ge=1), skip_known: bool = False,
+                                      format: str = "ndjson",
+                                      profile: str = DEFAULT_PROFILE, deadline: Optional[float] = None):
+    if format not in ("ndjson", "sse"):
+        raise HTTPException(status_code=400, detail="format은 ndjson 또는 sse만 지원합니다.")
+
+    async def stream():
+        async for item in iter_analyze_section(section, count, skip_known=skip_known,
+                                               profile=profile, deadline=deadline):
+            line = json.dumps(item, ensure_ascii=False)
+            if format == "sse":
+                event = "error" if "error" in item else "article"
+                yield f"event: {event}\ndata: {line}\n\n"
+            else:
+                yield line + "\n"
+        if format == "sse":
+            yield "event: done\ndata: {}\n\n"
+
+    media_type = "text/event-stream" if format == "sse" else "application/x-ndjson"
+    return StreamingResponse(stream(), media_type=media_type, headers={"Cache-Control": "no-cache"})
+
+# ✅ 크롤링 지표 API (스케줄러 대기열 길이, 초당 요청 수, HTTP 캐시 적중)
+@app.get("/crawl_stats")
+async def get_crawl_stats():
+    stats = get_scheduler().stats()
+    stats["http_cache"] = get_http_cache().stats()
+    return stats
+
+# ✅ 추론 브로커 지표 API (모델별 배치 크기 / 대기 시간 히스토그램)
+@app.get("/inference_stats")
+async def get_inference_stats():
+    return inference_stats()
+
+# ✅ 응답 캐시 지표 API (엔드포인트별 적중 / 미적중 / 304 응답 / 무효화 횟수)
+@app.get("/cache_stats")
+async def get_cache_stats():
+    return response_cache.stats()
+
+# ✅ DB 커넥션 풀 지표 API (사용 중 / 유휴 커넥션 수, 커넥션 대기 시간 히스토그램, async: API 엔드포인트용 비동기 풀)
+@app.get("/db_stats")
+async def get_db_stats():
+    stats = db_pool_stats()
+    stats["async"] = async_db.async_pool_stats()
+    return stats
 
 # ✅ 데이터 모델 정의 (기사 저장 시 유효성 검사)
 class Article(BaseModel):
@@ -90,14 +191,10 @@ class Article(BaseModel):
 
 # ✅ 기사 저장 API
 @app.post("/save_article")
-def save_article(article: Article):
-    connection = get_db_connection()
-    cursor = connection.cursor(dictionary=True)
-
+async def save_article(article: Article):
     try:
         # ✅ URL 중복 여부 확인
-        cursor.execute("SELECT id FROM articles WHERE url = %s", (article.url,))
-        existing = cursor.fetchone()
+        existing = await async_db.fetch_one("SELECT id FROM articles WHERE url = %s", (article.url,))
 
         if existing:
             print(f"⚠️ 이미 저장된 기사입니다: ID={existing['id']}")
@@ -119,10 +216,13 @@ def save_article(article: Article):
         )
 
         print("🟢 [DEBUG] SQL 실행:", values)
-        cursor.execute(query, values)
-        connection.commit()
+        _, inserted_id = await async_db.execute(query, values)
 
-        inserted_id = cursor.lastrowid
+        known_urls.add(article.url)
+        response_cache.invalidate("statistics")
+        # 새 기사는 가장 최신이라 커서 없는 첫 페이지 중 섹션/감성 조건이 맞는 목록에만 나타난다
+        response_cache.invalidate("articles", match=lambda key: key[1] is None
+                                  and key[2] in (None, article.section) and key[3] in (None, article.sentiment))
         print("✅ 저장 성공! ID:", inserted_id)
         return {"message": "기사 저장 완료", "id": inserted_id}
 
@@ -130,74 +230,100 @@ def save_article(article: Article):
         print("🔴 [ERROR] MySQL 저장 중 오류 발생:", str(e))
         raise HTTPException(status_code=500, detail=f"MySQL 오류: {str(e)}")
 
-    finally:
-        cursor.close()
-        connection.close()
-
-@app.get("/articles")
-def get_articles():
-    connection = get_db_connection()
-    cursor = connection.cursor(dictionary=True)
-
+# ✅ 기사 목록 필드 묶음 (id, created_at은 다음 페이지 커서에 필요하여 항상 포함)
+ARTICLE_FIELD_SETS = {
+    "list": ["id", "section", "title", "url", "sentiment", "sentiment_score", "created_at"],
+    "summary": ["id", "section", "title", "url", "summary", "sentiment", "sentiment_score", "created_at"],
+    "full": ["id", "section", "title", "url", "content", "summary", "sentiment", "sentiment_score", "created_at"],
+}
+ARTICLES_PAGE_SIZE = 50
+ARTICLES_MAX_PAGE_SIZE = 200
+
+def encode_cursor(article):
+    """마지막 기사의 (created_at, id)를 다음 페이지 커서 문자열로 만듭니다."""
+    raw = json.dumps([article["created_at"].isoformat(sep=" "), article["id"]])
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decode_cursor(cursor):
     try:
-        # ✅ `section` 컬럼 추가하여 가져오기
-        cursor.execute("SELECT id, section, title, summary, sentiment, sentiment_score FROM articles ORDER BY created_at DESC")
-        articles = cursor.fetchall()
-        return {"articles": articles}
-
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-    finally:
-        cursor.close()
-        connection.close()
+        created_at, article_id = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        return datetime.fromisoformat(created_at), int(article_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 cursor 값입니다.")
+
+# ✅ 기사 목록 API (최신순, (created_at, id) 커서 기반 페이지네이션)
+# cursor: 이전 응답의 next_cursor (없으면 첫 페이지), section / sentiment: 서버 측 필터
+# fields: list (목록용) / summary (요약 포함, 기본값) / full (본문 포함)
+@app.get("/articles")
+async def get_articles(limit: int = Query(ARTICLES_PAGE_SIZE, ge=1, le=ARTICLES_MAX_PAGE_SIZE),
+                       cursor: Optional[str] = None, section: Optional[str] = None,
+                       sentiment: Optional[str] = None, fields: str = "summary",
+                       if_none_match: Optional[str] = Header(None)):
+    if fields not in ARTICLE_FIELD_SETS:
+        raise HTTPException(status_code=400, detail=f"fields는 {', '.join(ARTICLE_FIELD_SETS)} 중 하나여야 합니다.")
+
+    conditions, params = [], []
+    if section:
+        conditions.append("section = %s")
+        params.append(section)
+    if sentiment:
+        conditions.append("sentiment = %s")
+        params.append(sentiment)
+    if cursor:
+        # (created_at, id) < (커서) 조건을 인덱스 범위 검색이 가능한 형태로 풀어 쓴다
+        created_at, article_id = decode_cursor(cursor)
+        conditions.append("(created_at < %s OR (created_at = %s AND id < %s))")
+        params.extend([created_at, created_at, article_id])
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    async def load_articles():
+        try:
+            # 다음 페이지가 있는지 알기 위해 한 건 더 조회
+            articles = await async_db.fetch_all(
+                f"SELECT {', '.join(ARTICLE_FIELD_SETS[fields])} FROM articles {where} "
+                f"ORDER BY created_at DESC, id DESC LIMIT %s", (*params, limit + 1))
+        except Exception as e:
+            raise HTTPException(status_code=500, detail=str(e))
+
+        has_more = len(articles) > limit
+        articles = articles[:limit]
+        return {"articles": articles, "next_cursor": encode_cursor(articles[-1]) if has_more else None}
+
+    return await cached_json("articles", (limit, cursor, section, sentiment, fields), if_none_match, load_articles)
 
 # ✅ 특정 기사 상세 조회 API
-@app.get("/article/{article_id}")
-def get_article_detail(article_id: int):
-    connection = get_db_connection()
-    cursor = connection.cursor(dictionary=True)
-
+async def load_article(article_id):
     try:
-        cursor.execute("SELECT * FROM articles WHERE id = %s", (article_id,))
-        article = cursor.fetchone()
-        if article:
-            print("🟢 상세 조회 성공:", article)  # ✅ 로그 추가
-            return article
-        else:
-            raise HTTPException(status_code=404, detail="해당 기사를 찾을 수 없습니다.")
-
+        article = await async_db.fetch_one("SELECT * FROM articles WHERE id = %s", (article_id,))
     except Exception as e:
         print("🔴 DB 조회 중 오류:", str(e))  # ✅ 로그로 에러 확인
         raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        cursor.close()
-        connection.close()
+    if not article:
+        raise HTTPException(status_code=404, detail="해당 기사를 찾을 수 없습니다.")
+    print("🟢 상세 조회 성공:", article)  # ✅ 로그 추가
+    return article
+
+@app.get("/article/{article_id}")
+async def get_article_detail(article_id: int, if_none_match: Optional[str] = Header(None)):
+    return await cached_json("article", article_id, if_none_match, lambda: load_article(article_id))
 
 
 # ✅ 특정 기사 삭제 API 추가
 @app.delete("/delete_article/{article_id}")
-def delete_article(article_id: int):
-    connection = get_db_connection()
-    cursor = connection.cursor()
-
+async def delete_article(article_id: int):
     try:
         # 기사 삭제 SQL 실행
-        cursor.execute("DELETE FROM articles WHERE id = %s", (article_id,))
-        connection.commit()
-
-        if cursor.rowcount == 0:
-            raise HTTPException(status_code=404, detail="해당 기사를 찾을 수 없습니다.")
-
-        return {"message": "기사 삭제 완료"}
-    
+        deleted, _ = await async_db.execute("DELETE FROM articles WHERE id = %s", (article_id,))
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
-    finally:
-        cursor.close()
-        connection.close()
+    if deleted == 0:
+        raise HTTPException(status_code=404, detail="해당 기사를 찾을 수 없습니다.")
+    response_cache.invalidate("statistics")
+    response_cache.invalidate("articles")
+    response_cache.invalidate("article", article_id)
+    return {"message": "기사 삭제 완료"}
 
 # ✅ FastAPI 서버 실행
 if __name__ == "__main__":
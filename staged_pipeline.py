@@ -0,0 +1,123 @@
+### staged_pipeline.py (큐로 연결된 단계별 비동기 파이프라인)
+# 네트워크 요청과 모델 추론이 겹쳐 실행되고, 뒤 단계가 밀리면 앞 단계가 기다린다 (backpressure).
+# 단계별 동시 처리 수는 news_scraper.py의 *_WORKERS 상수로 조정하며, 실행이 끝나면 단계별 처리 현황을 로그에 남긴다.
+import asyncio
+import logging
+import time
+
+QUEUE_SIZE = 16  # 단계 사이 큐 크기 (가득 차면 앞 단계가 기다린다 = backpressure)
+BATCH_WAIT = 0.05  # 배치 단계가 첫 항목을 받은 뒤 배치를 채우기 위해 기다리는 최대 시간 (초)
+
+_DONE = object()  # 단계 종료 신호
+
+class Stage:
+    """파이프라인의 한 단계. func가 None을 반환하면 해당 항목은 다음 단계로 넘기지 않습니다.
+    batch_size가 1보다 크면 func는 항목 리스트를 받아 같은 길이의 결과 리스트를 반환합니다."""
+
+    def __init__(self, name, func, workers=1, batch_size=1, batch_wait=BATCH_WAIT):
+        self.name = name
+        self.func = func
+        self.workers = workers
+        self.batch_size = batch_size
+        self.batch_wait = batch_wait
+        self.batches = 0
+        self.processed = 0
+        self.dropped = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "batches": self.batches,
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "errors": self.errors,
+            "busy_seconds": round(self.busy_seconds, 2),
+        }
+
+async def _next_batch(stage, in_queue):
+    """다음 배치와 종료 신호 수신 여부를 반환합니다."""
+    item = await in_queue.get()
+    if item is _DONE:
+        return [], True
+    batch = [item]
+    deadline = asyncio.get_running_loop().time() + stage.batch_wait
+    while len(batch) < stage.batch_size:
+        timeout = deadline - asyncio.get_running_loop().time()
+        if timeout <= 0:
+            break
+        # wait_for는 취소와 완료가 겹치면 취소를 삼킬 수 있어 asyncio.wait로 기다린다
+        getter = asyncio.ensure_future(in_queue.get())
+        try:
+            await asyncio.wait({getter}, timeout=timeout)
+        finally:
+            if not getter.done():
+                getter.cancel()
+        if not getter.done() or getter.cancelled():
+            break
+        item = getter.result()
+        if item is _DONE:
+            return batch, True
+        batch.append(item)
+    return batch, False
+
+async def _stage_worker(stage, in_queue, out_queue):
+    done = False
+    while not done:
+        batch, done = await _next_batch(stage, in_queue)
+        if not batch:
+            continue
+        started = time.perf_counter()
+        try:
+            if stage.batch_size > 1:
+                results = await stage.func(batch)
+            else:
+                results = [await stage.func(batch[0])]
+        except Exception as e:
+            # 항목(배치) 단위로 오류를 격리하여 나머지 항목은 계속 처리
+            stage.errors += len(batch)
+            logging.error(f"[{stage.name}] 단계 처리 중 오류 발생: {str(e)}")
+            results = [None] * len(batch)
+        finally:
+            stage.busy_seconds += time.perf_counter() - started
+        stage.batches += 1
+        for result in results:
+            if result is None:
+                stage.dropped += 1
+                continue
+            stage.processed += 1
+            await out_queue.put(result)
+
+async def _run_stage(stage, in_queue, out_queue, next_workers):
+    await asyncio.gather(*(_stage_worker(stage, in_queue, out_queue) for _ in range(stage.workers)))
+    for _ in range(next_workers):
+        await out_queue.put(_DONE)
+
+async def _feed(items, queue, workers):
+    for item in items:
+        await queue.put(item)
+    for _ in range(workers):
+        await queue.put(_DONE)
+
+async def run_pipeline(items, stages, queue_size=QUEUE_SIZE):
+    """items를 stages 순서대로 흘려보내며, 마지막 단계를 통과한 항목을 완료 순서대로 내보냅니다."""
+    queues = [asyncio.Queue(maxsize=queue_size) for _ in range(len(stages) + 1)]
+    tasks = [asyncio.create_task(_feed(items, queues[0], stages[0].workers))]
+    for i, stage in enumerate(stages):
+        next_workers = stages[i + 1].workers if i + 1 < len(stages) else 1
+        tasks.append(asyncio.create_task(_run_stage(stage, queues[i], queues[i + 1], next_workers)))
+
+    try:
+        while True:
+            item = await queues[-1].get()
+            if item is _DONE:
+                break
+            yield item
+    finally:
+        # 소비자가 중간에 멈추면 모든 단계를 정리
+        for task in tasks:
+            task.cancel()
+        logging.info("파이프라인 단계별 처리 현황: " + ", ".join(
+            f"{stage.name}={stage.stats()}" for stage in stages
+        ))
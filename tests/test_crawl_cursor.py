@@ -0,0 +1,36 @@
+### tests/test_crawl_cursor.py (증분 크롤링 커서: 처리된 구간까지만 전진, 반복 실패 건너뛰기)
+from crawl_cursor import CrawlCursor, processed_tail
+
+def test_processed_tail_stops_below_newest_failure():
+    covered = ["n5", "n4", "n3", "n2", "n1"]  # 최신순
+    assert processed_tail(covered, {"n5", "n4", "n2", "n1"}) == ["n2", "n1"]
+    assert processed_tail(covered, set(covered)) == covered
+    assert processed_tail(covered, {"n4", "n3"}) == []
+
+def test_advance_keeps_failed_url_until_max_attempts(tmp_path):
+    cursor = CrawlCursor(str(tmp_path / "cursor.json"), max_attempts=2)
+    covered = ["n3", "n2", "n1"]
+    assert cursor.advance("경제", covered, {"n3", "n1"}) == []
+    assert cursor.seen_urls("경제") == {"n1"}
+    assert cursor.advance("경제", covered, {"n3", "n1"}) == ["n2"]
+    assert cursor.seen_urls("경제") == {"n3", "n2", "n1"}
+    assert cursor.data["경제"]["failures"] == {}
+
+def test_interrupted_run_does_not_count_failures(tmp_path):
+    cursor = CrawlCursor(str(tmp_path / "cursor.json"), max_attempts=1)
+    assert cursor.advance("IT", ["n2", "n1"], {"n1"}, count_failures=False) == []
+    assert cursor.seen_urls("IT") == {"n1"}
+
+def test_advance_does_not_overwrite_other_sections(tmp_path):
+    path = str(tmp_path / "cursor.json")
+    first, second = CrawlCursor(path), CrawlCursor(path)
+    first.advance("정치", ["a"], {"a"})
+    second.advance("사회", ["b"], {"b"})
+    assert CrawlCursor(path).seen_urls("정치") == {"a"}
+    assert CrawlCursor(path).seen_urls("사회") == {"b"}
+
+def test_cursor_is_capped_to_size(tmp_path):
+    cursor = CrawlCursor(str(tmp_path / "cursor.json"), size=3)
+    cursor.advance("세계", ["a", "b"], {"a", "b"})
+    cursor.advance("세계", ["c", "d"], {"c", "d"})
+    assert cursor.data["세계"]["urls"] == ["c", "d", "a"]
@@ -0,0 +1,48 @@
+### tests/test_http_cache.py (HTTP 캐시: 크기 추적과 LRU 삭제)
+import http_cache
+from http_cache import HttpCache
+
+def total_rows(cache):
+    return cache.conn.execute("SELECT COALESCE(SUM(size), 0) FROM http_cache").fetchone()[0]
+
+def test_total_size_tracks_insert_update_and_delete(tmp_path):
+    cache = HttpCache(str(tmp_path / "cache.sqlite3"), max_bytes=10_000)
+    cache.put("a", b"x" * 100)
+    cache.put("b", b"x" * 200)
+    cache.put("a", b"x" * 50)  # 같은 URL 갱신
+    assert cache.stats()["bytes"] == total_rows(cache) == 250
+    assert cache.stats()["entries"] == 2
+
+def test_existing_file_is_summed_once(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    HttpCache(path).put("a", b"x" * 100)
+    cache = HttpCache(path)
+    assert cache.stats()["bytes"] == 100
+
+def test_evicts_least_recently_used_down_to_target(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "EVICT_BATCH", 1)
+    cache = HttpCache(str(tmp_path / "cache.sqlite3"), max_bytes=1000)
+    for url in ("a", "b", "c", "d"):
+        cache.put(url, b"x" * 240)
+    assert cache.get("a") is not None  # a를 최근 사용으로 (put 때 기록)
+    cache.put("e", b"x" * 240)
+    urls = {row[0] for row in cache.conn.execute("SELECT url FROM http_cache")}
+    assert urls == {"a", "d", "e"}
+    assert total_rows(cache) == cache.stats()["bytes"] <= 1000 * http_cache.EVICT_TARGET_RATIO
+
+def test_hits_are_written_in_batches(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "ACCESS_FLUSH_ITEMS", 2)
+    cache = HttpCache(str(tmp_path / "cache.sqlite3"))
+    cache.put("a", b"a")
+    cache.put("b", b"b")
+
+    def accessed():
+        return dict(cache.conn.execute("SELECT url, accessed_at FROM http_cache"))
+
+    before = accessed()
+    cache.get("a")
+    cache.get("a")  # 같은 URL의 적중은 하나로 모인다
+    assert accessed() == before
+    cache.get("b")
+    after = accessed()
+    assert after["a"] > before["a"] and after["b"] > before["b"]
@@ -0,0 +1,131 @@
+### tests/test_inference_broker.py (추론 브로커: 마이크로 배치, 오류 전파, 취소된 요청 처리)
+import asyncio
+import threading
+import pytest
+from inference_broker import InferenceBroker
+
+def recording_batch_fn(calls, transform=lambda item: item * 10):
+    def batch_fn(items):
+        calls.append(list(items))
+        return [transform(item) for item in items]
+    return batch_fn
+
+def test_concurrent_submits_share_one_batch():
+    calls = []
+    broker = InferenceBroker("test", recording_batch_fn(calls), max_batch_size=8, max_wait=0.05)
+
+    async def scenario():
+        return await asyncio.gather(*(broker.submit(i) for i in range(5)))
+
+    assert asyncio.run(scenario()) == [0, 10, 20, 30, 40]
+    assert calls == [[0, 1, 2, 3, 4]]
+    assert broker.stats()["batch_size"]["count"] == 1
+
+def test_full_batch_dispatches_without_waiting():
+    calls = []
+    broker = InferenceBroker("test", recording_batch_fn(calls), max_batch_size=3, max_wait=10)
+
+    async def scenario():
+        return await asyncio.wait_for(broker.submit_many(range(6)), 1)
+
+    assert asyncio.run(scenario()) == [0, 10, 20, 30, 40, 50]
+    assert calls == [[0, 1, 2], [3, 4, 5]]
+
+def test_batch_error_reaches_every_caller():
+    def fail(items):
+        raise RuntimeError("model error")
+
+    broker = InferenceBroker("test", fail, max_wait=0.01)
+
+    async def scenario():
+        return await asyncio.gather(broker.submit(1), broker.submit(2), return_exceptions=True)
+
+    results = asyncio.run(scenario())
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+def test_requests_cancelled_while_queued_are_not_run():
+    calls = []
+    broker = InferenceBroker("test", recording_batch_fn(calls), max_wait=0.05)
+
+    async def scenario():
+        cancelled = asyncio.ensure_future(broker.submit(1))
+        kept = asyncio.ensure_future(broker.submit(2))
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        return await kept
+
+    assert asyncio.run(scenario()) == 20
+    assert calls == [[2]]
+
+def test_requests_cancelled_after_dispatch_are_skipped():
+    # 배치로 보낸 뒤 실행 전에 취소된 요청은 _run_batch에서 빠진다
+    calls = []
+    broker = InferenceBroker("test", recording_batch_fn(calls), max_batch_size=2, max_wait=10)
+
+    async def scenario():
+        first = asyncio.ensure_future(broker.submit(1))
+        await asyncio.sleep(0)
+        second = asyncio.ensure_future(broker.submit(2))
+        await asyncio.sleep(0)  # 두 번째 요청으로 배치가 가득 차 _run_batch Task가 만들어진다
+        first.cancel()
+        return await second
+
+    assert asyncio.run(scenario()) == 20
+    assert calls == [[2]]
+
+def test_cancelled_during_batch_does_not_break_other_callers():
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow(items):
+        started.set()
+        release.wait(2)
+        return [item * 10 for item in items]
+
+    broker = InferenceBroker("test", slow, max_wait=0.01)
+
+    async def scenario():
+        first = asyncio.ensure_future(broker.submit(1))
+        second = asyncio.ensure_future(broker.submit(2))
+        await asyncio.to_thread(started.wait, 2)
+        first.cancel()
+        release.set()
+        # 실행 중 취소된 요청의 결과는 버리고, 같은 배치의 다른 요청과 다음 요청은 정상 처리
+        return await second, await broker.submit(3)
+
+    assert asyncio.run(scenario()) == (20, 30)
+
+def test_concurrent_batches_are_limited():
+    running = []
+    peak = []
+    lock = threading.Lock()
+    release = threading.Event()
+
+    def batch_fn(items):
+        with lock:
+            running.append(1)
+            peak.append(len(running))
+        release.wait(0.1)
+        with lock:
+            running.pop()
+        return items
+
+    broker = InferenceBroker("test", batch_fn, max_batch_size=1, max_wait=0, max_concurrent_batches=2)
+
+    async def scenario():
+        return await broker.submit_many(range(6))
+
+    assert asyncio.run(scenario()) == list(range(6))
+    assert max(peak) == 2
+
+def test_each_event_loop_has_its_own_queue():
+    calls = []
+    broker = InferenceBroker("test", recording_batch_fn(calls), max_wait=0.01)
+    assert asyncio.run(broker.submit(1)) == 10
+    assert asyncio.run(broker.submit(2)) == 20
+    assert calls == [[1], [2]]
+
+@pytest.mark.parametrize("size", [1, 4])
+def test_submit_many_keeps_order(size):
+    broker = InferenceBroker("test", lambda items: [item.upper() for item in items], max_batch_size=size)
+    assert asyncio.run(broker.submit_many(["a", "b", "c"])) == ["A", "B", "C"]
@@ -0,0 +1,51 @@
+### tests/test_inference_cache.py (추론 결과 캐시: 중복 계산 제거, 크기 추적, LRU 삭제)
+import inference_cache
+from inference_cache import InferenceCache, cache_key
+
+def disk_total(cache):
+    return cache.conn.execute("SELECT COALESCE(SUM(size), 0) FROM inference_cache").fetchone()[0]
+
+def test_cached_batch_computes_each_text_once(tmp_path):
+    cache = InferenceCache("summarizer", str(tmp_path / "cache.sqlite3"))
+    computed = []
+
+    def compute(texts):
+        computed.extend(texts)
+        return [text.upper() for text in texts]
+
+    assert cache.cached_batch(["a", "b", "a"], "model", {}, compute) == ["A", "B", "A"]
+    # 공백 차이만 있는 본문은 같은 키
+    assert cache.cached_batch([" a ", "c"], "model", {}, compute) == ["A", "C"]
+    assert computed == ["a", "b", "c"]
+
+def test_uncacheable_results_are_recomputed(tmp_path):
+    cache = InferenceCache("summarizer", str(tmp_path / "cache.sqlite3"))
+    calls = []
+
+    def compute(texts):
+        calls.append(list(texts))
+        return [None for _ in texts]
+
+    cache.cached_batch(["a"], "model", {}, compute)
+    cache.cached_batch(["a"], "model", {}, compute)
+    assert calls == [["a"], ["a"]]
+
+def test_disk_size_is_tracked_across_caches_sharing_a_file(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    summarizer = InferenceCache("summarizer", path)
+    sentiment = InferenceCache("sentiment", path)
+    summarizer.put_many([(cache_key("a", "m", {}), "요약", 0.1)])
+    sentiment.put_many([(cache_key("a", "s", {}), ["긍정", 0.9], 0.01)])
+    summarizer.put_many([(cache_key("a", "m", {}), "더 긴 요약", 0.1)])
+    assert summarizer._total_size() == sentiment._total_size() == disk_total(summarizer)
+
+def test_evicts_least_recently_used_down_to_target(tmp_path, monkeypatch):
+    monkeypatch.setattr(inference_cache, "EVICT_BATCH", 1)
+    cache = InferenceCache("summarizer", str(tmp_path / "cache.sqlite3"), max_bytes=100, memory_items=0)
+    for key in ("a", "b", "c", "d"):
+        cache.put_many([(key, "x" * 23, 0.1)])  # JSON으로 25바이트
+    assert cache.get_many(["a"]) == {"a": "x" * 23}
+    cache.put_many([("e", "x" * 23, 0.1)])
+    keys = {row[0] for row in cache.conn.execute("SELECT key FROM inference_cache")}
+    assert keys == {"a", "d", "e"}
+    assert disk_total(cache) == cache._total_size() <= 100 * inference_cache.EVICT_TARGET_RATIO
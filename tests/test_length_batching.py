@@ -0,0 +1,43 @@
+### tests/test_length_batching.py (길이순 배치 구성과 순서 복원)
+from length_batching import length_sorted_batches, restore_order, token_lengths
+
+def test_batches_are_sorted_by_length_and_limited_in_size():
+    items = ["ccc", "a", "bbbb", "dd", "e"]
+    lengths = [len(item) for item in items]
+    batches = list(length_sorted_batches(items, lengths, batch_size=2))
+    assert [chunk for _, chunk in batches] == [["a", "e"], ["dd", "ccc"], ["bbbb"]]
+    assert [indices for indices, _ in batches] == [[1, 4], [3, 0], [2]]
+
+def test_max_tokens_packs_short_inputs_densely():
+    lengths = [10, 10, 10, 10, 100, 100]
+    batches = list(length_sorted_batches(list(range(6)), lengths, batch_size=8, max_tokens=200))
+    # 짧은 입력은 한 배치에 모두, 긴 입력은 (최대 길이 × 개수) ≤ 200이 되도록 둘씩
+    assert [chunk for _, chunk in batches] == [[0, 1, 2, 3], [4, 5]]
+    for indices, _ in batches:
+        assert max(lengths[i] for i in indices) * len(indices) <= 200
+
+def test_oversized_item_gets_its_own_batch():
+    batches = list(length_sorted_batches(["x", "y"], [500, 10], batch_size=8, max_tokens=100))
+    assert [chunk for _, chunk in batches] == [["y"], ["x"]]
+
+def test_restore_order_round_trip():
+    items = ["ccc", "a", "bbbb", "dd"]
+    batches = [(indices, [item.upper() for item in chunk])
+               for indices, chunk in length_sorted_batches(items, [len(i) for i in items], batch_size=3)]
+    assert restore_order(len(items), batches) == ["CCC", "A", "BBBB", "DD"]
+
+def test_restore_order_leaves_missing_results_empty():
+    assert restore_order(3, [([2], ["c"])]) == [None, None, "c"]
+
+def test_token_lengths_passes_truncation():
+    calls = []
+
+    def tokenizer(texts, truncation, max_length):
+        calls.append((truncation, max_length))
+        ids = [list(range(len(text))) for text in texts]
+        return {"input_ids": [i[:max_length] if truncation else i for i in ids]}
+
+    assert token_lengths(tokenizer, ["abcd", "ab"], max_length=3) == [3, 2]
+    assert token_lengths(tokenizer, ["abcd"]) == [4]
+    assert token_lengths(tokenizer, []) == []
+    assert calls == [(True, 3), (False, None)]
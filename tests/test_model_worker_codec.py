@@ -0,0 +1,37 @@
+### tests/test_model_worker_codec.py (추론 워커 IPC 바이너리 프로토콜 인코딩/디코딩)
+import io
+import pytest
+from model_worker import (OP_CLASSIFY, OP_SUMMARIZE, _read_frame, _write_frame, decode_request,
+                          decode_response, encode_error, encode_request, encode_response)
+
+def test_request_round_trip():
+    texts = ["첫 번째 기사 본문", "", "emoji 📰 and ascii"]
+    data = encode_request(OP_SUMMARIZE, 42, texts, "quality")
+    assert decode_request(data) == (OP_SUMMARIZE, 42, "quality", texts)
+
+def test_classify_request_without_option():
+    assert decode_request(encode_request(OP_CLASSIFY, 7, ["문장"])) == (OP_CLASSIFY, 7, "", ["문장"])
+
+def test_summary_response_round_trip():
+    summaries = ["요약 하나", "요약 둘"]
+    assert decode_response(OP_SUMMARIZE, encode_response(OP_SUMMARIZE, 3, summaries)) == (3, summaries)
+
+def test_sentiment_response_keeps_failures():
+    request_id, results = decode_response(OP_CLASSIFY, encode_response(OP_CLASSIFY, 9, [("긍정", 0.75), None]))
+    assert request_id == 9
+    assert results[0][0] == "긍정" and results[0][1] == pytest.approx(0.75)
+    assert results[1] is None
+
+def test_error_response_raises():
+    with pytest.raises(RuntimeError, match="모델 오류"):
+        decode_response(OP_SUMMARIZE, encode_error(5, "모델 오류"))
+
+def test_frames_round_trip_and_detect_truncation():
+    stream = io.BytesIO()
+    _write_frame(stream, b"hello")
+    _write_frame(stream, b"")
+    stream.seek(0)
+    assert _read_frame(stream) == b"hello"
+    assert _read_frame(stream) == b""
+    with pytest.raises(EOFError):
+        _read_frame(io.BytesIO(stream.getvalue()[:6]))
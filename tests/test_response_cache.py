@@ -0,0 +1,62 @@
+### tests/test_response_cache.py (응답 캐시: 키별 무효화와 계산 중 결과 저장)
+import asyncio
+from response_cache import ResponseCache
+
+def make_cache():
+    return ResponseCache(ttls={"articles": 60, "article": 60}, max_entries=16, enabled=True)
+
+def run_fills(cache, invalidate):
+    """두 키를 동시에 계산하는 도중 invalidate(cache)를 호출하고, 이후 각 키의 계산 횟수를 반환합니다."""
+    calls = {"a": 0, "b": 0}
+
+    async def scenario():
+        release = asyncio.Event()
+
+        def compute(key):
+            async def load():
+                calls[key] += 1
+                await release.wait()
+                return {"key": key, "call": calls[key]}
+            return load
+
+        fills = [asyncio.ensure_future(cache.get("articles", key, compute(key))) for key in ("a", "b")]
+        await asyncio.sleep(0)
+        invalidate(cache)
+        release.set()
+        await asyncio.gather(*fills)
+        # 저장된 항목은 다시 계산하지 않는다
+        await cache.get("articles", "a", compute("a"))
+        await cache.get("articles", "b", compute("b"))
+
+    asyncio.run(scenario())
+    return calls
+
+def test_key_invalidation_keeps_unrelated_inflight_fill():
+    calls = run_fills(make_cache(), lambda cache: cache.invalidate("articles", "a"))
+    assert calls == {"a": 2, "b": 1}
+
+def test_match_invalidation_only_drops_matching_keys():
+    calls = run_fills(make_cache(), lambda cache: cache.invalidate("articles", match=lambda key: key == "b"))
+    assert calls == {"a": 1, "b": 2}
+
+def test_endpoint_invalidation_drops_every_inflight_fill():
+    calls = run_fills(make_cache(), lambda cache: cache.invalidate("articles"))
+    assert calls == {"a": 2, "b": 2}
+
+def test_other_endpoint_invalidation_is_ignored():
+    calls = run_fills(make_cache(), lambda cache: cache.invalidate("article", 1))
+    assert calls == {"a": 1, "b": 1}
+
+def test_hit_returns_same_etag():
+    cache = make_cache()
+
+    async def scenario():
+        async def load():
+            return {"id": 1}
+        first = await cache.get("article", 1, load)
+        second = await cache.get("article", 1, load)
+        return first, second
+
+    first, second = asyncio.run(scenario())
+    assert first == second
+    assert cache.stats()["endpoints"]["article"]["hits"] == 1
@@ -0,0 +1,101 @@
+### tests/test_staged_pipeline.py (단계별 파이프라인: 순서, 누락, 오류 격리, 배치, 취소)
+import asyncio
+import pytest
+from staged_pipeline import Stage, run_pipeline
+
+def collect(items, stages, **kwargs):
+    async def scenario():
+        return [item async for item in run_pipeline(items, stages, **kwargs)]
+    return asyncio.run(scenario())
+
+def test_items_flow_through_every_stage():
+    async def add_one(x):
+        return x + 1
+
+    async def double(x):
+        return x * 2
+
+    results = collect(range(20), [Stage("add", add_one, workers=3), Stage("double", double, workers=2)])
+    assert sorted(results) == [(x + 1) * 2 for x in range(20)]
+
+def test_none_drops_item_and_errors_are_isolated():
+    async def check(x):
+        if x == 3:
+            raise ValueError("bad item")
+        return None if x % 2 else x
+
+    stage = Stage("check", check)
+    results = collect(range(6), [stage])
+    assert sorted(results) == [0, 2, 4]
+    assert stage.stats()["dropped"] == 3 and stage.stats()["errors"] == 1
+
+def test_batch_stage_receives_lists():
+    sizes = []
+
+    async def batch_double(batch):
+        sizes.append(len(batch))
+        return [x * 2 for x in batch]
+
+    results = collect(range(10), [Stage("double", batch_double, batch_size=4, batch_wait=0.5)])
+    assert sorted(results) == [x * 2 for x in range(10)]
+    assert max(sizes) <= 4 and sum(sizes) == 10
+
+def test_failed_batch_drops_whole_batch():
+    async def fail(batch):
+        raise RuntimeError("model error")
+
+    stage = Stage("fail", fail, batch_size=4)
+    assert collect(range(4), [stage]) == []
+    assert stage.errors == 4
+
+def test_backpressure_bounds_items_in_flight():
+    started = []
+    release = None
+
+    async def slow(x):
+        started.append(x)
+        await release.wait()
+        return x
+
+    async def scenario():
+        nonlocal release
+        release = asyncio.Event()
+
+        async def fetch(x):
+            return x
+
+        gen = run_pipeline(range(100), [Stage("fetch", fetch), Stage("slow", slow)], queue_size=2)
+        consumer = asyncio.ensure_future(gen.__anext__())
+        await asyncio.sleep(0.05)
+        # slow 단계가 막혀 있으면 fetch 단계도 큐 크기만큼만 앞서 나간다
+        assert len(started) == 1
+        release.set()
+        first = await consumer
+        await gen.aclose()
+        return first
+
+    assert asyncio.run(scenario()) == 0
+
+@pytest.mark.parametrize("batch_wait", [0.0, 0.001, 0.01])
+def test_consumer_stopping_early_cancels_every_stage(batch_wait):
+    # 배치를 채우는 중(_next_batch)에 취소되어도 단계 작업이 남지 않아야 asyncio.run이 끝난다
+    async def batch_identity(batch):
+        await asyncio.sleep(0)
+        return batch
+
+    async def feed_forever(x):
+        return x
+
+    async def scenario():
+        existing = asyncio.all_tasks()
+        for _ in range(20):
+            gen = run_pipeline(range(1000), [Stage("feed", feed_forever, workers=2),
+                                             Stage("batch", batch_identity, workers=2,
+                                                   batch_size=8, batch_wait=batch_wait)])
+            async for _ in gen:
+                break
+            await gen.aclose()
+            stages = asyncio.all_tasks() - existing
+            await asyncio.wait_for(asyncio.gather(*stages, return_exceptions=True), 1)
+
+    asyncio.run(asyncio.wait_for(scenario(), 10))
@@ -0,0 +1,41 @@
+### tests/test_summary_deadline.py (요약 마감 시간 대체 요약이 진행 중인 배치에 막히지 않는지 확인)
+import asyncio
+import threading
+import time
+import news_scraper
+
+SLOW_BATCH_SECONDS = 2.0
+DEADLINE = 0.2
+
+def test_fallback_returns_within_deadline_while_slow_batch_in_flight(monkeypatch):
+    started = threading.Event()
+    calls = []
+
+    def slow_batch(texts):
+        calls.append(list(texts))
+        started.set()
+        time.sleep(SLOW_BATCH_SECONDS)
+        return [f"quality:{text}" for text in texts]
+
+    quality = news_scraper.summary_brokers["quality"]
+    fallback = news_scraper.fallback_brokers[news_scraper.CHEAPER_PROFILE["quality"]]
+    monkeypatch.setattr(quality, "batch_fn", slow_batch)
+    monkeypatch.setattr(quality, "max_concurrent_batches", 1)
+    monkeypatch.setattr(fallback, "batch_fn", lambda texts: [f"balanced:{text}" for text in texts])
+
+    async def scenario():
+        # 느린 quality 배치가 실행 중인 상태에서 마감 시간이 있는 요청을 보낸다
+        in_flight = asyncio.ensure_future(news_scraper.summarize_news("첫 기사", "quality"))
+        await asyncio.to_thread(started.wait, 1)
+        begin = time.perf_counter()
+        summary = await news_scraper.summarize_news("두 번째 기사", "quality", deadline=DEADLINE)
+        elapsed = time.perf_counter() - begin
+        in_flight.cancel()
+        return summary, elapsed
+
+    summary, elapsed = asyncio.run(scenario())
+    assert summary == "balanced:두 번째 기사"
+    # 마감 시간 + 대체 요약 시간 안에 끝나고, 느린 배치가 끝나기를 기다리지 않는다
+    assert elapsed < DEADLINE + 0.5 < SLOW_BATCH_SECONDS
+    # 마감 시간을 넘긴 요청은 대기열에서 빠져 quality 배치로 실행되지 않는다
+    assert calls == [["첫 기사"]]
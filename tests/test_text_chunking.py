@@ -0,0 +1,30 @@
+### tests/test_text_chunking.py (문장 분리, 토큰 예산 청크, 본문 앞부분)
+from text_chunking import chunk_sentences, lead_text, split_sentences
+
+def test_split_sentences_on_terminators_and_closing_quotes():
+    text = '첫 문장입니다. 질문인가요? "인용문입니다." 마지막!  '
+    assert split_sentences(text) == ["첫 문장입니다.", "질문인가요?", '"인용문입니다."', "마지막!"]
+
+def test_split_sentences_keeps_decimal_numbers():
+    assert split_sentences("금리는 3.5%입니다. 끝.") == ["금리는 3.5%입니다.", "끝."]
+
+def test_chunks_respect_token_budget():
+    sentences = ["a", "b", "c", "d", "e"]
+    chunks = chunk_sentences(sentences, [3, 3, 3, 3, 3], chunk_tokens=6)
+    assert chunks == ["a b", "c d", "e"]
+
+def test_oversized_sentence_becomes_its_own_chunk():
+    chunks = chunk_sentences(["short", "very long", "tail"], [2, 50, 2], chunk_tokens=10)
+    assert chunks == ["short", "very long", "tail"]
+
+def test_max_chunks_drops_the_tail():
+    sentences = [str(i) for i in range(10)]
+    assert chunk_sentences(sentences, [5] * 10, chunk_tokens=5, max_chunks=3) == ["0", "1", "2"]
+
+def test_empty_input_has_no_chunks():
+    assert chunk_sentences([], [], chunk_tokens=10) == []
+
+def test_lead_text_stops_at_sentence_boundary():
+    text = "가나다. 라마바. 사아자."
+    assert lead_text(text, 9) == "가나다. 라마바."
+    assert lead_text("아주 긴 첫 문장", 4) == "아주 긴"
@@ -0,0 +1,33 @@
+### tests/test_url_filter.py (Bloom 필터와 저장된 기사 URL 필터)
+from url_filter import BloomFilter, KnownUrlFilter
+
+def test_bloom_filter_has_no_false_negatives():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    urls = [f"https://n.news.naver.com/article/{i}" for i in range(1000)]
+    for url in urls:
+        bloom.add(url)
+    assert all(url in bloom for url in urls)
+
+def test_bloom_filter_false_positive_rate_is_near_target():
+    bloom = BloomFilter(capacity=1000, error_rate=0.01)
+    for i in range(1000):
+        bloom.add(f"known/{i}")
+    false_positives = sum(f"unknown/{i}" in bloom for i in range(10000))
+    assert false_positives / 10000 < 0.03
+
+def test_refresh_counts_each_id_once():
+    known = KnownUrlFilter(capacity=1000)
+    known.load([(1, "a"), (2, "b")])
+    # 증분 갱신은 겹치는 구간을 다시 읽는다
+    known.load([(2, "b"), (3, "c")])
+    assert (known.count, known.last_id, known.loaded) == (3, 3, True)
+    assert known.maybe_known("c")
+
+def test_local_add_is_visible_but_counted_on_refresh():
+    known = KnownUrlFilter(capacity=1000)
+    known.load([(1, "a")])
+    known.add("b")
+    assert known.maybe_known("b")
+    assert known.count == 1
+    known.load([(2, "b")])
+    assert known.count == 2
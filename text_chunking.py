@@ -0,0 +1,36 @@
+### text_chunking.py (문장 분리 및 토큰 예산 기반 청크 분할)
+import re
+
+# 마침표/물음표/느낌표(및 닫는 따옴표/괄호) 뒤의 공백에서 문장을 나눈다
+_SENTENCE_END = re.compile(r"(?:(?<=[.!?])|(?<=[.!?][\"'”’)\]]))\s+")
+
+def split_sentences(text):
+    """본문을 문장 단위로 나눕니다 (빈 문장 제외)."""
+    return [sentence.strip() for sentence in _SENTENCE_END.split(text) if sentence and sentence.strip()]
+
+def chunk_sentences(sentences, lengths, chunk_tokens, max_chunks=None):
+    """문장 경계를 지키며 청크당 토큰 수가 chunk_tokens를 넘지 않도록 문장을 묶습니다.
+    한 문장이 chunk_tokens보다 길면 그 문장 하나가 청크가 되며(추론 시 잘림),
+    max_chunks를 넘는 뒷부분 청크는 버립니다 (기사는 앞부분에 핵심이 오므로 최악의 경우 지연을 제한)."""
+    chunks, current, size = [], [], 0
+    for sentence, length in zip(sentences, lengths):
+        if current and size + length > chunk_tokens:
+            chunks.append(" ".join(current))
+            current, size = [], 0
+            if max_chunks is not None and len(chunks) >= max_chunks:
+                return chunks
+        current.append(sentence)
+        size += length
+    if current:
+        chunks.append(" ".join(current))
+    return chunks[:max_chunks] if max_chunks is not None else chunks
+
+def lead_text(text, max_chars):
+    """본문 앞부분에서 max_chars 이내의 문장들을 반환합니다 (첫 문장이 더 길면 잘라서 사용)."""
+    lead, size = [], 0
+    for sentence in split_sentences(text):
+        if size + len(sentence) > max_chars:
+            break
+        lead.append(sentence)
+        size += len(sentence) + 1
+    return " ".join(lead) if lead else text[:max_chars]
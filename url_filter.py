@@ -0,0 +1,63 @@
+### url_filter.py (이미 저장된 기사 URL을 빠르게 거르는 Bloom 필터)
+import hashlib
+import math
+import threading
+
+# ✅ Bloom 필터 설정
+EXPECTED_URLS = 1_000_000   # 예상 URL 수
+FALSE_POSITIVE_RATE = 0.001  # 허용 오탐률 (오탐은 DB 조회로 다시 확인)
+
+class BloomFilter:
+    """비트 배열과 이중 해싱을 사용하는 Bloom 필터"""
+
+    def __init__(self, capacity=EXPECTED_URLS, error_rate=FALSE_POSITIVE_RATE):
+        self.size = max(8, int(-capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, item):
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        return ((h1 + i * h2) % self.size for i in range(self.hash_count))
+
+    def add(self, item):
+        for pos in self._positions(item):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, item):
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(item))
+
+class KnownUrlFilter:
+    """저장된 기사 URL 집합. '있음'은 DB 조회로 확인해야 하고,
+    '없음'은 마지막 refresh(db.load_known_urls) 시점까지 저장된 기사에 대해서만 확실합니다
+    (다른 프로세스 — API 서버 / 크롤러 서비스 — 가 저장한 URL은 refresh 때 반영)."""
+
+    def __init__(self, capacity=EXPECTED_URLS, error_rate=FALSE_POSITIVE_RATE):
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.loaded = False
+        self.count = 0    # 적재한 기사 수 (refresh로 읽은 id만 센다)
+        self.last_id = 0  # 지금까지 적재한 가장 큰 기사 id
+        self.lock = threading.Lock()
+
+    def load(self, rows):
+        """DB에서 읽은 (id, url) 목록으로 필터를 채웁니다. 이미 적재한 id가 다시 와도 됩니다."""
+        with self.lock:
+            last_id = self.last_id
+            for article_id, url in rows:
+                self.bloom.add(url)
+                if article_id > last_id:
+                    self.count += 1
+                    self.last_id = max(self.last_id, article_id)
+            self.loaded = True
+
+    def add(self, url):
+        """이 프로세스가 방금 저장한 URL을 바로 반영합니다 (count는 다음 refresh에서 id로 센다)."""
+        with self.lock:
+            self.bloom.add(url)
+
+    def maybe_known(self, url):
+        return url in self.bloom
+
+# ✅ 프로세스 전역 필터 (db.load_known_urls()로 적재 / 증분 갱신, 이 프로세스의 삽입 시마다 갱신)
+known_urls = KnownUrlFilter()